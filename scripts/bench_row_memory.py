@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Reports the memory a table row retains, per kind and raw storage mode, for
+rows decoded and built by WatchManager from a LIST response body shaped like
+the one the API server sends for the manager's request: full objects, partial
+object metadata, or a server-printed Table.
+
+Usage: python scripts/bench_row_memory.py [rows per kind]
+"""
+
+import asyncio
+import gc
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import orjson  # noqa: E402
+from kubernetes_asyncio.client import Configuration  # noqa: E402
+
+from KubeZen.config import WatchConfig  # noqa: E402
+from KubeZen.core.kubernetes_client import KubernetesClient  # noqa: E402
+from KubeZen.core.watch_manager import WatchManager  # noqa: E402
+from KubeZen.models.apps import DeploymentRow  # noqa: E402
+from KubeZen.models.base import RAW_STORAGE_MODES, RawStorage, UIRow  # noqa: E402
+from KubeZen.models.core import ConfigMapRow, PodRow, ServiceRow  # noqa: E402
+from KubeZen.models.crd_model_factory import CRDInfo, create_model_from_crd  # noqa: E402
+from KubeZen.models.jsonpath_accessor import compile_jsonpath  # noqa: E402
+
+
+def metadata(kind: str, i: int) -> dict[str, Any]:
+    return {
+        "name": f"{kind.lower()}-{i}",
+        "namespace": f"team-{i % 20}",
+        "uid": f"00000000-0000-0000-0000-{i:012d}",
+        "resourceVersion": str(100000 + i),
+        "creationTimestamp": "2024-05-01T10:00:00Z",
+        "labels": {"app": f"app-{i % 50}", "tier": "backend"},
+        "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{}" * 40},
+    }
+
+
+def pod(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": metadata("Pod", i),
+        "spec": {
+            "nodeName": f"node-{i % 30}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": "registry.example.com/app:1.2.3",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "env": [{"name": f"VAR_{n}", "value": str(n)} for n in range(8)],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                }
+            ],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.0.{i // 250 % 250}.{i % 250}",
+            "conditions": [
+                {"type": t, "status": "True", "lastTransitionTime": "2024-05-01T10:00:05Z"}
+                for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+            ],
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "ready": True,
+                    "restartCount": i % 3,
+                    "image": "registry.example.com/app:1.2.3",
+                    "imageID": "registry.example.com/app@sha256:" + "0" * 64,
+                    "state": {"running": {"startedAt": "2024-05-01T10:00:04Z"}},
+                }
+            ],
+        },
+    }
+
+
+def deployment(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": metadata("Deployment", i),
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{i % 50}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{i % 50}"}},
+                "spec": pod(i)["spec"],
+            },
+        },
+        "status": {
+            "replicas": 3,
+            "readyReplicas": 3,
+            "updatedReplicas": 3,
+            "availableReplicas": 3,
+        },
+    }
+
+
+def config_map(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": metadata("ConfigMap", i),
+        "data": {f"key-{n}": "value " * 20 for n in range(5)},
+    }
+
+
+def service(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": metadata("Service", i),
+        "spec": {
+            "type": "ClusterIP",
+            "clusterIP": f"10.96.{i // 250 % 250}.{i % 250}",
+            "ports": [{"name": "http", "port": 80, "targetPort": 8080, "protocol": "TCP"}],
+            "selector": {"app": f"app-{i % 50}"},
+        },
+        "status": {"loadBalancer": {}},
+    }
+
+
+def certificate(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "cert-manager.io/v1",
+        "kind": "Certificate",
+        "metadata": metadata("Certificate", i),
+        "spec": {
+            "secretName": f"cert-{i}-tls",
+            "dnsNames": [f"svc-{i}.example.com"],
+            "issuerRef": {"name": "letsencrypt", "kind": "ClusterIssuer"},
+        },
+        "status": {
+            "conditions": [
+                {
+                    "type": "Ready",
+                    "status": "True",
+                    "message": "Certificate is up to date and has not expired",
+                    "lastTransitionTime": "2024-05-01T10:00:05Z",
+                }
+            ],
+            "notAfter": "2024-08-01T10:00:00Z",
+        },
+    }
+
+
+CertificateRow = create_model_from_crd(
+    CRDInfo(
+        name="certificates.cert-manager.io",
+        uid="crd",
+        resource_version="1",
+        group="cert-manager.io",
+        kind="Certificate",
+        plural="certificates",
+        scope="Namespaced",
+        version="v1",
+        printer_columns=(
+            ("Ready", '.status.conditions[?(@.type=="Ready")].status'),
+            ("Secret", ".spec.secretName"),
+            ("Issuer", ".spec.issuerRef.name"),
+            ("Status", '.status.conditions[?(@.type=="Ready")].message'),
+            ("Age", ".metadata.creationTimestamp"),
+        ),
+    )
+)
+
+KINDS: list[tuple[type[UIRow], Callable[[int], dict[str, Any]]]] = [
+    (PodRow, pod),
+    (DeploymentRow, deployment),
+    (ConfigMapRow, config_map),
+    (ServiceRow, service),
+    (CertificateRow, certificate),
+]
+
+
+class BenchApp:
+    """The parts of the app a WatchManager reads. Signals go nowhere."""
+
+    is_attached = False
+    _pruning = False
+
+    def __init__(self, client: KubernetesClient, watch: WatchConfig) -> None:
+        self.kubernetes_client = client
+        cache_dir = Path(tempfile.gettempdir())
+        self.config = SimpleNamespace(
+            watch=watch, paths=SimpleNamespace(cache_dir=cache_dir)
+        )
+
+
+def table(model: type[UIRow], items: list[dict[str, Any]]) -> dict[str, Any]:
+    """The Table the API server prints for a custom resource LIST."""
+    crd: CRDInfo = getattr(model, "crd_info")
+    columns = [
+        (label, compile_jsonpath(path.lstrip(".")))
+        for label, path in crd.printer_columns
+    ]
+    return {
+        "kind": "Table",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": {"resourceVersion": "1"},
+        "columnDefinitions": [{"name": "Name"}]
+        + [{"name": label} for label, _ in columns],
+        "rows": [
+            {
+                "cells": [item["metadata"]["name"]]
+                + [
+                    # Date columns are printed as ages.
+                    "90d" if label == "Age" or "Time" in label else accessor(item)
+                    for label, accessor in columns
+                ],
+                "object": {
+                    "kind": "PartialObjectMetadata",
+                    "apiVersion": "meta.k8s.io/v1",
+                    "metadata": item["metadata"],
+                },
+            }
+            for item in items
+        ],
+    }
+
+
+def list_body(
+    model: type[UIRow], items: list[dict[str, Any]], watch: WatchConfig
+) -> bytes:
+    """The LIST response the API server sends for the manager's request."""
+    if model.metadata_only:
+        return orjson.dumps(
+            {
+                "kind": "PartialObjectMetadataList",
+                "apiVersion": "meta.k8s.io/v1",
+                "metadata": {"resourceVersion": "1"},
+                "items": [
+                    {
+                        "kind": "PartialObjectMetadata",
+                        "apiVersion": "meta.k8s.io/v1",
+                        "metadata": item["metadata"],
+                    }
+                    for item in items
+                ],
+            }
+        )
+    if model.server_side_columns and watch.server_side_columns:
+        return orjson.dumps(table(model, items))
+    return orjson.dumps({"metadata": {"resourceVersion": "1"}, "items": items})
+
+
+def retained_bytes(
+    client: KubernetesClient,
+    model: type[UIRow],
+    factory: Callable[[int], dict[str, Any]],
+    count: int,
+    storage: RawStorage,
+) -> int:
+    """The memory still allocated once `count` rows are built and stored."""
+    watch = WatchConfig(raw_storage=storage, snapshot_cache=False)
+    app = BenchApp(client, watch)
+    manager = WatchManager(app, model)  # type: ignore[arg-type]
+    body = list_body(model, [factory(i) for i in range(count)], watch)
+    # Resolve the item type outside of the measurement.
+    manager._build_rows([])
+    gc.collect()
+    tracemalloc.start()
+    items, *_ = manager._get_list_metadata(orjson.loads(body))
+    rows = manager._build_rows(items)
+    # Touch every column, as painting the table does.
+    for row in rows:
+        row.column_fingerprint()
+    del items
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return retained
+
+
+async def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    # Never connects: the managers only decode, and the client names the
+    # generated models they decode into.
+    client = KubernetesClient(Configuration(host="http://localhost"))
+    print(f"bytes per row, {count} rows per kind")
+    print(f"{'kind':<14}" + "".join(f"{mode:>10}" for mode in RAW_STORAGE_MODES))
+    for model, factory in KINDS:
+        sizes = [
+            retained_bytes(client, model, factory, count, mode) / count
+            for mode in RAW_STORAGE_MODES
+        ]
+        print(f"{model.kind:<14}" + "".join(f"{size:>10.0f}" for size in sizes))
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,7 +8,7 @@ import pkgutil
 import asyncio
 from itertools import chain
 from logging.handlers import QueueHandler, QueueListener
-from typing import Any, ClassVar, cast
+from typing import ClassVar, cast
 import re
 import aiohttp
 from aiohttp import (
@@ -18,6 +18,7 @@ from aiohttp import (
     ClientPayloadError,
 )
 import urllib3
+from kubernetes_asyncio.client.exceptions import ApiException
 from rich.text import Text
 from textual import on, work
 from textual.app import App, ComposeResult
@@ -28,14 +29,18 @@ from textual.widgets import (
 )
 from textual.reactive import reactive
 from textual.widgets.tree import TreeNode
-from KubeZen.core.watch_manager import WatchManager
+from KubeZen.core.watch_manager import WatchManager, WatchEventBatch
 from KubeZen.config import AppConfig
 from KubeZen.core.kubernetes_client import KubernetesClient
 from KubeZen.core.model_discovery import discover_standard_models, discover_crd_models
+from KubeZen.core.discovery_cache import DiscoveryCache
+from KubeZen.core.crd_watcher import CRDModelChanges, CRDWatcher
 from KubeZen.screens.confirmation_screen import ConfirmationScreen, ButtonInfo
 from KubeZen.screens.manifest_editor_screen import ManifestEditorScreen
+from KubeZen.screens.watch_metrics_screen import WatchMetricsScreen
 from KubeZen.containers.resource_tab_pane import ResourceTabPane
 from KubeZen.core.age_tracker import AgeTracker
+from KubeZen.core.informer_registry import InformerRegistry
 from KubeZen.containers.sidebar import Sidebar
 from KubeZen.containers.resource_list import ResourceList
 from KubeZen.actions.base_action import BaseAction
@@ -129,6 +134,8 @@ class KubeZen(App[None]):
 
     _connected_to_context: bool = False
     _namespaces_watch_manager: WatchManager | None = None
+    # Whether the app holds a reference on the cluster-wide Namespaces scope.
+    _namespaces_acquired: bool = False
     _namespaces_subscriptions: list = []
     _actions: dict[str, list[BaseAction]] = {}
 
@@ -140,6 +147,7 @@ class KubeZen(App[None]):
         ("ctrl+d", "toggle_dark", "Toggle Dark Mode"),
         ("ctrl+n", "create_resource", "Create Resource"),
         ("ctrl+w", "close_current_tab", "Close Tab"),
+        ("f12", "show_watch_metrics", "Watch Metrics"),
         ("ctrl+q", "request_quit", "Quit App"),
     ]
 
@@ -152,6 +160,8 @@ class KubeZen(App[None]):
         self._kubernetes_client: KubernetesClient | None = None
         self._tmux_manager: TmuxManager | None = None
         self._age_tracker: AgeTracker | None = None
+        self._informer_registry: InformerRegistry | None = None
+        self._crd_watcher: CRDWatcher | None = None
 
         if os.environ.get("KUBEZEN_DEBUG") == "1":
             self.sub_title = "KubeZen (Debug Mode)"
@@ -188,6 +198,13 @@ class KubeZen(App[None]):
             self._age_tracker = AgeTracker.get_instance(self)
         return self._age_tracker
 
+    @property
+    def informer_registry(self) -> InformerRegistry:
+        """Returns the shared informer registry."""
+        if not self._informer_registry:
+            self._informer_registry = InformerRegistry.get_instance(self)
+        return self._informer_registry
+
     @property
     def tmux_manager(self) -> TmuxManager:
         """Returns the tmux manager."""
@@ -216,8 +233,16 @@ class KubeZen(App[None]):
         try:
             node.set_label(Text.assemble(original_label, (" ●", "yellow")))
 
-            async for key, model in discover_crd_models(self.kubernetes_client):
+            discovery = self.config.discovery
+            cache = (
+                DiscoveryCache(self.config.paths.cache_dir) if discovery.cache else None
+            )
+            crd_models = []
+            async for key, model in discover_crd_models(
+                self.kubernetes_client, discovery, cache
+            ):
                 self._resource_models[key] = model
+                crd_models.append(model)
 
             connected_label = Text.assemble(original_label, (" ●", "green"))
             node.set_label(connected_label)
@@ -225,6 +250,10 @@ class KubeZen(App[None]):
             await self.query_one(Sidebar).update_tree()
             self._connected_to_context = True
 
+            self._crd_watcher = CRDWatcher(self, crd_models, cache)
+            self._crd_watcher.models_changed.subscribe(self, self.on_crd_models_changed)
+            self._crd_watcher.start()
+
         except asyncio.TimeoutError:
             node.set_label(Text.assemble(original_label, (" ●", "red")))
             self.notify(
@@ -233,6 +262,58 @@ class KubeZen(App[None]):
                 timeout=10,
             )
 
+    async def on_crd_models_changed(self, changes: CRDModelChanges) -> None:
+        """
+        A signal handler for CRDs that were installed, changed or removed. Only
+        the affected sidebar leaves and open tabs are updated.
+        """
+        sidebar = self.query_one(Sidebar)
+        tabbed_content = self.query_one(TabbedContent)
+        panes = {
+            pane.model_class: pane for pane in tabbed_content.query(ResourceTabPane)
+        }
+
+        for key, model in changes.removed.items():
+            self._resource_models.pop(key, None)
+            sidebar.remove_model(model)
+            if (pane := panes.get(model)) and pane.id:
+                await tabbed_content.remove_pane(pane.id)
+            await self.informer_registry.retire_model(model)
+
+        for key, (old_model, new_model) in changes.replaced.items():
+            self._resource_models[key] = new_model
+            sidebar.replace_model(old_model, new_model)
+            if pane := panes.get(old_model):
+                await self._replace_tab(pane, new_model)
+            await self.informer_registry.retire_model(old_model)
+
+        for key, model in changes.added.items():
+            self._resource_models[key] = model
+            sidebar.add_custom_resource(key, model)
+
+    async def _replace_tab(
+        self, pane: ResourceTabPane, model_class: type[UIRow]
+    ) -> None:
+        """Reopens a tab in place for a new model of the same kind."""
+        tabbed_content = self.query_one(TabbedContent)
+        tab_id = cast(str, pane.id)
+        was_active = tabbed_content.active == tab_id
+        panes = list(tabbed_content.query(ResourceTabPane))
+        following = next(iter(panes[panes.index(pane) + 1:]), None)
+
+        await tabbed_content.remove_pane(tab_id)
+        await tabbed_content.add_pane(
+            ResourceTabPane(
+                title=model_class.display_name,
+                model_class=model_class,
+                available_namespaces=self.available_namespaces,
+                id=tab_id,
+            ),
+            before=following,
+        )
+        if was_active:
+            tabbed_content.active = tab_id
+
     def subscribe_and_track(self, signal, callback):
         signal.subscribe(self, callback)
         self._namespaces_subscriptions.append((signal, callback))
@@ -259,29 +340,38 @@ class KubeZen(App[None]):
             model_class: type[UIRow] = node.data["model_class"]
 
             if not self._namespaces_watch_manager and model_class.namespaced:
-                self._namespaces_watch_manager = WatchManager(
-                    self, self.resource_models["namespaces"]
+                namespaces_model = self.resource_models["namespaces"]
+                self._namespaces_watch_manager = (
+                    self.informer_registry.get_watch_manager(namespaces_model)
                 )
 
                 self.subscribe_and_track(
-                    self._namespaces_watch_manager.signals.resource_added,
-                    self.on_namespace_added,
-                )
-                self.subscribe_and_track(
-                    self._namespaces_watch_manager.signals.resource_deleted,
-                    self.on_namespace_deleted,
+                    self._namespaces_watch_manager.signals.resource_batch,
+                    self.on_namespaces_changed,
                 )
 
-                resources, resource_version = (
-                    await self._namespaces_watch_manager.get_initial_list("all")
-                )
+                try:
+                    await self.informer_registry.acquire(namespaces_model, {"all"})
+                    self._namespaces_acquired = True
+                except (
+                    ApiException,
+                    aiohttp.ClientError,
+                    asyncio.TimeoutError,
+                    OSError,
+                    ValueError,
+                ) as e:
+                    log.error("Failed to load namespaces: %s", e, exc_info=True)
+                    self.notify(
+                        f"Failed to load namespaces: {e}",
+                        title="Error",
+                        severity="error",
+                    )
 
                 self.available_namespaces = {
-                    ns.name for ns in resources if ns and ns.name is not None
+                    ns.name
+                    for ns in self._namespaces_watch_manager.rows()
+                    if ns.name is not None
                 }
-                await self._namespaces_watch_manager.create_watch_task(
-                    "all", resource_version
-                )
 
             tab_id = self._normalize_label(node.data["label"])
 
@@ -316,7 +406,15 @@ class KubeZen(App[None]):
                         break
 
             if not namespaced_lists_remain:
-                await self._namespaces_watch_manager.stop()
+                # A failed acquire took no reference, and the registry's
+                # counts are shared with other holders such as a Namespaces tab.
+                if self._namespaces_acquired:
+                    await self.informer_registry.release(
+                        self.resource_models["namespaces"], {"all"}
+                    )
+                    self._namespaces_acquired = False
+                for signal, _ in self._namespaces_subscriptions:
+                    signal.unsubscribe(self)
                 self._namespaces_subscriptions.clear()
                 self._namespaces_watch_manager = None
                 self.available_namespaces.clear()
@@ -340,39 +438,62 @@ class KubeZen(App[None]):
         node_to_select = find_node_by_label(sidebar.root, tabbed_content.active)
         sidebar.select_node(node_to_select)
 
-    def on_namespace_added(self, data: dict[str, Any]) -> None:
-        """A signal handler for when a namespace is added."""
-        resource = data["resource"]
-        self.available_namespaces = self.available_namespaces | {resource.name}
-
-    def on_namespace_deleted(self, data: dict[str, Any]) -> None:
-        """A signal handler for when a namespace is deleted."""
-        resource = data["resource"]
-        self.available_namespaces = {
-            ns for ns in self.available_namespaces if ns != resource.name
-        }
-
-    def watch_available_namespaces(self, available_namespaces: set[str]) -> None:
-        log.debug("The list of available namespaces changed: %s", available_namespaces)
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        """Lets the watches of the tab on screen reconnect before the others."""
+        if isinstance(event.pane, ResourceTabPane):
+            self.informer_registry.set_visible({event.pane.model_class})
+
+    def on_namespaces_changed(self, batch: WatchEventBatch) -> None:
+        """
+        A signal handler for a batch of namespace watch events. Only the actual
+        additions and removals are passed on to the open tabs.
+        """
+        added, deleted = batch.names_changed()
+        added -= self.available_namespaces
+        deleted &= self.available_namespaces
+        if not added and not deleted:
+            return
+        log.debug("Namespaces added: %s, deleted: %s", added, deleted)
+        self.available_namespaces = (self.available_namespaces - deleted) | added
 
         tab_container = self.query_one(TabbedContent)
-
         for pane in tab_container.query(ResourceTabPane):
             if pane.model_class.namespaced:
-                pane.available_namespaces = available_namespaces
+                pane.update_available_namespaces(added, deleted)
 
     @on(ResourceList.RowSelected)
-    def on_row_selected(self, event: ResourceList.RowSelected) -> None:
+    async def on_row_selected(self, event: ResourceList.RowSelected) -> None:
         """Handle row selection events."""
         if event.row_key.value is None:
             return
 
         resource_list = cast(ResourceList, event.data_table)
-        row_info = resource_list.resources[event.row_key.value]
+        row_info = resource_list.latest_row(event.row_key.value)
 
         if not row_info:
             return
 
+        # Actions inspect the row's complete object, which the row may have
+        # evicted or never held. They get a row of their own built from it, so
+        # the store's rows stay as lean as raw_storage asks.
+        try:
+            full_object = await self.kubernetes_client.read_full_object(row_info)
+        except ApiException as e:
+            self.notify(
+                f"Failed to load {row_info.kind} {row_info.name}: {e.reason}",
+                severity="error",
+            )
+            return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.notify(
+                f"Failed to load {row_info.kind} {row_info.name}: {e}",
+                severity="error",
+            )
+            return
+        row_info = type(row_info)(raw=full_object)
+
         all_actions = set(
             chain(self._actions.get(row_info.plural, []), self._actions.get("*", []))
         )
@@ -424,6 +545,10 @@ class KubeZen(App[None]):
         """Action to open the new resource editor."""
         self.push_screen(ManifestEditorScreen())
 
+    def action_show_watch_metrics(self) -> None:
+        """Action to open the watch pipeline debug screen."""
+        self.push_screen(WatchMetricsScreen())
+
     @work
     async def action_request_quit(self) -> None:
         """Action to display the quit dialog."""
@@ -441,6 +566,9 @@ class KubeZen(App[None]):
     async def on_unmount(self) -> None:
         """Called when the app is unmounted."""
         self._app_logger.stop()
+        if self._crd_watcher:
+            await self._crd_watcher.stop()
+        await self.informer_registry.stop()
         await self.kubernetes_client.close()
 
 
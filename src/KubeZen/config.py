@@ -4,7 +4,7 @@ import sys
 import shutil
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import ClassVar, Dict, TypedDict, Required
+from typing import ClassVar, Dict, Literal, TypedDict, Required
 import tempfile
 import logging
 
@@ -80,6 +80,8 @@ class AppPaths:
 
         os.environ["KUBE_EDITOR"] = f"vim -u {self.resources.get("vimrc")}"
 
+        self.cache_dir: Path = self._determine_cache_dir()
+
         self.tmux_socket_path: Path = self.temp_dir / "tmux.sock"
         self.tmux_config_path: Path | None = self.resources.get("tmux_config")
 
@@ -90,6 +92,13 @@ class AppPaths:
             return Path(sys._MEIPASS)
         return Path(__file__).resolve().parent.parent.parent
 
+    @staticmethod
+    def _determine_cache_dir() -> Path:
+        """Determines the persistent cache directory, honouring XDG_CACHE_HOME."""
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        base = Path(cache_home) if cache_home else Path.home() / ".cache"
+        return base / "kubezen"
+
     def _resolve_paths(
         self, required_resources: Dict[str, Resource]
     ) -> Dict[str, Path | None]:
@@ -148,6 +157,124 @@ class AppPaths:
             logging.info("Cleaned up temporary directory: %s", self.temp_dir)
 
 
+@dataclass(frozen=True)
+class WatchConfig:
+    """Tuning knobs for the watch pipeline."""
+
+    # Watch events are coalesced per UID and published once per window,
+    # or as soon as this many events have been received.
+    batch_window_seconds: float = 0.075
+    batch_max_events: int = 500
+
+    # Selecting at least this many namespaces replaces the per-namespace
+    # watches with one cluster-wide watch that is filtered client-side.
+    cluster_wide_namespace_threshold: int = 10
+    # The estimated overhead of one extra watch connection and its relist
+    # cycles, expressed as a number of objects transferred.
+    watch_connection_cost: int = 200
+
+    # Failed watches retry after a random delay of up to base * 2^attempt
+    # seconds (full jitter), capped at the maximum.
+    reconnect_backoff_base_seconds: float = 0.5
+    reconnect_backoff_max_seconds: float = 30.0
+    # How many watches may reconnect or relist at the same time, app-wide.
+    # Watches of the visible tab are let through first.
+    max_concurrent_reconnects: int = 3
+
+    # A watch that receives nothing, not even a bookmark, for this long is
+    # considered dead and reconnected.
+    watch_idle_timeout_seconds: float = 65.0
+
+    # Fetch the initial state of built-in kinds as a stream of watch events
+    # (sendInitialEvents) instead of a LIST, on servers that support it.
+    watch_list: bool = True
+
+    # Initial LISTs are fetched in pages of this size and painted as they arrive.
+    list_page_size: int = 500
+    # Newly selected namespaces are listed concurrently, this many at a time.
+    max_concurrent_lists: int = 4
+    # How fresh initial LISTs must be. "consistent" always reads through to
+    # etcd, "cached" serves every LIST from the API server's watch cache
+    # (resourceVersion=0), and "balanced" uses the cache only for scopes
+    # last seen holding more than one page of objects.
+    list_freshness: Literal["consistent", "balanced", "cached"] = "balanced"
+    # LIST requests may take this long plus a share per expected object.
+    list_timeout_seconds: float = 15.0
+    list_timeout_per_1000_objects: float = 5.0
+    # Establishing a connection must not take longer than this. Watches have
+    # no overall limit; their idle timeout detects dead streams.
+    connect_timeout_seconds: float = 10.0
+
+    # Persist informer stores so reopened tabs paint instantly and resume
+    # their watches from the saved resourceVersion.
+    snapshot_cache: bool = True
+
+    # Decode LIST and WATCH bodies with orjson into lightweight attribute views
+    # instead of building the client's generated models.
+    raw_decode: bool = True
+
+    # Let the API server compute the printer columns of custom resources
+    # instead of evaluating their JSONPaths client-side for every object.
+    server_side_columns: bool = True
+
+    # How rows keep the object they were built from. "object" keeps it
+    # decoded, "bytes" keeps its JSON and decodes it when an action reads it,
+    # and "evict" drops it and fetches it again when a row is selected.
+    # Evicting leaves nothing to snapshot, so it turns snapshots off.
+    raw_storage: Literal["object", "bytes", "evict"] = "bytes"
+
+    # Drop MODIFIED events that change none of the columns a table displays.
+    suppress_noop_events: bool = True
+
+    # Run watches, decoding and row construction on a background thread with
+    # its own event loop. Only finished batches are handed to the UI loop.
+    # Its requests count against the same transport rate limit as the UI's.
+    informer_thread: bool = False
+
+
+@dataclass(frozen=True)
+class DiscoveryConfig:
+    """Tuning knobs for discovering custom resource kinds."""
+
+    # Keep discovered CRDs on disk per context. Within the TTL, connecting
+    # uses them without asking the API server; after it, a metadata-only
+    # LIST tells which CRDs changed and only those are downloaded again.
+    cache: bool = True
+    cache_ttl_seconds: float = 600.0
+    # Changed CRDs are downloaded one by one, concurrently, or all CRDs in
+    # a paged LIST when more than this many changed or none are cached.
+    max_individual_reads: int = 10
+    # CRDs per page of that LIST.
+    page_size: int = 100
+    # Each request of discovery must finish within this long. A stale cache
+    # is used if one doesn't.
+    timeout_seconds: float = 5.0
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Sizing of the Kubernetes client's connection pools."""
+
+    # Connections for ordinary request/response calls, kept alive between
+    # calls so they skip the TCP and TLS handshakes.
+    request_pool_size: int = 20
+    # Connections for watches and followed logs, each of which holds one
+    # open for as long as it streams.
+    stream_pool_size: int = 100
+    # Idle connections are closed after this long.
+    keepalive_timeout_seconds: float = 30.0
+    # Resolved API server addresses are reused for this long.
+    dns_cache_ttl_seconds: int = 300
+
+    # Requests are rate limited like client-go does: bursts of up to `burst`
+    # requests, then `qps` per second. Throttled requests are sent in
+    # priority order: user actions, then the visible tab, then the rest.
+    # The limit is for the whole app, informer thread included.
+    # A qps of zero disables the limit.
+    qps: float = 50.0
+    burst: int = 100
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """Manages application-wide configuration settings."""
@@ -157,6 +284,9 @@ class AppConfig:
     session_name: str = "KubeZen"
 
     paths: AppPaths = field(default_factory=AppPaths)
+    watch: WatchConfig = field(default_factory=WatchConfig)
+    transport: TransportConfig = field(default_factory=TransportConfig)
+    discovery: DiscoveryConfig = field(default_factory=DiscoveryConfig)
 
     @classmethod
     def get_instance(cls) -> AppConfig:
@@ -5,10 +5,12 @@ from typing import (
     cast,
     Literal,
     Callable,
+    TYPE_CHECKING,
 )
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 import re
+import time
 from functools import total_ordering, lru_cache
 
 from textual import on, work
@@ -19,18 +21,25 @@ from textual.reactive import reactive
 from textual.signal import Signal
 import asyncio
 
-from KubeZen.core.watch_manager import WatchManager
+from KubeZen.core.watch_manager import WatchManager, WatchEventBatch, ListProgress
 
 from rich.text import Text
 
 
 from KubeZen.models.base import UIRow
 from kubernetes_asyncio.client.exceptions import ApiException
-from aiohttp.client_exceptions import ClientConnectorError
+from aiohttp import ClientError
 
+if TYPE_CHECKING:
+    from KubeZen.app import KubeZen
+    from KubeZen.core.informer_registry import InformerRegistry
 
 log = logging.getLogger(__name__)
 
+# What loading a scope can fail with: API errors, connection and payload
+# errors, timeouts, and bodies or events that don't decode.
+_LOAD_ERRORS = (ApiException, ClientError, asyncio.TimeoutError, OSError, ValueError)
+
 
 @total_ordering
 @dataclass
@@ -217,7 +226,13 @@ class ResourceList(DataTable):
         super().__init__(cursor_type="row", cursor_foreground_priority="renderable")
         self._model_class = model_class
         self.subscriptions: dict[str, Signal] = {}
-        self._watch_manager: WatchManager = WatchManager(self.app, model_class)
+        self._watch_manager: WatchManager = (
+            self._informer_registry.get_watch_manager(model_class)
+        )
+        self._acquired_namespaces: set[str] = set()
+        self._namespaces_lock = asyncio.Lock()
+        # Progress of the scopes whose initial LIST is still streaming in.
+        self._list_progress: dict[str, ListProgress] = {}
         self._columns = Columns(self._model_class)
         self._add_columns()
         self.tooltip: str | None = None
@@ -398,18 +413,10 @@ class ResourceList(DataTable):
     async def on_mount(self) -> None:
         """Called when the widget is mounted."""
         # Populate the subscriptions' dictionary for this instance
-        self.subscriptions["resource_added"] = (
-            self._watch_manager.signals.resource_added
-        )
-        self.subscriptions["resource_deleted"] = (
-            self._watch_manager.signals.resource_deleted
-        )
-        self.subscriptions["resource_modified"] = (
-            self._watch_manager.signals.resource_modified
-        )
-        self.subscriptions["resource_full_reset"] = (
-            self._watch_manager.signals.resource_full_reset
+        self.subscriptions["resource_batch"] = (
+            self._watch_manager.signals.resource_batch
         )
+        self.subscriptions["list_progress"] = self._watch_manager.signals.list_progress
 
         # if age_signal := self.app.age_tracker.get_signal(self._model_class.plural):
         self.subscriptions["age_tracker"] = self.app.age_tracker.get_signal(
@@ -417,14 +424,8 @@ class ResourceList(DataTable):
         )
 
         # Subscribe handlers directly
-        self.subscriptions["resource_added"].subscribe(self, self.on_resource_added)
-        self.subscriptions["resource_deleted"].subscribe(self, self.on_resource_deleted)
-        self.subscriptions["resource_modified"].subscribe(
-            self, self.on_resource_modified
-        )
-        # self.subscriptions["resource_full_reset"].subscribe(
-        # self, self.on_resource_full_reset
-        # )
+        self.subscriptions["resource_batch"].subscribe(self, self.on_resource_batch)
+        self.subscriptions["list_progress"].subscribe(self, self.on_list_progress)
 
         self.subscriptions["age_tracker"].subscribe(self, self.on_age_update)
 
@@ -435,9 +436,19 @@ class ResourceList(DataTable):
                 name="Pod Metrics",
             )
 
+    @property
+    def _informer_registry(self) -> InformerRegistry:
+        """The app's informer registry, typed for the KubeZen app."""
+        return cast("KubeZen", self.app).informer_registry
+
     async def on_unmount(self) -> None:
         """Cleanup subscriptions when the widget is unmounted."""
-        await self._watch_manager.stop()
+        # Cancelled loads roll back their own references in the registry.
+        self.workers.cancel_group(self, "namespace-watches")
+        await self._informer_registry.release(
+            self._model_class, self._acquired_namespaces
+        )
+        self._acquired_namespaces.clear()
         for subscription in self.subscriptions.values():
             subscription.unsubscribe(self)
         self.subscriptions.clear()
@@ -477,28 +488,71 @@ class ResourceList(DataTable):
             return True
         return False
 
-    def on_resource_added(self, data: dict[str, Any]) -> None:
-        """Handles a resource added event."""
-        resource = data["resource"]
-        if self._resource_should_be_in_view(resource):
-            self.resources[resource.uid] = resource
-        if self._resource_matches_filters(resource):
-            self.visible_uids = self.visible_uids | {resource.uid}
-
-    def on_resource_deleted(self, data: dict[str, Any]) -> None:
-        """Handles a resource deleted event."""
-        resource = data["resource"]
-        uid = resource.uid
-        del self.resources[uid]
-        if uid in self.visible_uids:
-            self.visible_uids = self.visible_uids - {uid}
+    def on_resource_batch(self, batch: WatchEventBatch) -> None:
+        """Applies a coalesced batch of watch events in a single UI update."""
+        uids_to_show: set[str] = set()
+        uids_to_hide: set[str] = set()
+
+        with self.app.batch_update():
+            for event_type, resource in batch:
+                uid = resource.uid
+                if event_type == "DELETED":
+                    if self.resources.pop(uid, None) is not None:
+                        uids_to_hide.add(uid)
+                        uids_to_show.discard(uid)
+                elif event_type == "ADDED":
+                    if not self._resource_should_be_in_view(resource):
+                        continue
+                    self.resources[uid] = resource
+                    if self._resource_matches_filters(resource):
+                        uids_to_show.add(uid)
+                        uids_to_hide.discard(uid)
+                else:
+                    self._on_resource_modified(resource, batch.columns_changed(uid))
+
+            uids_to_show -= self.visible_uids
+            uids_to_hide &= self.visible_uids
+            if uids_to_show or uids_to_hide:
+                self.visible_uids = (self.visible_uids - uids_to_hide) | uids_to_show
+
+        if batch.received_at is not None:
+            self._watch_manager.metrics.render_latency_seconds.observe(
+                time.monotonic() - batch.received_at
+            )
 
-    def on_resource_modified(self, data: dict[str, Any]) -> None:
-        """Handles inexpensive, immediate UI updates for already-visible rows."""
+    def on_list_progress(self, progress: ListProgress) -> None:
+        """
+        Shows how far the initial LISTs have got while pages are streaming in,
+        summed over the scopes that are loading concurrently.
+        """
+        if progress.done:
+            self._list_progress.pop(progress.namespace, None)
+        else:
+            self._list_progress[progress.namespace] = progress
+
+        if not self._list_progress:
+            self.border_subtitle = None
+            return
+        loaded = sum(p.loaded for p in self._list_progress.values())
+        if all(p.expected for p in self._list_progress.values()):
+            expected = sum(p.expected or 0 for p in self._list_progress.values())
+            self.border_subtitle = f"loading {loaded} / ~{expected}"
+        else:
+            self.border_subtitle = f"loading {loaded}"
 
-        resource = data["resource"]
+    def _on_resource_modified(
+        self, resource: UIRow, changed_columns: frozenset[str] | None = None
+    ) -> None:
+        """
+        Handles inexpensive, immediate UI updates for already-visible rows. Only
+        the changed columns are redrawn when they are known.
+        """
         uid = resource.uid
 
+        # The shared watch also reports namespaces this list doesn't show.
+        if uid not in self.resources:
+            return
+
         # Update the primary list first
         self.resources[uid] = resource
 
@@ -506,11 +560,15 @@ class ResourceList(DataTable):
         if uid not in self.visible_uids:
             return
 
+        column_keys = self._columns.column_keys
+        if changed_columns is not None:
+            column_keys = [key for key in column_keys if key in changed_columns]
+
         self._get_column_width.cache_clear()
         with self.app.batch_update():
             try:
                 # --- Update standard, non-age-tracked cells ---
-                for key in self._columns.column_keys:
+                for key in column_keys:
                     if key in self._columns.time_tracked_fields or key in (
                         "cpu",
                         "memory",
@@ -524,6 +582,8 @@ class ResourceList(DataTable):
                     # We should not re-process it on modification events.
                     if field_key == "age":
                         continue
+                    if changed_columns is not None and field_key not in changed_columns:
+                        continue
 
                     self.app.age_tracker.remove_field(
                         uid, field_key, self._model_class.plural
@@ -671,59 +731,69 @@ class ResourceList(DataTable):
         if self._model_class.__name__ == "PodRow":
             self.call_after_refresh(self._update_metrics)
 
-    async def watch_selected_namespaces(self, selected_namespaces: set[str]) -> None:
+    def watch_selected_namespaces(self, selected_namespaces: set[str]) -> None:
         """Watch the selected namespaces."""
         log.info(f"Watching selected namespaces: {selected_namespaces}")
+        # Loading runs in a worker so streamed pages can be painted meanwhile.
+        self._sync_namespace_watches(set(selected_namespaces))
+
+    @work(group="namespace-watches")
+    async def _sync_namespace_watches(self, selected_namespaces: set[str]) -> None:
+        """Acquires and releases shared watches to match the namespace selection."""
+        async with self._namespaces_lock:
+            await self._apply_namespace_selection(selected_namespaces)
 
-        # If 'all' is selected, that's the only watch we need.
+    async def _apply_namespace_selection(self, selected_namespaces: set[str]) -> None:
+        # If 'all' is selected, that's the only scope we need.
         if "all" in selected_namespaces:
             effective_selection = {"all"}
         else:
-            effective_selection = selected_namespaces
-
-        # If nothing is selected, ensure resources are cleared and stop all watches.
-        if not selected_namespaces:
-            self.resources = {}
-            await self._watch_manager.stop()
-            return
+            effective_selection = set(selected_namespaces)
 
-        current_watching = self._watch_manager.watching
-        namespaces_to_load = effective_selection
+        to_acquire = effective_selection - self._acquired_namespaces
+        to_release = self._acquired_namespaces - effective_selection
 
-        to_stop = current_watching - effective_selection
-        for ns in to_stop:
-            await self._watch_manager.stop_namespace_watch(ns)
-
-        to_start = effective_selection - current_watching
-
-        if not to_start and not to_stop:
+        if not to_acquire and not to_release:
             return
 
-        # This will hold all resources from all namespaces being loaded.
-        all_resources_dict: dict[str, UIRow] = {}
+        registry = self._informer_registry
 
-        for namespace in namespaces_to_load:
-            create_task = namespace in to_start
+        # Acquire before releasing so overlapping scopes keep their watches.
+        if to_acquire:
             try:
-                (
-                    resource_generator,
-                    resource_version,
-                ) = await self._watch_manager.get_initial_list(namespace)
-            except (ApiException, ClientConnectorError, asyncio.TimeoutError) as e:
-                log.error(f"Error getting initial list for {namespace}: {e}")
+                await registry.acquire(self._model_class, to_acquire)
+                self._acquired_namespaces |= to_acquire
+            except _LOAD_ERRORS as e:
+                log.error(
+                    f"Error getting initial list for {to_acquire}: {e}", exc_info=True
+                )
                 self.app.notify(
-                    f"Failed to get resources for '{namespace}'. Please check your connection and permissions.",
+                    f"Failed to get resources for '{', '.join(sorted(to_acquire))}'. Please check your connection and permissions.",
                     title="Error",
                     severity="error",
                     timeout=10,
                 )
-                break
 
-            # Consume the generator to populate the dictionary.
-            for res in resource_generator:
-                all_resources_dict[res.uid] = res
-
-            if create_task:
-                await self._watch_manager.create_watch_task(namespace, resource_version)
-
-        self.resources = all_resources_dict
+        if to_release:
+            self._acquired_namespaces -= to_release
+            try:
+                await registry.release(self._model_class, to_release)
+            except _LOAD_ERRORS as e:
+                log.error(f"Error re-scoping watches after releasing {to_release}: {e}")
+
+        self.resources = self._resources_in_view()
+
+    def latest_row(self, uid: str) -> UIRow | None:
+        """
+        Returns the newest known row for a UID. The shared store can be ahead of
+        the table when updates that change no displayed column were dropped.
+        """
+        return self._watch_manager.get_row(uid) or self.resources.get(uid)
+
+    def _resources_in_view(self) -> dict[str, UIRow]:
+        """Selects the shared store's rows that belong in this list."""
+        return {
+            resource.uid: resource
+            for resource in self._watch_manager.rows()
+            if self._resource_should_be_in_view(resource)
+        }
@@ -9,6 +9,7 @@ from textual.css.query import NoMatches
 from textual.events import Click
 from textual.reactive import reactive
 from textual.widgets import Input, Label, SelectionList, TabPane
+from textual.widgets.option_list import OptionDoesNotExist
 from textual.widgets.selection_list import Selection
 from textual.widget import Widget
 
@@ -71,7 +72,6 @@ class ResourceTabPane(TabPane):
     }
     """
 
-    available_namespaces: reactive[set[str]] = reactive(set(), init=False)
     show_namespaces_list = reactive(False, init=False)
     _is_updating_selection: bool = False
 
@@ -87,7 +87,7 @@ class ResourceTabPane(TabPane):
             id=id,
         )
         self.model_class = model_class
-        self.available_namespaces = available_namespaces
+        self.available_namespaces = set(available_namespaces)
 
     def compose(self) -> ComposeResult:
         """Compose the resource tab pane layout."""
@@ -99,7 +99,8 @@ class ResourceTabPane(TabPane):
         if self.model_class.namespaced:
             yield Label()
             selections = [Selection("All Namespaces", "all", True)] + [
-                Selection(ns, ns, True) for ns in sorted(self.available_namespaces)
+                Selection(ns, ns, True, id=ns)
+                for ns in sorted(self.available_namespaces)
             ]
             yield SelectionList[str](*selections, classes="namespace-select -hidden")
 
@@ -240,32 +241,46 @@ class ResourceTabPane(TabPane):
         finally:
             self._is_updating_selection = False
 
-    def watch_available_namespaces(self, available_namespaces: set[str]) -> None:
-        if not self.model_class.namespaced:
+    def update_available_namespaces(self, added: set[str], removed: set[str]) -> None:
+        """
+        Patches the namespace options in place. The selection only changes when
+        "All Namespaces" is selected or a selected namespace was removed, so
+        namespaces the user hasn't picked can come and go without a relist.
+        """
+        added = added - self.available_namespaces
+        removed = removed & self.available_namespaces
+        self.available_namespaces = (self.available_namespaces - removed) | added
+        if not self.model_class.namespaced or not (added or removed):
             return
         try:
             namespace_select = self.query_one(SelectionList)
             resource_list = self.query_one(ResourceList)
-
-            namespace_select.clear_options()
-            namespace_select.add_options(
-                [Selection("All Namespaces", "all")]
-                + [Selection(name, name) for name in sorted(available_namespaces)]
-            )
-            current_selection = cast(set[str], resource_list.selected_namespaces)
-
-            if "all" in current_selection:
-                resource_list.selected_namespaces = {"all"} | available_namespaces
-                namespace_select.select_all()
-            else:
-                resource_list.selected_namespaces = {
-                    ns for ns in current_selection if ns in available_namespaces
-                }
-                for ns in resource_list.selected_namespaces:
-                    namespace_select.select(ns)
         except NoMatches:
             log.debug("No matches exception")
-            pass
+            return
+
+        current_selection = cast(set[str], resource_list.selected_namespaces)
+        all_selected = "all" in current_selection
+        for name in removed:
+            try:
+                namespace_select.remove_option(name)
+            except OptionDoesNotExist:
+                pass
+        namespace_select.add_options(
+            Selection(name, name, all_selected, id=name) for name in sorted(added)
+        )
+
+        if all_selected:
+            new_selection = (current_selection - removed) | added
+        else:
+            new_selection = current_selection - removed
+        if new_selection == current_selection:
+            return
+        resource_list.selected_namespaces = new_selection
+        if not all_selected:
+            self.update_namespace_label(
+                self._prepare_display_label(resource_list, sorted(new_selection))
+            )
 
     def update_namespace_label(self, selected_for_display: list[str]) -> None:
         if not selected_for_display:
@@ -3,6 +3,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
 
 
 from ..models.base import CATEGORIES, Category
@@ -200,3 +201,88 @@ class Sidebar(Tree):
                                 "label": model_to_key[model_cls],
                             },
                         )
+
+    def _find_model_node(self, model_cls: type[UIRow]) -> TreeNode | None:
+        """Returns the leaf of a model, if the tree shows it."""
+        nodes = list(self.root.children)
+        while nodes:
+            node = nodes.pop()
+            data = node.data or {}
+            if data.get("type") == "resource" and data.get("model_class") is model_cls:
+                return node
+            nodes.extend(node.children)
+        return None
+
+    def add_custom_resource(self, key: str, model_cls: type[UIRow]) -> None:
+        """Adds the leaf of a new CRD model under its API group, in sorted position."""
+        crd_category_node = next(
+            (
+                node
+                for node in self.root.children[0].children
+                if (node.data or {}).get("name") == "custom_resources"
+            ),
+            None,
+        )
+        if crd_category_node is None:
+            log.warning("No custom resources node to add %s to.", key)
+            return
+
+        api_group = model_cls.api_info.group
+        group_nodes = [
+            (node.data["name"], node)
+            for node in crd_category_node.children
+            if node.data is not None and node.data.get("type") == "group"
+        ]
+        api_group_node = next(
+            (node for name, node in group_nodes if name == api_group), None
+        )
+        if api_group_node is None:
+            following = next(
+                (node for name, node in group_nodes if name > api_group), None
+            )
+            api_group_node = crd_category_node.add(
+                api_group,
+                data={"type": "group", "name": api_group},
+                before=following,
+            )
+
+        following = None
+        for node in api_group_node.children:
+            if node.data is None:
+                continue
+            if node.data["model_class"].display_name > model_cls.display_name:
+                following = node
+                break
+        api_group_node.add_leaf(
+            model_cls.display_name,
+            data={
+                "type": "resource",
+                "model_class": model_cls,
+                "plural": model_cls.plural.lower(),
+                "label": key,
+            },
+            before=following,
+        )
+
+    def replace_model(self, old: type[UIRow], new: type[UIRow]) -> None:
+        """Points the leaf of a model at its replacement."""
+        node = self._find_model_node(old)
+        if node is None or node.data is None:
+            return
+        node.data = {**node.data, "model_class": new}
+        node.set_label(new.display_name)
+
+    def remove_model(self, model_cls: type[UIRow]) -> None:
+        """Removes the leaf of a model, and its API group node if that empties it."""
+        node = self._find_model_node(model_cls)
+        if node is None:
+            return
+        parent = node.parent
+        node.remove()
+        if parent is None or parent.children or parent.data is None:
+            return
+        if (
+            parent.data.get("type") == "group"
+            and parent.data.get("name") != "custom_resources"
+        ):
+            parent.remove()
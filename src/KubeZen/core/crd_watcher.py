@@ -0,0 +1,251 @@
+"""Keep the custom resource models in step with the cluster's CRDs."""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Type
+import asyncio
+import logging
+import threading
+
+import aiohttp
+from kubernetes_asyncio.client.exceptions import ApiException
+from textual.signal import Signal
+
+from ..models.crd_model_factory import CRDInfo, create_model_from_crd
+from ..models.customresourcedefinitions import CustomResourceDefinitionRow
+from .json_api import WatchIdleTimeout, WatchStream
+from .list_strategy import watch_timeout
+from .model_discovery import crd_model_key, fetch_crds
+from .rate_limiter import request_priority
+from .reconnect_governor import Backoff
+from .watch_manager import WATCH_TIMEOUT_SECONDS
+
+if TYPE_CHECKING:
+    from ..app import KubeZen
+    from ..models.base import UIRow
+    from .discovery_cache import DiscoveryCache
+
+log = logging.getLogger(__name__)
+
+# How long CRD changes are collected before the discovery cache is rewritten.
+CACHE_SAVE_DELAY_SECONDS = 2.0
+
+
+@dataclass
+class CRDModelChanges:
+    """Models to add, replace or retire, keyed by their resource model key."""
+
+    added: dict[str, Type[UIRow]] = field(default_factory=dict)
+    # The old and the new model of CRDs whose columns or version changed.
+    replaced: dict[str, tuple[Type[UIRow], Type[UIRow]]] = field(default_factory=dict)
+    removed: dict[str, Type[UIRow]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.replaced or self.removed)
+
+
+class CRDWatcher:
+    """
+    Watches CRDs after discovery and publishes the models to add, replace or
+    retire as CRDs are installed, changed or removed. Only CRDs whose model
+    would differ cause a new model; status updates are ignored.
+
+    On start, and whenever the watch falls too far behind, the CRDs are
+    reconciled with a metadata-only LIST so that changes made while the
+    discovery cache was fresh are picked up too.
+    """
+
+    def __init__(
+        self,
+        app: KubeZen,
+        models: Iterable[Type[UIRow]],
+        cache: DiscoveryCache | None = None,
+    ) -> None:
+        self._app = app
+        self._crd_client: Any = getattr(
+            app.kubernetes_client, CustomResourceDefinitionRow.api_info.client_name
+        )
+        self._discovery_config = app.config.discovery
+        self._watch_config = app.config.watch
+        self._cache = cache
+        self._models: dict[str, Type[UIRow]] = {}
+        self._crds: dict[str, CRDInfo] = {}
+        for model in models:
+            crd: CRDInfo = getattr(model, "crd_info")
+            self._models[crd.name] = model
+            self._crds[crd.name] = crd
+        self._context: str | None = None
+        self._task: asyncio.Task | None = None
+        self._save_task: asyncio.Task | None = None
+        # A cancelled save keeps writing in its thread; this keeps writes apart.
+        self._save_lock = threading.Lock()
+        self.models_changed: Signal[CRDModelChanges] = Signal(app, "crd_models_changed")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="CRD watch")
+            self._task.add_done_callback(_log_task_failure)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        if self._save_task is not None:
+            # Write what's pending now rather than after the delay.
+            self._save_task.cancel()
+            await asyncio.gather(self._save_task, return_exceptions=True)
+            self._save_task = None
+            await self._save()
+
+    async def _run(self) -> None:
+        self._context = await self._app.kubernetes_client.get_current_context()
+        backoff = Backoff(
+            self._watch_config.reconnect_backoff_base_seconds,
+            self._watch_config.reconnect_backoff_max_seconds,
+        )
+        resource_version: str | None = None
+        while True:
+            try:
+                with request_priority("background"):
+                    if resource_version is None:
+                        crds, resource_version = await fetch_crds(
+                            self._crd_client, self._crds, self._discovery_config
+                        )
+                        await self._apply(crds, complete=True)
+                    resource_version = await self._watch(resource_version, backoff)
+            except ApiException as e:
+                if e.status == 410:
+                    log.info("CRD watch is too old. Reconciling CRDs.")
+                    resource_version = None
+                    continue
+                log.warning("CRD watch failed (HTTP %s): %s", e.status, e.reason)
+                await asyncio.sleep(backoff.next_delay())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                log.warning("CRD watch failed: %s", e)
+                await asyncio.sleep(backoff.next_delay())
+            except Exception as e:
+                # Anything else would end CRD tracking for the session.
+                log.exception("Unexpected error in CRD watch: %s", e)
+                await asyncio.sleep(backoff.next_delay())
+
+    async def _watch(self, resource_version: str, backoff: Backoff) -> str:
+        """Applies CRD watch events until the stream ends. Returns where it stopped."""
+        stream = WatchStream(
+            self._crd_client.list_custom_resource_definition,
+            idle_timeout=self._watch_config.watch_idle_timeout_seconds,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            _request_timeout=watch_timeout(self._watch_config),
+        )
+        async with stream:
+            try:
+                async for event in stream:
+                    backoff.reset()
+                    event_type = event["type"]
+                    if event_type == "BOOKMARK":
+                        continue
+                    try:
+                        crd = CRDInfo.from_crd(event["object"])
+                    except (KeyError, IndexError, TypeError) as e:
+                        log.warning(
+                            "Skipping malformed CRD %s event: %s", event_type, e
+                        )
+                        continue
+                    if event_type == "DELETED":
+                        await self._apply({}, removed={crd.name})
+                    else:
+                        await self._apply({crd.name: crd})
+            except WatchIdleTimeout:
+                log.debug("CRD watch went idle. Reconnecting.")
+        return stream.resource_version or resource_version
+
+    async def _apply(
+        self,
+        crds: dict[str, CRDInfo],
+        *,
+        complete: bool = False,
+        removed: Iterable[str] = (),
+    ) -> None:
+        """
+        Records new CRD states and publishes the resulting model changes.
+        With complete=True, `crds` is the full set and missing CRDs are removed.
+        """
+        removed = set(removed)
+        if complete:
+            removed |= self._crds.keys() - crds.keys()
+
+        unchanged = {
+            name: crd
+            for name, crd in crds.items()
+            if name in self._crds and self._crds[name].same_model(crd)
+        }
+        to_build = [crd for name, crd in crds.items() if name not in unchanged]
+        self._crds.update(unchanged)
+        built = await asyncio.to_thread(_create_models, to_build) if to_build else []
+
+        changes = CRDModelChanges()
+        for crd, model in built:
+            # Only CRDs with a model are recorded. One whose model failed to
+            # build keeps its last good state, so its next event tries again.
+            self._crds[crd.name] = crd
+            old_model = self._models.get(crd.name)
+            self._models[crd.name] = model
+            if old_model is None:
+                changes.added[crd_model_key(model)] = model
+            else:
+                changes.replaced[crd_model_key(model)] = (old_model, model)
+        for name in removed:
+            self._crds.pop(name, None)
+            if name in self._models:
+                model = self._models.pop(name)
+                changes.removed[crd_model_key(model)] = model
+
+        if self._cache and (crds or removed) and self._save_task is None:
+            self._save_task = asyncio.create_task(
+                self._save_later(), name="CRD cache save"
+            )
+            self._save_task.add_done_callback(_log_task_failure)
+        if changes:
+            log.info(
+                "CRDs changed: %d added, %d replaced, %d removed",
+                len(changes.added),
+                len(changes.replaced),
+                len(changes.removed),
+            )
+            self.models_changed.publish(changes)
+
+    async def _save_later(self) -> None:
+        """Saves the CRDs once changes have settled, so bursts write the cache once."""
+        await asyncio.sleep(CACHE_SAVE_DELAY_SECONDS)
+        self._save_task = None
+        await self._save()
+
+    async def _save(self) -> None:
+        """Writes the current CRDs to the discovery cache off the event loop."""
+        if self._cache is None or self._context is None:
+            return
+        await asyncio.to_thread(self._write_cache, self._context, dict(self._crds))
+
+    def _write_cache(self, context: str, crds: dict[str, CRDInfo]) -> None:
+        assert self._cache is not None
+        with self._save_lock:
+            self._cache.save(context, crds)
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Logs the exception a task ended with, as nothing awaits these tasks."""
+    if not task.cancelled() and (e := task.exception()) is not None:
+        log.error("%s task failed", task.get_name(), exc_info=e)
+
+
+def _create_models(crds: list[CRDInfo]) -> list[tuple[CRDInfo, Type[UIRow]]]:
+    built = []
+    for crd in crds:
+        try:
+            built.append((crd, create_model_from_crd(crd)))
+        except (TypeError, ValueError) as e:
+            log.exception("Model creation error from CRD %s: %s", crd.name, e)
+    return built
@@ -0,0 +1,155 @@
+"""
+Persist discovered CRDs per context so connecting needs no discovery round
+trips, and the code generated for their models so it isn't generated again.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+import logging
+import marshal
+import os
+import re
+import sys
+import time
+
+import orjson
+
+from ..models.crd_model_factory import ColumnSpec, CRDInfo
+
+log = logging.getLogger(__name__)
+
+# Bump when the file layout, CRDInfo or the generated model code changes, so
+# old caches are ignored.
+CACHE_VERSION = 5
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+# The resource version, columns and compiled __init__ and accessors of a CRD's model.
+GeneratedModel = tuple[str, tuple[ColumnSpec, ...], CodeType]
+
+
+@dataclass(frozen=True)
+class CachedDiscovery:
+    """The CRDs of one context, keyed by CRD name, and when they were fetched."""
+
+    fetched_at: float
+    crds: dict[str, CRDInfo]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class DiscoveryCache:
+    """Reads and writes the discovered CRDs of every context and their generated models."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._root = cache_dir / "discovery"
+
+    def _path(self, context: str, suffix: str = ".json") -> Path:
+        return self._root / f"{_UNSAFE_CHARS.sub('_', context) or '_'}{suffix}"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """
+        Replaces a cache file atomically. The directory and the file are only
+        accessible by the user, as the model cache holds code that gets run.
+        """
+        self._root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Caches created by older versions used the default permissions.
+        self._root.chmod(0o700)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    def save(self, context: str, crds: dict[str, CRDInfo]) -> None:
+        """Writes a context's CRDs atomically. Failures are logged, never raised."""
+        path = self._path(context)
+        try:
+            data = orjson.dumps(
+                {
+                    "version": CACHE_VERSION,
+                    "fetchedAt": time.time(),
+                    "crds": [crd.to_dict() for crd in crds.values()],
+                }
+            )
+            self._write(path, data)
+            log.debug("Saved %d CRDs to discovery cache %s", len(crds), path)
+        except (OSError, TypeError) as e:
+            log.warning("Failed to save discovery cache %s: %s", path, e)
+
+    def load(self, context: str) -> CachedDiscovery | None:
+        """Reads a context's CRDs, returning None if missing or unreadable."""
+        path = self._path(context)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.warning("Failed to read discovery cache %s: %s", path, e)
+            return None
+
+        try:
+            cached = orjson.loads(data)
+            if cached["version"] != CACHE_VERSION:
+                raise ValueError("outdated cache version")
+            crds = (CRDInfo.from_dict(crd) for crd in cached["crds"])
+            return CachedDiscovery(
+                fetched_at=cached["fetchedAt"], crds={crd.name: crd for crd in crds}
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            log.warning("Discarding unreadable discovery cache %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _models_path(self, context: str) -> Path:
+        # Compiled code is only valid for the interpreter version that made it.
+        return self._path(context, f".{sys.implementation.cache_tag}.models")
+
+    def save_models(self, context: str, models: dict[str, GeneratedModel]) -> None:
+        """
+        Writes the generated models of a context's CRDs, keyed by CRD UID.
+        Failures are logged, never raised.
+        """
+        path = self._models_path(context)
+        try:
+            data = marshal.dumps((CACHE_VERSION, models))
+            self._write(path, data)
+            log.debug("Saved %d generated models to %s", len(models), path)
+        except (OSError, ValueError) as e:
+            log.warning("Failed to save model cache %s: %s", path, e)
+
+    def load_models(self, context: str) -> dict[str, GeneratedModel]:
+        """Reads the generated models of a context, or {} if missing or unreadable."""
+        path = self._models_path(context)
+        try:
+            with path.open("rb") as file:
+                if not _is_private(os.fstat(file.fileno())):
+                    # Someone else could have written the code it holds.
+                    log.warning("Ignoring model cache %s not private to the user", path)
+                    return {}
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            log.warning("Failed to read model cache %s: %s", path, e)
+            return {}
+
+        try:
+            version, models = marshal.loads(data)
+            if version != CACHE_VERSION:
+                raise ValueError("outdated cache version")
+            return dict(models)
+        except (EOFError, ValueError, TypeError) as e:
+            log.warning("Discarding unreadable model cache %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return {}
+
+
+def _is_private(stat: os.stat_result) -> bool:
+    """Whether a file is owned by the user and nobody else can write to it."""
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
@@ -0,0 +1,213 @@
+"""Share watches and their in-memory stores between every consumer of a kind."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, ClassVar, Coroutine, Iterable, TypeVar
+import asyncio
+import logging
+
+from .informer_thread import InformerThread
+from .reconnect_governor import ReconnectGovernor
+from .watch_manager import WatchManager
+
+if TYPE_CHECKING:
+    from ..app import KubeZen
+    from .kubernetes_client import KubernetesClient
+    from ..models.base import UIRow
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class InformerRegistry:
+    """
+    A reference-counted registry of informers keyed by model class and namespace
+    scope. Every model class gets exactly one WatchManager holding the store, and
+    a (kind, namespace) pair is listed and watched only while someone holds it.
+    """
+
+    _instance: ClassVar[InformerRegistry | None] = None
+
+    def __init__(self, app: "KubeZen") -> None:
+        self._app = app
+        self._watch_managers: dict[type[UIRow], WatchManager] = {}
+        self._refcounts: dict[tuple[type[UIRow], str], int] = {}
+        self._rescope_tasks: set[asyncio.Task] = set()
+        self._informer_thread: InformerThread | None = None
+        self._governor = ReconnectGovernor(app.config.watch.max_concurrent_reconnects)
+
+    @classmethod
+    def get_instance(cls, app: "KubeZen") -> InformerRegistry:
+        """Returns the singleton instance of the InformerRegistry."""
+        if cls._instance is None:
+            cls._instance = InformerRegistry(app)
+            log.info("InformerRegistry singleton initialized.")
+        return cls._instance
+
+    def _get_informer_thread(self) -> InformerThread | None:
+        """Returns the informer thread, starting it on first use if it is enabled."""
+        if self._informer_thread is None and self._app.config.watch.informer_thread:
+            ui_client = self._app.kubernetes_client
+            informer_thread = InformerThread(
+                ui_client.configuration,
+                ui_client.transport,
+                # Watches take their tokens from the UI client's limiter, so the
+                # two clients share one budget and user actions still go first.
+                ui_client.rate_limiter,
+            )
+            # Only a started thread is kept, so a failed start is tried again.
+            informer_thread.start()
+            self._informer_thread = informer_thread
+        return self._informer_thread
+
+    def get_watch_manager(self, model_class: type[UIRow]) -> WatchManager:
+        """Returns the shared WatchManager for a model class, creating it if needed."""
+        if model_class not in self._watch_managers:
+            if informer_thread := self._get_informer_thread():
+                watch_manager = WatchManager(
+                    self._app,
+                    model_class,
+                    api_client=informer_thread.kubernetes_client,
+                    ui_loop=asyncio.get_running_loop(),
+                    governor=self._governor,
+                )
+            else:
+                watch_manager = WatchManager(
+                    self._app, model_class, governor=self._governor
+                )
+            self._watch_managers[model_class] = watch_manager
+        return self._watch_managers[model_class]
+
+    def set_visible(self, model_classes: Iterable[type[UIRow]]) -> None:
+        """Lets the watches of the kinds on screen reconnect before the others."""
+        self._governor.set_visible(model_classes)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns a snapshot of every WatchManager's metrics, keyed by resource
+        name like kubectl's plural.group, so kinds of different groups don't
+        collide.
+        """
+        return {
+            (
+                f"{model_class.plural}.{model_class.api_info.group}"
+                if model_class.api_info.group
+                else model_class.plural
+            ): watch_manager.metrics.snapshot()
+            for model_class, watch_manager in list(self._watch_managers.items())
+        }
+
+    def _clients(self) -> dict[str, KubernetesClient]:
+        """The UI client and, if it runs, the informer thread's client, by name."""
+        clients = {"ui": self._app.kubernetes_client}
+        if self._informer_thread is not None:
+            clients["informers"] = self._informer_thread.kubernetes_client
+        return clients
+
+    def transport_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns all clients' connection pool metrics, by "<client>/<pool>"."""
+        return {
+            f"{name}/{pool}": metrics
+            for name, kubernetes_client in self._clients().items()
+            for pool, metrics in kubernetes_client.transport_metrics().items()
+        }
+
+    def rate_limit_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the rate limiter metrics, by priority. All clients share it."""
+        return self._app.kubernetes_client.rate_limit_metrics()
+
+    async def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a WatchManager coroutine on the loop the managers live on."""
+        if self._informer_thread is None:
+            return await coroutine
+        return await self._informer_thread.run(coroutine)
+
+    def held_namespaces(self, model_class: type[UIRow]) -> set[str]:
+        """Returns the namespace scopes that currently have at least one holder."""
+        return {
+            namespace
+            for (held_class, namespace), count in self._refcounts.items()
+            if held_class is model_class and count > 0
+        }
+
+    async def acquire(
+        self, model_class: type[UIRow], namespaces: Iterable[str]
+    ) -> WatchManager:
+        """
+        Takes a reference on each namespace scope and waits until all of them are
+        listed and watched. Scopes that are already being watched cost nothing.
+        """
+        namespaces = set(namespaces)
+        for namespace in namespaces:
+            key = (model_class, namespace)
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+
+        watch_manager = self.get_watch_manager(model_class)
+        try:
+            await self._run(
+                watch_manager.set_scopes(self.held_namespaces(model_class))
+            )
+        except BaseException:
+            # Also covers cancellation, so the rollback can't be awaited here.
+            self._drop_references(model_class, namespaces)
+            self._schedule_rescope(model_class)
+            raise
+        return watch_manager
+
+    def _schedule_rescope(self, model_class: type[UIRow]) -> None:
+        """Reconciles a model's watches in the background, logging any failure."""
+
+        async def rescope() -> None:
+            try:
+                await self._run(
+                    self.get_watch_manager(model_class).set_scopes(
+                        self.held_namespaces(model_class)
+                    )
+                )
+            except Exception as e:
+                log.error("Failed to roll back watches for %s: %s", model_class.plural, e)
+
+        task = asyncio.create_task(rescope())
+        self._rescope_tasks.add(task)
+        task.add_done_callback(self._rescope_tasks.discard)
+
+    async def release(
+        self, model_class: type[UIRow], namespaces: Iterable[str]
+    ) -> None:
+        """Drops a reference on each namespace scope, stopping unheld watches."""
+        namespaces = set(namespaces)
+        if not namespaces:
+            return
+        self._drop_references(model_class, namespaces)
+        if watch_manager := self._watch_managers.get(model_class):
+            await self._run(
+                watch_manager.set_scopes(self.held_namespaces(model_class))
+            )
+
+    def _drop_references(self, model_class: type[UIRow], namespaces: set[str]) -> None:
+        for namespace in namespaces:
+            key = (model_class, namespace)
+            count = self._refcounts.get(key, 0) - 1
+            if count > 0:
+                self._refcounts[key] = count
+            else:
+                self._refcounts.pop(key, None)
+
+    async def retire_model(self, model_class: type[UIRow]) -> None:
+        """
+        Stops and forgets the watches and store of a model that was replaced or
+        removed, such as the model of a changed or deleted CRD.
+        """
+        for key in [key for key in self._refcounts if key[0] is model_class]:
+            del self._refcounts[key]
+        if (watch_manager := self._watch_managers.pop(model_class, None)) is not None:
+            await self._run(watch_manager.stop())
+
+    async def stop(self) -> None:
+        """Stops every watch regardless of holders."""
+        for watch_manager in self._watch_managers.values():
+            await self._run(watch_manager.stop())
+        self._refcounts.clear()
+        if self._informer_thread is not None:
+            await self._informer_thread.stop()
+            self._informer_thread = None
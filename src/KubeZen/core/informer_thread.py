@@ -0,0 +1,112 @@
+"""Run the informers on a background thread with its own asyncio event loop."""
+
+from __future__ import annotations
+from typing import Any, Coroutine, TypeVar
+import asyncio
+import logging
+import threading
+
+from kubernetes_asyncio import client
+
+from ..config import TransportConfig
+from .kubernetes_client import KubernetesClient
+from .rate_limiter import RateLimiter
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class InformerThread:
+    """
+    A daemon thread running an event loop dedicated to watch streaming, JSON
+    decoding and row construction, so none of it competes with rendering and
+    input on the UI loop. It owns its own KubernetesClient, as an aiohttp
+    session can only be used from the loop it was created on, but that client
+    takes its tokens from `rate_limiter` so both loops share one budget.
+    """
+
+    def __init__(
+        self,
+        configuration: client.Configuration,
+        transport: TransportConfig,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self._configuration = configuration
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        # Why the client couldn't be built, for start() to raise.
+        self._startup_error: BaseException | None = None
+        self._kubernetes_client: KubernetesClient | None = None
+
+    @property
+    def kubernetes_client(self) -> KubernetesClient:
+        """The API client bound to the informer loop."""
+        assert self._kubernetes_client is not None, "InformerThread is not started"
+        return self._kubernetes_client
+
+    def start(self) -> None:
+        """
+        Starts the thread and blocks until its loop and client are ready.
+        Raises what building the client failed with, after the thread exited.
+        """
+        if self._thread is not None:
+            return
+        thread = threading.Thread(
+            target=self._run, name="kubezen-informers", daemon=True
+        )
+        thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            thread.join()
+            raise self._startup_error
+        self._thread = thread
+        log.info("Informer thread started.")
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._create_client())
+        except BaseException as e:
+            # No loop to run without a client; start() raises this instead.
+            self._startup_error = e
+            loop.close()
+            self._ready.set()
+            return
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            log.info("Informer thread stopped.")
+
+    async def _create_client(self) -> None:
+        # Deliberately not the singleton: that one belongs to the UI loop.
+        self._kubernetes_client = KubernetesClient(
+            self._configuration, self._transport, self._rate_limiter
+        )
+
+    async def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Runs a coroutine on the informer loop and waits for its result from the
+        calling loop. Cancelling the caller cancels the coroutine as well.
+        """
+        assert self._loop is not None, "InformerThread is not started"
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def stop(self) -> None:
+        """Closes the client, stops the loop and waits for the thread to exit."""
+        if self._thread is None or self._loop is None:
+            return
+        if self._kubernetes_client is not None:
+            await self.run(self._kubernetes_client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
@@ -0,0 +1,216 @@
+"""
+Call list and watch endpoints with _preload_content=False and decode the bytes
+with orjson, skipping the generated client's attribute-by-attribute model
+deserialization.
+"""
+
+from __future__ import annotations
+from typing import Any, AsyncIterator, Callable
+import asyncio
+import logging
+import pydoc
+import re
+import time
+
+import orjson
+from aiohttp import ClientResponse, StreamReader
+from kubernetes_asyncio.client.exceptions import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
+
+log = logging.getLogger(__name__)
+
+_LIST_RETURN_TYPE = re.compile(r"^:rtype: (\w+)List$", re.MULTILINE)
+_SEND_INITIAL_EVENTS_PARAM = re.compile(r"^:param send_initial_events:", re.MULTILINE)
+
+# Marks the bookmark that ends the initial events of a streaming list.
+INITIAL_EVENTS_END_ANNOTATION = "k8s.io/initial-events-end"
+
+
+def list_item_type(list_call: Callable) -> str | None:
+    """
+    Returns the model name of the items a generated list method returns, e.g.
+    "CoreV1Event" for list_namespaced_event, or None for untyped custom objects.
+    """
+    match = _LIST_RETURN_TYPE.search(pydoc.getdoc(list_call))
+    return match.group(1) if match else None
+
+
+def accepts_send_initial_events(list_call: Callable) -> bool:
+    """
+    Whether a generated list method can request a streaming list. The
+    CustomObjectsApi methods don't know the parameter and would reject it.
+    """
+    return bool(_SEND_INITIAL_EVENTS_PARAM.search(pydoc.getdoc(list_call)))
+
+
+def is_initial_events_end(event: dict[str, Any]) -> bool:
+    """Whether a watch event is the bookmark that ends a streaming list's initial events."""
+    if event["type"] != "BOOKMARK":
+        return False
+    obj = event["object"]
+    if obj.get("kind") == "Table" and (rows := obj.get("rows")):
+        obj = rows[-1].get("object") or {}
+    annotations = (obj.get("metadata") or {}).get("annotations") or {}
+    return annotations.get(INITIAL_EVENTS_END_ANNOTATION) == "true"
+
+
+async def _raise_for_status(response: ClientResponse) -> None:
+    if 200 <= response.status <= 299:
+        return
+    try:
+        data = await response.read()
+    finally:
+        response.release()
+    raise ApiException(http_resp=RESTResponse(response, data))
+
+
+async def fetch_bytes(call: Callable, **kwargs: Any) -> bytes:
+    """Performs a request and returns its undecoded body."""
+    response = await call(**kwargs, _preload_content=False)
+    await _raise_for_status(response)
+    try:
+        body: bytes = await response.read()
+    finally:
+        response.release()
+    return body
+
+
+async def fetch_json(call: Callable, **kwargs: Any) -> Any:
+    """Performs a request and returns its decoded JSON body."""
+    return orjson.loads(await fetch_bytes(call, **kwargs))
+
+
+class WatchIdleTimeout(asyncio.TimeoutError):
+    """Raised by a WatchStream that received nothing for its idle timeout."""
+
+
+class WatchStream:
+    """
+    A watch connection yielding events as {"type": ..., "object": dict}. The
+    resource version of the last event (bookmarks included) is kept so the
+    caller can resume from it.
+
+    With an idle timeout, a single timer per connection checks when data last
+    arrived and fails the stream with WatchIdleTimeout once it has been silent
+    for that long, so reading an event costs no timeout bookkeeping.
+    """
+
+    def __init__(
+        self,
+        list_call: Callable,
+        *,
+        idle_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._list_call = list_call
+        self._kwargs = kwargs
+        self._idle_timeout = idle_timeout
+        self._response: ClientResponse | None = None
+        self._lines: AsyncIterator[bytes] | None = None
+        self._last_activity = 0.0
+        self._watchdog: asyncio.TimerHandle | None = None
+        self.resource_version: str | None = None
+
+    async def _iter_lines(self, content: StreamReader) -> AsyncIterator[bytes]:
+        """
+        Splits a response body into lines. Unlike StreamReader.readline this has
+        no line length limit, so multi-megabyte objects don't break the watch.
+        """
+        buffer = bytearray()
+        async for chunk in content.iter_any():
+            self._last_activity = time.monotonic()
+            start = len(buffer)
+            buffer += chunk
+            while (end := buffer.find(b"\n", start)) != -1:
+                yield bytes(buffer[:end])
+                del buffer[: end + 1]
+                start = 0
+        if buffer:
+            yield bytes(buffer)
+
+    def _check_idle(self) -> None:
+        """Fails an idle stream, or re-arms for when it would become idle."""
+        self._watchdog = None
+        if self._response is None or self._idle_timeout is None:
+            return
+        idle = time.monotonic() - self._last_activity
+        if idle < self._idle_timeout:
+            self._watchdog = asyncio.get_running_loop().call_later(
+                self._idle_timeout - idle, self._check_idle
+            )
+            return
+        # Wakes up the pending read, which then raises.
+        self._response.content.set_exception(
+            WatchIdleTimeout(f"No data received for {idle:.0f}s")
+        )
+
+    async def connect(self) -> None:
+        """
+        Opens the connection, which entering the stream does if this wasn't
+        called beforehand. Raises ApiException if the server refuses the watch.
+        """
+        if self._response is not None:
+            return
+        response = await self._list_call(
+            **self._kwargs, watch=True, _preload_content=False
+        )
+        await _raise_for_status(response)
+        self._response = response
+        self._lines = self._iter_lines(response.content)
+        if self._idle_timeout is not None:
+            self._last_activity = time.monotonic()
+            self._watchdog = asyncio.get_running_loop().call_later(
+                self._idle_timeout, self._check_idle
+            )
+
+    async def __aenter__(self) -> WatchStream:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the connection. Safe to call more than once."""
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
+        if self._response is not None:
+            # The body was not read to the end, so the connection can't be reused.
+            self._response.close()
+            self._response = None
+
+    def __aiter__(self) -> WatchStream:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if self._lines is None:
+            raise RuntimeError("WatchStream must be entered before iterating")
+        while True:
+            line = await self._lines.__anext__()
+            if line.strip():
+                break
+
+        event: dict[str, Any] = orjson.loads(line)
+        if "type" not in event or "object" not in event:
+            if "code" in event:
+                raise ApiException(
+                    status=event["code"],
+                    reason=f"{event.get('reason')}: {event.get('message')}",
+                )
+            raise ValueError(f"Malformed watch event: {line[:200]!r}")
+
+        obj = event["object"]
+        if event["type"] == "ERROR":
+            raise ApiException(
+                status=obj.get("code"),
+                reason=f"{obj.get('reason')}: {obj.get('message')}",
+            )
+
+        metadata = obj.get("metadata") or {}
+        if obj.get("kind") == "Table" and (rows := obj.get("rows")):
+            # Server-printed rows carry the object's version on the row.
+            metadata = (rows[-1].get("object") or {}).get("metadata") or metadata
+        if resource_version := metadata.get("resourceVersion"):
+            self.resource_version = resource_version
+        return event
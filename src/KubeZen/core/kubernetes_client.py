@@ -20,30 +20,90 @@ from kubernetes_asyncio.config.config_exception import ConfigException
 from kubernetes_asyncio.client.exceptions import ApiException
 from kubernetes_asyncio.client.api_client import ApiClient
 
+from KubeZen.config import AppConfig, TransportConfig
+from KubeZen.core.rate_limiter import RateLimiter, request_priority
+from KubeZen.core.transport import PooledRESTClient
 from KubeZen.models.base import ALL_APIS, UIRow
 
 log = logging.getLogger(__name__)
 
 R = TypeVar("R", bound=UIRow)
 
+# The generated API methods always overwrite the Accept header, so callers that
+# need another representation pass it in `_headers` under this name instead.
+ACCEPT_OVERRIDE_HEADER = "X-KubeZen-Accept"
+
 
 class KubernetesClient(ApiClient):
     _instance: ClassVar[KubernetesClient | None] = None
+    # The generated client's until __init__ swaps in a PooledRESTClient.
+    rest_client: Any
 
     @classmethod
     async def get_instance(cls) -> KubernetesClient:
         if cls._instance is None:
             await config.load_kube_config()
             configuration = client.Configuration.get_default_copy()
-            configuration.client_side_timeout = 10
             configuration.json_dumps = orjson.dumps
             configuration.json_loads = orjson.loads
-            cls._instance = KubernetesClient(configuration)
+            cls._instance = KubernetesClient(
+                configuration, AppConfig.get_instance().transport
+            )
         return cls._instance
 
-    def __init__(self, configuration: client.Configuration) -> None:
+    def __init__(
+        self,
+        configuration: client.Configuration,
+        transport: TransportConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         super().__init__(configuration)
+        # Swap the generated single pool for tuned, separate request and stream
+        # pools. The default session hasn't connected yet, so detaching it
+        # leaves nothing open.
+        self.rest_client.pool_manager.detach()
+        self.transport = transport or TransportConfig()
+        self.rest_client = PooledRESTClient(
+            configuration, self.transport, rate_limiter
+        )
         self._api_cache: dict[str, Any] = {}
+        # Whether the API server accepts streaming lists (sendInitialEvents).
+        # None until the first attempt tells.
+        self.watch_list_supported: bool | None = None
+
+    def transport_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the connection pools' occupancy and wait times, keyed by pool."""
+        return cast(PooledRESTClient, self.rest_client).metrics()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return cast(PooledRESTClient, self.rest_client).rate_limiter
+
+    def rate_limit_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the rate limiter's queue depths and delays, keyed by priority."""
+        return self.rate_limiter.snapshot()
+
+    def call_api(
+        self,
+        resource_path: str,
+        method: str,
+        path_params: Any = None,
+        query_params: Any = None,
+        header_params: dict[str, Any] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if header_params and ACCEPT_OVERRIDE_HEADER in header_params:
+            header_params["Accept"] = header_params.pop(ACCEPT_OVERRIDE_HEADER)
+        return super().call_api(
+            resource_path,
+            method,
+            path_params,
+            query_params,
+            header_params,
+            *args,
+            **kwargs,
+        )
 
     def __getattr__(self, name: str) -> Any:
         if name in self._api_cache:
@@ -115,10 +175,11 @@ class KubernetesClient(ApiClient):
     async def fetch_pod_metrics(self) -> Dict[str, Dict[str, float]]:
         """Fetch CPU and memory metrics for all pods using the metrics API."""
         try:
-            # Query the metrics API
-            response = await self.CustomObjectsApi.list_cluster_custom_object(  # type: ignore
-                group="metrics.k8s.io", version="v1beta1", plural="pods"
-            )
+            # Query the metrics API. It is polled, so it yields to everything else.
+            with request_priority("background"):
+                response = await self.CustomObjectsApi.list_cluster_custom_object(  # type: ignore
+                    group="metrics.k8s.io", version="v1beta1", plural="pods"
+                )
 
             def generate_metrics() -> (
                 Generator[tuple[str, dict[str, float]], None, None]
@@ -200,6 +261,12 @@ class KubernetesClient(ApiClient):
                     if model_class.namespaced and namespace and namespace != "all"
                     else "list_cluster_custom_object"
                 )
+            elif action == "read":
+                method_name = (
+                    "get_namespaced_custom_object"
+                    if model_class.namespaced
+                    else "get_cluster_custom_object"
+                )
 
         api_method = getattr(api_client, method_name)
 
@@ -222,3 +289,16 @@ class KubernetesClient(ApiClient):
                 kwargs["namespace"] = namespace
 
         return api_method, kwargs
+
+    async def read_full_object(self, row: UIRow) -> Any:
+        """
+        Returns the complete object behind a row. Rows of metadata-only models
+        and server-printed Table rows don't carry the object body, and rows
+        may have evicted theirs, so it is fetched from the API server.
+        """
+        if row.has_raw and not row.metadata_only and not row.server_side_columns:
+            return row.raw
+        read_method, kwargs = self.get_api_method_for_resource(
+            model_class=type(row), action="read", namespace=row.namespace
+        )
+        return await read_method(name=row.name, **kwargs)
@@ -0,0 +1,75 @@
+"""Choose how initial lists are read, and how long they may take, per kind and size."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Literal
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from ..config import WatchConfig
+
+# "cached": one request with resourceVersion=0, served from the API server's
+# watch cache without touching etcd. "consistent": one quorum read.
+# "paged": quorum reads of list_page_size objects, painted as they arrive.
+ListStrategy = Literal["cached", "consistent", "paged"]
+
+
+def choose_list_strategy(
+    expected: int | None, config: WatchConfig, *, consistent: bool = False
+) -> ListStrategy:
+    """
+    Picks a strategy from the last observed object count of a scope (None if
+    it has never been listed) and the configured freshness. With consistent=True
+    the watch cache is never used, as after a watch expired: the cache may be
+    older than the resource version that just expired.
+    """
+    if consistent:
+        if expected is not None and expected <= config.list_page_size:
+            return "consistent"
+        return "paged"
+    if config.list_freshness == "cached":
+        return "cached"
+    if expected is None:
+        # Unknown size: page, so a huge kind still paints early.
+        return "paged"
+    if expected <= config.list_page_size:
+        return "consistent"
+    if config.list_freshness == "consistent":
+        return "paged"
+    # Large kinds are what hurts etcd the most, and the watch corrects any
+    # staleness of the cache right after the list.
+    return "cached"
+
+
+def list_request_kwargs(strategy: ListStrategy, config: WatchConfig) -> dict[str, Any]:
+    """Returns the list call options implementing a strategy."""
+    if strategy == "cached":
+        return {"resource_version": "0"}
+    if strategy == "paged":
+        return {"limit": config.list_page_size}
+    return {}
+
+
+def list_timeout(
+    strategy: ListStrategy, expected: int | None, config: WatchConfig
+) -> aiohttp.ClientTimeout:
+    """
+    A timeout for one list request that grows with the number of objects it
+    is expected to return.
+    """
+    objects = expected or 0
+    if strategy == "paged":
+        objects = min(objects, config.list_page_size)
+    return aiohttp.ClientTimeout(
+        total=config.list_timeout_seconds
+        + objects / 1000 * config.list_timeout_per_1000_objects,
+        sock_connect=config.connect_timeout_seconds,
+    )
+
+
+def watch_timeout(config: WatchConfig) -> aiohttp.ClientTimeout:
+    """
+    A timeout for watch requests. They are long-lived by design, so only the
+    connection is bounded; the stream's idle timeout covers the rest.
+    """
+    return aiohttp.ClientTimeout(sock_connect=config.connect_timeout_seconds)
@@ -1,15 +1,22 @@
 from __future__ import annotations
 import inspect
-from typing import Type, AsyncGenerator, Generator, Union
+from typing import Any, Type, AsyncGenerator, Generator, Union
 import logging
 import pkgutil
 import importlib
 
+import aiohttp
+
 from .. import models
+from KubeZen.config import DiscoveryConfig
 from KubeZen.models.base import UIRow
 from KubeZen.models.customresourcedefinitions import CustomResourceDefinitionRow
-from KubeZen.models.crd_model_factory import create_model_from_crd
-from .kubernetes_client import KubernetesClient
+from KubeZen.models.crd_model_factory import CRDInfo, build_model, generate_accessors
+from .discovery_cache import DiscoveryCache, GeneratedModel
+from .json_api import fetch_json
+from .kubernetes_client import ACCEPT_OVERRIDE_HEADER, KubernetesClient
+from .rate_limiter import request_priority
+from .watch_manager import PARTIAL_METADATA_LIST_ACCEPT
 from kubernetes_asyncio.client.rest import ApiException
 import asyncio
 
@@ -48,38 +55,186 @@ def discover_standard_models() -> Generator[tuple[str, Type[UIRow]], None, None]
     yield from _traverse(UIRow)
 
 
+def crd_model_key(model: Type[UIRow]) -> str:
+    """The key of a CRD's model in the app's resource models."""
+    return f"{model.api_info.group}/{model.plural}"
+
+
+async def fetch_crds(
+    crd_client: Any, known: dict[str, CRDInfo], config: DiscoveryConfig
+) -> tuple[dict[str, CRDInfo], str]:
+    """
+    Returns the cluster's CRDs, reusing the known ones whose UID and resource
+    version are unchanged, and the resource version to watch CRDs from. A
+    metadata-only LIST tells which CRDs are new or changed. A few of them are
+    read one by one; when many changed, or none are known, all CRDs come from
+    one paged LIST instead, as that is the same download in fewer requests.
+    CRDs are decoded without building models.
+    """
+    if not known:
+        return await _list_crds(crd_client, config)
+
+    listing = await asyncio.wait_for(
+        fetch_json(
+            crd_client.list_custom_resource_definition,
+            _headers={ACCEPT_OVERRIDE_HEADER: PARTIAL_METADATA_LIST_ACCEPT},
+        ),
+        timeout=config.timeout_seconds,
+    )
+    crds: dict[str, CRDInfo] = {}
+    changed: list[str] = []
+    for item in listing["items"]:
+        metadata = item["metadata"]
+        crd = known.get(metadata["name"])
+        if (
+            crd is not None
+            and crd.uid == metadata["uid"]
+            and crd.resource_version == metadata["resourceVersion"]
+        ):
+            crds[crd.name] = crd
+        else:
+            changed.append(metadata["name"])
+
+    log.debug("%d of %d CRDs changed since cached", len(changed), len(listing["items"]))
+    if len(changed) > config.max_individual_reads:
+        return await _list_crds(crd_client, config)
+    if changed:
+        items = await asyncio.wait_for(
+            _read_crds(crd_client, changed), timeout=config.timeout_seconds
+        )
+        crds.update(_crd_infos(items))
+    return crds, listing["metadata"]["resourceVersion"]
+
+
+async def _list_crds(
+    crd_client: Any, config: DiscoveryConfig
+) -> tuple[dict[str, CRDInfo], str]:
+    """Lists every CRD in pages of page_size, each within timeout_seconds."""
+    crds: dict[str, CRDInfo] = {}
+    kwargs: dict[str, Any] = {"limit": config.page_size}
+    while True:
+        listing = await asyncio.wait_for(
+            fetch_json(crd_client.list_custom_resource_definition, **kwargs),
+            timeout=config.timeout_seconds,
+        )
+        crds.update(_crd_infos(listing["items"]))
+        metadata = listing["metadata"]
+        if not metadata.get("continue"):
+            return crds, metadata["resourceVersion"]
+        kwargs["_continue"] = metadata["continue"]
+
+
+async def _read_crds(crd_client: Any, names: list[str]) -> list[dict[str, Any]]:
+    """Reads CRDs by name, concurrently. Deleted ones are skipped."""
+
+    async def read(name: str) -> dict[str, Any] | None:
+        try:
+            crd: dict[str, Any] = await fetch_json(
+                crd_client.read_custom_resource_definition, name=name
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            return None
+        return crd
+
+    items = await asyncio.gather(*(read(name) for name in names))
+    return [item for item in items if item is not None]
+
+
+def _crd_infos(items: list[dict[str, Any]]) -> dict[str, CRDInfo]:
+    crds: dict[str, CRDInfo] = {}
+    for item in items:
+        try:
+            crd = CRDInfo.from_crd(item)
+        except (KeyError, IndexError, TypeError) as e:
+            log.warning(
+                "Skipping malformed CRD %s: %s",
+                (item.get("metadata") or {}).get("name"),
+                e,
+            )
+            continue
+        crds[crd.name] = crd
+    return crds
+
+
+def _build_models(
+    crds: list[CRDInfo], cache: DiscoveryCache | None, context: str
+) -> list[Type[UIRow]]:
+    """
+    Creates the models of the given CRDs, reusing the code generated for CRDs
+    whose UID and resource version are cached. Runs in a worker thread.
+    """
+    cached = cache.load_models(context) if cache else {}
+    generated: dict[str, GeneratedModel] = {}
+    models: list[Type[UIRow]] = []
+    hits = 0
+    for crd in crds:
+        try:
+            entry = cached.get(crd.uid)
+            if entry is None or entry[0] != crd.resource_version:
+                entry = (crd.resource_version, *generate_accessors(crd))
+            else:
+                hits += 1
+            generated[crd.uid] = entry
+            models.append(build_model(crd, entry[1], entry[2]))
+        except (TypeError, ValueError) as e:
+            log.exception("Model creation error from CRD: %s", e)
+        except Exception as e:
+            log.exception("Unexpected error creating model: %s", e)
+
+    log.debug("Built %d CRD models, %d of them from cache", len(models), hits)
+    if cache and generated != cached:
+        cache.save_models(context, generated)
+    return models
+
+
 async def discover_crd_models(
     client: KubernetesClient,
+    config: DiscoveryConfig,
+    cache: DiscoveryCache | None = None,
 ) -> AsyncGenerator[tuple[str, Type[UIRow]], None]:
     """
-    Discovers all CRDs and yields dynamic UIRow models for them concurrently as they complete.
+    Discovers all CRDs and yields dynamic UIRow models for them.
+    Within the cache TTL the CRDs come from the disk cache without any request;
+    after it, the cache is revalidated, and used as is if that fails.
     """
     try:
         api_client_name = CustomResourceDefinitionRow.api_info.client_name
         crd_client = getattr(client, api_client_name)
-        crds = await asyncio.wait_for(
-            crd_client.list_custom_resource_definition(),
-            timeout=5
-        )
 
-        async def process_crd(crd):
+        context = await client.get_current_context()
+        cached = cache.load(context) if cache else None
+        if cached and cached.age < config.cache_ttl_seconds:
+            log.debug("Using %d cached CRDs of context %s", len(cached.crds), context)
+            crds = cached.crds
+        else:
             try:
-                model = await asyncio.to_thread(create_model_from_crd, crd)
-                if model:
-                    key = f"{model.api_info.group}/{model.plural}"
-                    return key, model
-            except (TypeError, ValueError) as e:
-                log.exception("Model creation error from CRD: %s", e)
-            except Exception as e:
-                log.exception("Unexpected error creating model: %s", e)
-            return None
-
-        tasks = [asyncio.create_task(process_crd(crd)) for crd in crds.items]
+                # Discovery runs alongside the first tabs' lists and the
+                # user's actions, which go first.
+                with request_priority("background"):
+                    crds, _resource_version = await fetch_crds(
+                        crd_client, cached.crds if cached else {}, config
+                    )
+            except (asyncio.TimeoutError, ApiException, aiohttp.ClientError) as e:
+                if cached is None:
+                    raise
+                log.warning(
+                    "CRD discovery failed, using the cache from %.0fs ago: %s",
+                    cached.age,
+                    e,
+                )
+                crds = cached.crds
+            else:
+                if cache:
+                    cache.save(context, crds)
 
-        for completed in asyncio.as_completed(tasks):
-            result = await completed
-            if result:
-                yield result
+        # One worker thread builds every model, instead of a thread hop per CRD.
+        models = await asyncio.to_thread(
+            _build_models, list(crds.values()), cache, context
+        )
+        for model in models:
+            yield crd_model_key(model), model
 
     except AttributeError as e:
         log.error("Invalid API client attribute: %s", e)
@@ -0,0 +1,187 @@
+"""Client-side rate limiting of API requests, with priorities."""
+
+from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Literal, get_args
+import asyncio
+import logging
+import threading
+import time
+
+from .watch_metrics import Histogram
+
+log = logging.getLogger(__name__)
+
+# "interactive": anything the user is waiting on, which is the default.
+# "visible": lists and watches of the kind on screen.
+# "background": other tabs' lists and watches, and periodic polls.
+RequestPriority = Literal["interactive", "visible", "background"]
+# Highest priority first.
+PRIORITIES: tuple[RequestPriority, ...] = get_args(RequestPriority)
+
+_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority", default="interactive"
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Tags the API requests made inside the block with a priority."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
+
+@dataclass
+class PriorityMetrics:
+    requests: int = 0
+    # Requests that had to wait for a token.
+    throttled: int = 0
+    # Requests currently waiting for a token.
+    waiting: int = 0
+    # Seconds throttled requests waited.
+    delay_seconds: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "waiting": self.waiting,
+            "delay_seconds": self.delay_seconds.summary(),
+        }
+
+
+@dataclass(eq=False, slots=True)
+class _Waiter:
+    """A request waiting for a token on the loop it was made from."""
+
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[None]
+    # Set under the limiter's lock once a token is set aside for the request.
+    granted: bool = False
+
+
+def _wake(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RateLimiter:
+    """
+    A token bucket like client-go's: requests may burst up to `burst` at once,
+    then go through at `qps` per second. When tokens run out, requests queue
+    and are let through highest priority first, in arrival order within a
+    priority. A qps of zero or less disables limiting.
+
+    The bucket is guarded by a lock, so clients on several loops (the UI and
+    the informer thread) can share one budget. Each loop with waiting requests
+    runs its own dispatch timer, so no loop ever waits on another to be let
+    through.
+    """
+
+    def __init__(self, qps: float, burst: int) -> None:
+        self._qps = qps
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiters: dict[RequestPriority, deque[_Waiter]] = {
+            priority: deque() for priority in PRIORITIES
+        }
+        self._wakeups: dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+        self.metrics = {priority: PriorityMetrics() for priority in PRIORITIES}
+
+    @property
+    def enabled(self) -> bool:
+        return self._qps > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._qps
+        )
+        self._updated = now
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Waits until a request of the given priority may be sent."""
+        metrics = self.metrics[priority]
+        if not self.enabled:
+            metrics.requests += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            metrics.requests += 1
+            self._refill()
+            if self._tokens >= 1 and not any(self._waiters.values()):
+                self._tokens -= 1
+                return
+
+            waiter = _Waiter(loop, loop.create_future())
+            self._waiters[priority].append(waiter)
+            metrics.throttled += 1
+            metrics.waiting += 1
+            self._schedule_dispatch(loop)
+        queued_at = time.monotonic()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # The token was granted just before the cancellation. Return
+                    # it to the bucket, for the next waiter if there is one.
+                    self._tokens = min(self._burst, self._tokens + 1)
+                    if any(self._waiters.values()):
+                        self._schedule_dispatch(loop)
+                else:
+                    self._waiters[priority].remove(waiter)
+            raise
+        finally:
+            with self._lock:
+                metrics.waiting -= 1
+                metrics.delay_seconds.observe(time.monotonic() - queued_at)
+
+    def _schedule_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Starts the dispatch timer of a loop. Called with the lock held."""
+        if loop in self._wakeups:
+            return
+        delay = max(0.0, (1 - self._tokens) / self._qps)
+        self._wakeups[loop] = loop.call_later(delay, self._dispatch, loop)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Hands the available tokens to the waiters of every loop, highest
+        priority first, and keeps this loop's timer going while it has waiters.
+        """
+        with self._lock:
+            del self._wakeups[loop]
+            self._refill()
+            for priority in PRIORITIES:
+                waiters = self._waiters[priority]
+                while waiters and self._tokens >= 1:
+                    waiter = waiters.popleft()
+                    self._tokens -= 1
+                    waiter.granted = True
+                    if waiter.loop is loop:
+                        _wake(waiter.future)
+                    else:
+                        waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+            if any(
+                waiter.loop is loop
+                for waiters in self._waiters.values()
+                for waiter in waiters
+            ):
+                self._schedule_dispatch(loop)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Returns each priority's metrics, keyed by priority."""
+        return {priority: metrics.snapshot() for priority, metrics in self.metrics.items()}
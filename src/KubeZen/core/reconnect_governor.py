@@ -0,0 +1,106 @@
+"""Pace watch reconnects so a network blip doesn't turn into a thundering herd."""
+
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+import asyncio
+import logging
+import random
+
+if TYPE_CHECKING:
+    from ..models.base import UIRow
+
+log = logging.getLogger(__name__)
+
+
+class Backoff:
+    """Capped exponential backoff with full jitter."""
+
+    def __init__(self, base: float, cap: float) -> None:
+        self._base = base
+        self._cap = cap
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        """Returns a random delay of up to base * 2^attempts, capped."""
+        ceiling = min(self._cap, self._base * 2**self.attempts)
+        self.attempts += 1
+        return random.uniform(0, ceiling)
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+class ReconnectGovernor:
+    """
+    Limits how many watches may reconnect or relist at once across the app.
+    When a slot frees up, watches of the kinds marked visible are let through
+    before the others, which wait in arrival order.
+
+    Slots must be taken from the loop the watch managers run on, while
+    set_visible() may be called from any thread.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self._max_concurrent = max(1, max_concurrent)
+        self._active = 0
+        self._waiters: list[tuple[type[UIRow], asyncio.Future[None]]] = []
+        self._visible: frozenset[type[UIRow]] = frozenset()
+
+    def set_visible(self, model_classes: Iterable[type[UIRow]]) -> None:
+        """Marks the kinds whose reconnects should be prioritized."""
+        self._visible = frozenset(model_classes)
+
+    def is_visible(self, model_class: type[UIRow]) -> bool:
+        return model_class in self._visible
+
+    @asynccontextmanager
+    async def slot(self, model_class: type[UIRow]) -> AsyncIterator[None]:
+        """Holds one of the reconnect slots for the duration of the block."""
+        await self._acquire(model_class)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, model_class: type[UIRow]) -> None:
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (model_class, future)
+        self._waiters.append(waiter)
+        log.debug(
+            "Reconnect of %s waiting for a slot (%d waiting)",
+            model_class.plural,
+            len(self._waiters),
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before the cancellation.
+                self._release()
+            elif waiter in self._waiters:
+                # _release() may already have popped and skipped it.
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        while self._waiters and self._active < self._max_concurrent:
+            visible = self._visible
+            index = next(
+                (
+                    i
+                    for i, (model_class, _) in enumerate(self._waiters)
+                    if model_class in visible
+                ),
+                0,
+            )
+            _, future = self._waiters.pop(index)
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
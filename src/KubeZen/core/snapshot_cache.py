@@ -0,0 +1,156 @@
+"""Persist informer stores to disk so tabs can paint before the first LIST."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+import logging
+import os
+import re
+import struct
+import zlib
+
+import orjson
+
+from ..models.raw import RawObject
+
+if TYPE_CHECKING:
+    from kubernetes_asyncio.client.api_client import ApiClient
+    from ..models.base import UIRow
+
+log = logging.getLogger(__name__)
+
+# File layout: MAGIC, then a zlib stream holding a 4-byte header length, the
+# JSON header and the JSON array of raw items.
+MAGIC = b"KZS1"
+_HEADER_LENGTH = struct.Struct(">I")
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+# Annotations that can embed a whole object, including a Secret's data.
+_STRIPPED_ANNOTATIONS = ("kubectl.kubernetes.io/last-applied-configuration",)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    The raw JSON objects of one namespace scope and the resource version they
+    were seen at.
+    """
+
+    resource_version: str
+    items: list[dict[str, Any]]
+
+
+class SnapshotCache:
+    """Reads and writes compressed per context/kind/namespace store snapshots."""
+
+    def __init__(self, cache_dir: Path, api_client: ApiClient) -> None:
+        self._root = cache_dir / "snapshots"
+        self._api_client = api_client
+
+    @staticmethod
+    def _safe(name: str) -> str:
+        return _UNSAFE_CHARS.sub("_", name) or "_"
+
+    def _path(self, context: str, model_class: type[UIRow], namespace: str) -> Path:
+        group = model_class.api_info.group or "core"
+        kind_dir = f"{self._safe(group)}_{self._safe(model_class.plural)}"
+        if model_class.metadata_only:
+            kind_dir += "_metadata"
+        return (
+            self._root / self._safe(context) / kind_dir / f"{self._safe(namespace)}.snap"
+        )
+
+    def _make_private_dirs(self, directory: Path) -> None:
+        """Creates the directories down to `directory`, readable only by the user."""
+        self._root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Caches created by older versions used the default permissions.
+        self._root.chmod(0o700)
+        current = self._root
+        for part in directory.relative_to(self._root).parts:
+            current = current / part
+            current.mkdir(mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def _strip(item: dict[str, Any]) -> dict[str, Any]:
+        """Drops the metadata no row displays, some of which can hold secrets."""
+        metadata = item.get("metadata")
+        if not isinstance(metadata, dict):
+            return item
+        metadata = {k: v for k, v in metadata.items() if k != "managedFields"}
+        if annotations := metadata.get("annotations"):
+            metadata["annotations"] = {
+                k: v for k, v in annotations.items() if k not in _STRIPPED_ANNOTATIONS
+            }
+        return {**item, "metadata": metadata}
+
+    def save(
+        self,
+        context: str,
+        model_class: type[UIRow],
+        namespace: str,
+        resource_version: str,
+        items: list[Any],
+    ) -> None:
+        """
+        Writes a snapshot atomically, readable only by the user. Sensitive kinds
+        are never written. Failures are logged, never raised.
+        """
+        if model_class.sensitive:
+            return
+        path = self._path(context, model_class, namespace)
+        try:
+            header = orjson.dumps({"resourceVersion": resource_version})
+            body = orjson.dumps(
+                [
+                    self._strip(
+                        item.data
+                        if isinstance(item, RawObject)
+                        else self._api_client.sanitize_for_serialization(item)
+                    )
+                    for item in items
+                ]
+            )
+            payload = zlib.compress(
+                _HEADER_LENGTH.pack(len(header)) + header + body, level=1
+            )
+
+            self._make_private_dirs(path.parent)
+            tmp_path = path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(MAGIC + payload)
+            os.replace(tmp_path, path)
+            log.debug("Saved %d %s to snapshot %s", len(items), model_class.plural, path)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("Failed to save snapshot %s: %s", path, e)
+
+    def load(
+        self, context: str, model_class: type[UIRow], namespace: str
+    ) -> Snapshot | None:
+        """Reads a snapshot, returning None if it is missing or unreadable."""
+        path = self._path(context, model_class, namespace)
+        if model_class.sensitive:
+            # Drop snapshots that versions without this check wrote.
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.warning("Failed to read snapshot %s: %s", path, e)
+            return None
+
+        try:
+            if not data.startswith(MAGIC):
+                raise ValueError("unknown snapshot format")
+            payload = zlib.decompress(data[len(MAGIC):])
+            (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+            header_end = _HEADER_LENGTH.size + header_length
+            header = orjson.loads(payload[_HEADER_LENGTH.size:header_end])
+            items = orjson.loads(payload[header_end:])
+            return Snapshot(resource_version=header["resourceVersion"], items=items)
+        except (KeyError, ValueError, TypeError, zlib.error, struct.error) as e:
+            log.warning("Discarding unreadable snapshot %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return None
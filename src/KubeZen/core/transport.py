@@ -0,0 +1,189 @@
+"""Connection pools for the Kubernetes client, split by request kind and instrumented."""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+import logging
+import re
+import ssl
+import time
+
+import aiohttp
+from kubernetes_asyncio.client import rest
+
+from .rate_limiter import RateLimiter, current_request_priority
+from .watch_metrics import Histogram
+
+if TYPE_CHECKING:
+    from kubernetes_asyncio.client import Configuration
+    from ..config import TransportConfig
+
+log = logging.getLogger(__name__)
+
+# Watches and followed logs hold their connection for as long as they stream.
+_STREAMING_QUERY = re.compile(r"[?&](?:watch|follow)=(?:True|true|1)(?:&|$)")
+
+# Same limit as the generated client: watch events carrying large objects can
+# exceed aiohttp's default read buffer.
+_READ_BUFSIZE = 2**21
+
+
+@dataclass
+class PoolMetrics:
+    """Occupancy and wait times of one connection pool."""
+
+    limit: int
+    requests: int = 0
+    # Requests currently waiting for a free connection.
+    waiting: int = 0
+    created: int = 0
+    reused: int = 0
+    # Seconds requests spent waiting for a free connection.
+    wait_seconds: Histogram = field(default_factory=Histogram)
+    connector: aiohttp.BaseConnector | None = field(default=None, repr=False)
+
+    @property
+    def in_use(self) -> int:
+        # aiohttp has no public counter of checked out connections.
+        return len(getattr(self.connector, "_acquired", ()))
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "requests": self.requests,
+            "created": self.created,
+            "reused": self.reused,
+            "wait_seconds": self.wait_seconds.summary(),
+        }
+
+
+def _trace_config(metrics: PoolMetrics) -> aiohttp.TraceConfig:
+    """Records a pool's activity through aiohttp's tracing hooks."""
+
+    async def on_request_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.requests += 1
+
+    async def on_queued_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.waiting += 1
+        context.queued_at = time.perf_counter()
+
+    async def on_queued_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.waiting -= 1
+        metrics.wait_seconds.observe(time.perf_counter() - context.queued_at)
+
+    async def on_create_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.created += 1
+
+    async def on_reuse(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.reused += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(on_queued_start)
+    trace_config.on_connection_queued_end.append(on_queued_end)
+    trace_config.on_connection_create_end.append(on_create_end)
+    trace_config.on_connection_reuseconn.append(on_reuse)
+    return trace_config
+
+
+class _SessionRouter:
+    """
+    Stands in for the generated client's single ClientSession, sending
+    streaming requests and ordinary requests through separate pools.
+    """
+
+    def __init__(
+        self, requests: aiohttp.ClientSession, streams: aiohttp.ClientSession
+    ) -> None:
+        self._requests = requests
+        self._streams = streams
+
+    def request(self, **kwargs: Any) -> Any:
+        if _STREAMING_QUERY.search(kwargs["url"]):
+            return self._streams.request(**kwargs)
+        return self._requests.request(**kwargs)
+
+    async def close(self) -> None:
+        await self._requests.close()
+        await self._streams.close()
+
+
+class PooledRESTClient(rest.RESTClientObject):
+    """
+    The generated REST transport with two explicitly sized connection pools:
+    one for long-lived watches and log streams, so they can't starve actions
+    and metrics polls, and one keep-alive pool for request/response calls.
+    Both share one TLS context and cache DNS lookups. Every request first
+    takes a token from the client's rate limiter, in the priority of the
+    context it is made from. Pass `rate_limiter` to share another client's.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        transport: TransportConfig,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        # Deliberately not calling super().__init__, which opens its own pool.
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        self.server_hostname = configuration.tls_server_name
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        if configuration.disable_strict_ssl_verification:
+            ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+        self.pool_metrics = {
+            "requests": PoolMetrics(limit=transport.request_pool_size),
+            "streams": PoolMetrics(limit=transport.stream_pool_size),
+        }
+        sessions = {}
+        for name, metrics in self.pool_metrics.items():
+            connector = aiohttp.TCPConnector(
+                limit=metrics.limit,
+                ssl=ssl_context,
+                keepalive_timeout=transport.keepalive_timeout_seconds,
+                ttl_dns_cache=transport.dns_cache_ttl_seconds,
+            )
+            metrics.connector = connector
+            sessions[name] = aiohttp.ClientSession(
+                connector=connector,
+                trust_env=True,
+                read_bufsize=_READ_BUFSIZE,
+                trace_configs=[_trace_config(metrics)],
+            )
+        self.pool_manager = _SessionRouter(sessions["requests"], sessions["streams"])
+        self.rate_limiter = rate_limiter or RateLimiter(transport.qps, transport.burst)
+        log.debug(
+            "Connection pools: %d for requests, %d for streams",
+            transport.request_pool_size,
+            transport.stream_pool_size,
+        )
+
+    async def request(self, *args: Any, **kwargs: Any) -> Any:
+        await self.rate_limiter.acquire(current_request_priority())
+        return await super().request(*args, **kwargs)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns a snapshot of both pools' metrics, keyed by pool name."""
+        return {name: metrics.snapshot() for name, metrics in self.pool_metrics.items()}
@@ -1,12 +1,16 @@
 """Watch multiple K8s event streams without threads."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, Type, Generator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Type, Iterator
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 import asyncio
 import socket
 import logging
+import time
 
-from kubernetes_asyncio import watch
+import orjson
+from kubernetes_asyncio.client import models as client_models
 from kubernetes_asyncio.client.exceptions import ApiException
 from textual.signal import Signal
 
@@ -17,55 +21,270 @@ from aiohttp import (
     ClientPayloadError,
 )
 
+from .json_api import (
+    WatchIdleTimeout,
+    WatchStream,
+    accepts_send_initial_events,
+    fetch_bytes,
+    is_initial_events_end,
+    list_item_type,
+)
+from .kubernetes_client import ACCEPT_OVERRIDE_HEADER, KubernetesClient
+from .list_strategy import (
+    choose_list_strategy,
+    list_request_kwargs,
+    list_timeout,
+    watch_timeout,
+)
+from .rate_limiter import RequestPriority, request_priority
+from .reconnect_governor import Backoff, ReconnectGovernor
+from .snapshot_cache import SnapshotCache
+from .watch_metrics import WatchMetrics
+from ..models.raw import RawObject
+
 if TYPE_CHECKING:
     from ..app import KubeZen
     from ..models.base import UIRow
 
 log = logging.getLogger(__name__)
 
+# Servers that can't transform to metadata fall back to full objects, which the
+# metadata-only rows read just the same. Watches transform each event's object
+# on its own, so they ask for the single object kind rather than the list.
+PARTIAL_METADATA_LIST_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,"
+    "application/json"
+)
+PARTIAL_METADATA_ACCEPT = (
+    "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,"
+    "application/json"
+)
+TABLE_ACCEPT = "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+# How long the API server keeps a watch open before the client has to reconnect.
+WATCH_TIMEOUT_SECONDS = 240
+
+
+@dataclass
+class WatchEventBatch:
+    """Watch events collected over one coalescing window, at most one per UID."""
+
+    events: dict[str, tuple[str, UIRow]] = field(default_factory=dict)
+    # The displayed columns each MODIFIED event changed. Missing means unknown,
+    # in which case every column has to be redrawn.
+    changed_columns: dict[str, frozenset[str]] = field(default_factory=dict)
+    # When the first event entered the batch, for measuring render latency.
+    received_at: float | None = None
+
+    def add(
+        self,
+        event_type: str,
+        resource: UIRow,
+        changed_columns: frozenset[str] | None = None,
+    ) -> None:
+        """Merges an event into the batch so only the latest state survives."""
+        if self.received_at is None:
+            self.received_at = time.monotonic()
+        uid = resource.uid
+        previous = self.events.get(uid)
+        if previous is None:
+            self.events[uid] = (event_type, resource)
+            if changed_columns is not None:
+                self.changed_columns[uid] = changed_columns
+            return
+
+        previous_type = previous[0]
+        if previous_type == "ADDED" and event_type == "DELETED":
+            # Consumers never saw this object, so there is nothing to tell them.
+            del self.events[uid]
+        elif previous_type == "ADDED":
+            self.events[uid] = ("ADDED", resource)
+        elif previous_type == "DELETED" and event_type != "DELETED":
+            self.events[uid] = ("MODIFIED", resource)
+            self.changed_columns.pop(uid, None)
+        else:
+            self.events[uid] = (event_type, resource)
+            if previous_type == "MODIFIED" and event_type == "MODIFIED":
+                previous_columns = self.changed_columns.get(uid)
+                if previous_columns is not None and changed_columns is not None:
+                    self.changed_columns[uid] = previous_columns | changed_columns
+                    return
+            self.changed_columns.pop(uid, None)
+
+    def columns_changed(self, uid: str) -> frozenset[str] | None:
+        """Returns the columns a MODIFIED event changed, or None if unknown."""
+        return self.changed_columns.get(uid)
+
+    def names_changed(self) -> tuple[set[str], set[str]]:
+        """
+        Returns the names added and the names deleted in the batch. Objects
+        deleted and recreated under the same name have different UIDs, so
+        the events are reduced per name in order and the last one wins.
+        """
+        last_events: dict[str, str] = {}
+        for event_type, resource in self.events.values():
+            if event_type in ("ADDED", "DELETED"):
+                last_events[resource.name] = event_type
+        added = {name for name, event in last_events.items() if event == "ADDED"}
+        return added, last_events.keys() - added
+
+    def __iter__(self) -> Iterator[tuple[str, UIRow]]:
+        return iter(self.events.values())
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+@dataclass(frozen=True)
+class ListPage:
+    """One page of a paginated LIST."""
+
+    resources: list[UIRow]
+    resource_version: str
+    loaded: int
+    remaining: int | None
+    # The LIST started over from its first page: the earlier pages are stale.
+    restarted: bool = False
+
+    @property
+    def expected(self) -> int | None:
+        """The approximate total size of the listing, if the server reported it."""
+        if self.remaining is None:
+            return None
+        return self.loaded + self.remaining
+
+
+@dataclass(frozen=True)
+class ListProgress:
+    """Progress of the initial LIST of a namespace scope."""
+
+    namespace: str
+    loaded: int
+    expected: int | None
+    done: bool = False
+
 
 class WatchManagerSignal:
     def __init__(self, app: KubeZen, model_class: Type[UIRow]):
         kind: str = model_class.kind.lower()
-        self._resource_added: Signal[dict[str, UIRow]] = Signal(
-            app, f"resource_added_{kind}"
-        )
-        self._resource_modified: Signal[dict[str, UIRow]] = Signal(
-            app, f"resource_modified_{kind}"
+        self._resource_batch: Signal[WatchEventBatch] = Signal(
+            app, f"resource_batch_{kind}"
         )
-        self._resource_deleted: Signal[dict[str, UIRow]] = Signal(
-            app, f"resource_deleted_{kind}"
-        )
-        self._resource_full_reset: Signal[dict[str, UIRow]] = Signal(
-            app, f"resource_full_reset_{kind}"
+        self._list_progress: Signal[ListProgress] = Signal(
+            app, f"list_progress_{kind}"
         )
 
     def __del__(self):
         log.debug("Deleting watch manager signal")
 
     @property
-    def resource_added(self) -> Signal[dict[str, UIRow]]:
-        return self._resource_added
+    def resource_batch(self) -> Signal[WatchEventBatch]:
+        return self._resource_batch
 
     @property
-    def resource_modified(self) -> Signal[dict[str, UIRow]]:
-        return self._resource_modified
+    def list_progress(self) -> Signal[ListProgress]:
+        return self._list_progress
 
-    @property
-    def resource_deleted(self) -> Signal[dict[str, UIRow]]:
-        return self._resource_deleted
 
-    @property
-    def resource_full_reset(self) -> Signal[list[UIRow]]:
-        return self._resource_full_reset
+def _is_newer(resource_version: str, than: str | None) -> bool:
+    """
+    Whether a resource version is newer than another, or than nothing. They
+    are opaque strings; ones that aren't the integers every API server uses
+    in practice are never considered newer.
+    """
+    if than is None:
+        return True
+    try:
+        return int(resource_version) > int(than)
+    except ValueError:
+        return False
 
 
 class WatchManager:
-    def __init__(self, app: "KubeZen", model_class: type[UIRow]):
+    def __init__(
+        self,
+        app: "KubeZen",
+        model_class: type[UIRow],
+        api_client: KubernetesClient | None = None,
+        ui_loop: asyncio.AbstractEventLoop | None = None,
+        governor: ReconnectGovernor | None = None,
+    ):
+        """
+        When the manager runs on the informer thread, `api_client` is the client
+        bound to that thread's loop and `ui_loop` is where signals are published.
+        `governor` is shared by all managers to pace reconnects app-wide.
+        """
         self._model_class = model_class
-        self._api_client = app.kubernetes_client
+        self._api_client = api_client or app.kubernetes_client
+        self._ui_loop = ui_loop
+        self._governor = governor or ReconnectGovernor(
+            app.config.watch.max_concurrent_reconnects
+        )
         self._tasks: dict[str, asyncio.Task] = {}
         self._signals = WatchManagerSignal(app, model_class)
+        self._store: dict[str, UIRow] = {}
+        self._scopes_lock = asyncio.Lock()
+        self._list_semaphore = asyncio.Semaphore(
+            app.config.watch.max_concurrent_lists
+        )
+        self._watch_config = app.config.watch
+        self._pending_batch = WatchEventBatch()
+        self._pending_count = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._metrics = WatchMetrics()
+        # Last observed object counts, used to estimate the cost of watch strategies.
+        self._namespace_counts: dict[str, int] = {}
+        self._cluster_count: int | None = None
+        # The namespaces consumers last asked to be watched.
+        self._held_namespaces: set[str] = set()
+        self._resource_versions: dict[str, str] = {}
+        # Snapshots are made of the rows' raw objects, which evicting drops.
+        self._snapshots: SnapshotCache | None = (
+            SnapshotCache(app.config.paths.cache_dir, self._api_client)
+            if self._watch_config.snapshot_cache
+            and self._watch_config.raw_storage != "evict"
+            else None
+        )
+        self._context: str | None = None
+        # The generated model name of the listed items, None for custom objects.
+        self._item_type: str | None = None
+        self._item_type_resolved = False
+        # Column names of server-printed Tables. Watch events after the first
+        # may omit the column definitions.
+        self._table_columns: list[str] = []
+
+    @property
+    def store(self) -> dict[str, UIRow]:
+        """
+        The authoritative rows for every namespace scope currently watched.
+        Only iterate it on the loop the manager runs on; use rows() and
+        get_row() from the UI when the informer thread is enabled.
+        """
+        return self._store
+
+    def rows(self) -> list[UIRow]:
+        """Returns a point-in-time copy of the stored rows, safe from any thread."""
+        return list(self._store.values())
+
+    def get_row(self, uid: str) -> UIRow | None:
+        """Returns the stored row for a UID, safe from any thread."""
+        return self._store.get(uid)
+
+    def _publish(self, signal: Signal[Any], payload: Any) -> None:
+        """Publishes a signal on the UI loop, handing it over if needed."""
+        if self._ui_loop is None:
+            signal.publish(payload)
+        else:
+            self._ui_loop.call_soon_threadsafe(signal.publish, payload)
+
+    @property
+    def metrics(self) -> WatchMetrics:
+        """Counters and latency histograms of this manager's watch pipeline."""
+        return self._metrics
+
+    @property
+    def suppressed_events(self) -> int:
+        """How many MODIFIED events were dropped because no displayed column changed."""
+        return self._metrics.suppressed_events
 
     async def stop(self) -> None:
         """Stops all running watch tasks gracefully."""
@@ -75,7 +294,345 @@ class WatchManager:
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        for namespace in list(self._tasks):
+            await self._save_snapshot(namespace)
         self._tasks.clear()
+        self._store.clear()
+        self._discard_pending_batch()
+
+    def _effective_scopes(self, namespaces: set[str]) -> set[str]:
+        """Collapses the requested namespaces into the watches actually needed."""
+        if not namespaces:
+            return set()
+        if not self._model_class.namespaced or "all" in namespaces:
+            return {"all"}
+        if self._prefers_cluster_wide_watch(namespaces):
+            return {"all"}
+        return set(namespaces)
+
+    async def _load_scope(self, namespace: str) -> tuple[str, WatchStream | None]:
+        """
+        Streams the initial state of a scope into the store, publishing every
+        page as a batch so consumers can paint rows before the listing completes.
+        The state comes from a streaming list when the server supports one, else
+        from a paged LIST. Returns the resource version to start watching from
+        and, for a streaming list, the open stream to continue watching on.
+        """
+        if resource_version := await self._restore_snapshot(namespace):
+            return resource_version, None
+
+        stream = await self._open_watch_list(namespace)
+        pages = (
+            self.list_pages(namespace)
+            if stream is None
+            else self._watch_list_pages(stream)
+        )
+        resources: list[UIRow] = []
+        # Rows of pages a restarted LIST has superseded.
+        superseded: list[UIRow] = []
+        resource_version = ""
+        try:
+            async for page in pages:
+                if page.restarted:
+                    superseded.extend(resources)
+                    resources = []
+                for resource in page.resources:
+                    if change := self._apply_to_store("ADDED", resource):
+                        self._queue_event(resource, *change)
+                self._flush_events()
+                resources.extend(page.resources)
+                resource_version = page.resource_version
+                self._publish(
+                    self._signals.list_progress,
+                    ListProgress(namespace, page.loaded, page.expected),
+                )
+        except BaseException:
+            if stream is not None:
+                await stream.close()
+            raise
+        finally:
+            self._publish(
+                self._signals.list_progress,
+                ListProgress(namespace, len(resources), len(resources), done=True),
+            )
+        if superseded:
+            listed = {resource.uid for resource in resources}
+            for resource in superseded:
+                if resource.uid not in listed:
+                    if change := self._apply_to_store("DELETED", resource):
+                        self._queue_event(resource, *change)
+            self._flush_events()
+        self._record_counts(namespace, resources)
+        return resource_version, stream
+
+    def _scope_rows(self, namespace: str) -> list[UIRow]:
+        """Returns the stored rows that belong to a namespace scope."""
+        if namespace == "all" or not self._model_class.namespaced:
+            return list(self._store.values())
+        return [row for row in self._store.values() if row.namespace == namespace]
+
+    def _newest_seen(self, namespace: str) -> str | None:
+        """The newest resource version among a scope's stored rows, if any."""
+        newest: str | None = None
+        for row in self._scope_rows(namespace):
+            if row.resource_version and _is_newer(row.resource_version, newest):
+                newest = row.resource_version
+        return newest
+
+    async def _snapshot_context(self) -> str:
+        if self._context is None:
+            self._context = await self._api_client.get_current_context()
+        return self._context
+
+    async def _restore_snapshot(self, namespace: str) -> str | None:
+        """
+        Paints a scope from its on-disk snapshot and returns the resource version
+        to resume watching from, or None if there is no usable snapshot. A stale
+        version is handled by the watch loop's 410 relist.
+        """
+        if self._snapshots is None:
+            return None
+        context = await self._snapshot_context()
+        snapshot = await asyncio.to_thread(
+            self._snapshots.load, context, self._model_class, namespace
+        )
+        if snapshot is None or not snapshot.resource_version:
+            return None
+        if not _is_newer(snapshot.resource_version, self._newest_seen(namespace)):
+            # The store already holds this scope's rows, e.g. from a cluster-wide
+            # watch, and they are at least as fresh as the snapshot.
+            log.debug(
+                "Skipping older snapshot of %s for '%s'",
+                self._model_class.plural,
+                namespace,
+            )
+            return None
+
+        resources = await asyncio.to_thread(self._build_rows, snapshot.items)
+        for resource in resources:
+            if change := self._apply_to_store("ADDED", resource):
+                self._queue_event(resource, *change)
+        self._flush_events()
+        self._record_counts(namespace, resources)
+        log.info(
+            "Restored %d %s for '%s' from snapshot at RV %s",
+            len(resources),
+            self._model_class.plural,
+            namespace,
+            snapshot.resource_version,
+        )
+        return snapshot.resource_version
+
+    async def _save_snapshot(self, namespace: str) -> None:
+        """Persists a scope's rows and last seen resource version."""
+        resource_version = self._resource_versions.pop(namespace, None)
+        if self._snapshots is None or not resource_version:
+            return
+        items = [row.raw for row in self._scope_rows(namespace)]
+        context = await self._snapshot_context()
+        await asyncio.to_thread(
+            self._snapshots.save,
+            context,
+            self._model_class,
+            namespace,
+            resource_version,
+            items,
+        )
+
+    def _prefers_cluster_wide_watch(self, namespaces: set[str]) -> bool:
+        """
+        Compares the estimated cost of one watch per namespace against a single
+        cluster-wide watch whose extra objects are filtered out client-side.
+        """
+        if len(namespaces) >= self._watch_config.cluster_wide_namespace_threshold:
+            return True
+        if self._cluster_count is None:
+            # Without a cluster-wide count the extra objects can't be estimated.
+            return False
+        if any(namespace not in self._namespace_counts for namespace in namespaces):
+            return False
+
+        connection_cost = self._watch_config.watch_connection_cost
+        per_namespace_cost = len(namespaces) * connection_cost + sum(
+            self._namespace_counts[namespace] for namespace in namespaces
+        )
+        cluster_wide_cost = connection_cost + self._cluster_count
+        return cluster_wide_cost < per_namespace_cost
+
+    def _expected_count(self, namespace: str) -> int | None:
+        """The object count a scope had when last listed, if it ever was."""
+        if namespace == "all":
+            return self._cluster_count
+        return self._namespace_counts.get(namespace)
+
+    def _record_counts(self, namespace: str, resources: list[UIRow]) -> None:
+        """Remembers how many objects a LIST returned for later cost estimates."""
+        if namespace != "all":
+            self._namespace_counts[namespace] = len(resources)
+            return
+        self._cluster_count = len(resources)
+        # A cluster-wide LIST covers every namespace, so the held and known
+        # ones it returned nothing for are empty, not unknown.
+        counts = dict.fromkeys(
+            (self._held_namespaces | self._namespace_counts.keys()) - {"all"}, 0
+        )
+        for resource in resources:
+            if resource.namespace:
+                counts[resource.namespace] = counts.get(resource.namespace, 0) + 1
+        self._namespace_counts = counts
+
+    async def set_scopes(self, namespaces: set[str]) -> None:
+        """
+        Reconciles the running watches with the namespace scopes held by consumers.
+        Only new scopes are listed, concurrently, and they are watched before
+        obsolete ones are stopped, so rows stay in the store while the watch
+        coverage changes. Rows of dropped scopes are removed from the store
+        locally.
+        """
+        async with self._scopes_lock:
+            self._held_namespaces = set(namespaces)
+            effective = self._effective_scopes(namespaces)
+            current = self.watching
+            if effective != current and self._model_class.namespaced:
+                log.info(
+                    "Re-scoping %s watches from %s to %s",
+                    self._model_class.plural,
+                    sorted(current),
+                    sorted(effective),
+                )
+
+            results = await asyncio.gather(
+                *(self._start_scope(namespace) for namespace in effective - current),
+                return_exceptions=True,
+            )
+            # Scopes that did load stay watched; the caller rolls back on error.
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            for namespace in current - effective:
+                await self.stop_namespace_watch(namespace)
+
+            self._prune_store()
+
+    def _request_priority(self) -> RequestPriority:
+        """The priority of this kind's API requests: higher while it is on screen."""
+        if self._governor.is_visible(self._model_class):
+            return "visible"
+        return "background"
+
+    async def _start_scope(self, namespace: str) -> None:
+        """Lists a scope, bounded by max_concurrent_lists, and starts its watch."""
+        async with self._list_semaphore:
+            with request_priority(self._request_priority()):
+                try:
+                    resource_version, stream = await self._load_scope(namespace)
+                except BaseException:
+                    self._drop_unwatched_rows(namespace)
+                    raise
+        await self.create_watch_task(namespace, resource_version, stream)
+
+    def _drop_unwatched_rows(self, namespace: str) -> None:
+        """
+        Removes the rows of a scope that failed to load partway through, and
+        publishes their deletion, unless a running watch still covers them.
+        """
+        if "all" in self._tasks:
+            return
+        for row in self._scope_rows(namespace):
+            if self._model_class.namespaced and row.namespace in self._tasks:
+                continue
+            if change := self._apply_to_store("DELETED", row):
+                self._queue_event(row, *change)
+        self._flush_events()
+
+    def _prune_store(self) -> None:
+        """Drops rows that no running watch is responsible for anymore."""
+        if not self._tasks:
+            self._store.clear()
+            return
+        if not self._model_class.namespaced or "all" in self._tasks:
+            return
+        stale_uids = [
+            uid
+            for uid, resource in self._store.items()
+            if resource.namespace not in self._tasks
+        ]
+        for uid in stale_uids:
+            del self._store[uid]
+
+    def _apply_to_store(
+        self, event_type: str, resource: UIRow
+    ) -> tuple[str, frozenset[str] | None] | None:
+        """
+        Applies a watch event to the store and returns the event type to publish
+        along with the displayed columns it changed (None if not applicable).
+        Returns None when there is nothing to publish: the store already
+        reflected the event (e.g. overlapping watches) or nothing visible changed.
+        """
+        if event_type == "DELETED":
+            if self._store.pop(resource.uid, None) is None:
+                return None
+            return event_type, None
+
+        existing = self._store.get(resource.uid)
+        self._store[resource.uid] = resource
+        if existing is None:
+            return "ADDED", None
+        if existing.resource_version == resource.resource_version:
+            return None
+        if not self._watch_config.suppress_noop_events:
+            return "MODIFIED", None
+
+        changed_columns = frozenset(
+            key
+            for key, old, new in zip(
+                self._model_class.get_column_keys(),
+                existing.column_fingerprint(),
+                resource.column_fingerprint(),
+            )
+            if old != new
+        )
+        if not changed_columns:
+            self._metrics.suppressed_events += 1
+            return None
+        return "MODIFIED", changed_columns
+
+    def _queue_event(
+        self,
+        resource: UIRow,
+        event_type: str,
+        changed_columns: frozenset[str] | None = None,
+    ) -> None:
+        """Buffers an event until the coalescing window closes or fills up."""
+        self._pending_batch.add(event_type, resource, changed_columns)
+        self._pending_count += 1
+
+        if self._pending_count >= self._watch_config.batch_max_events:
+            self._flush_events()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self._watch_config.batch_window_seconds, self._flush_events
+            )
+
+    def _flush_events(self) -> None:
+        """Publishes everything buffered so far as a single batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch = self._pending_batch
+        self._pending_batch = WatchEventBatch()
+        self._pending_count = 0
+        if batch:
+            self._publish(self._signals.resource_batch, batch)
+
+    def _discard_pending_batch(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_batch = WatchEventBatch()
+        self._pending_count = 0
 
     async def stop_namespace_watch(self, namespace: str) -> None:
         """Stops the watch task for a specific namespace."""
@@ -89,54 +646,327 @@ class WatchManager:
                     log.debug(
                         "Successfully cancelled watch for namespace '%s'.", namespace
                     )
+            await self._save_snapshot(namespace)
 
     @property
     def watching(self) -> set[str]:
         """Returns a list of namespaces currently being watched."""
         return set(self._tasks.keys())
 
-    def _get_api_call_info(self, namespace: str) -> tuple[Callable, dict]:
+    def _get_api_call_info(
+        self, namespace: str, watch: bool = False
+    ) -> tuple[Callable, dict]:
         """
         Determines the correct API method and keyword arguments based on the
-        provided namespace ("all" or a specific name).
+        provided namespace ("all" or a specific name). watch=True picks the
+        Accept header for watch requests, streaming lists included.
         """
-        return self._api_client.get_api_method_for_resource(
+        list_call, list_kwargs = self._api_client.get_api_method_for_resource(
             model_class=self._model_class,
             action="list",
             namespace=namespace,
         )
+        if self._model_class.metadata_only:
+            accept = PARTIAL_METADATA_ACCEPT if watch else PARTIAL_METADATA_LIST_ACCEPT
+            list_kwargs["_headers"] = {ACCEPT_OVERRIDE_HEADER: accept}
+        elif (
+            self._model_class.server_side_columns
+            and self._watch_config.server_side_columns
+        ):
+            list_kwargs["_headers"] = {ACCEPT_OVERRIDE_HEADER: TABLE_ACCEPT}
+        return list_call, list_kwargs
 
-    async def get_initial_list(
-        self, namespace: str
-    ) -> tuple[Generator[UIRow, None, None], str]:
+    def _table_items(self, table: dict[str, Any]) -> list[dict[str, Any]]:
         """
-        Performs a LIST and returns a generator for the resources and the
-        resource_version for a namespace.
+        Turns the rows of a server-printed Table into items holding the row's
+        object metadata and its cells keyed by column name.
+        """
+        if definitions := table.get("columnDefinitions"):
+            self._table_columns = [column["name"] for column in definitions]
+        return [
+            {
+                "metadata": (row.get("object") or {}).get("metadata") or {},
+                "cells": dict(zip(self._table_columns, row.get("cells") or [])),
+            }
+            for row in table.get("rows") or []
+        ]
+
+    def _get_list_metadata(
+        self,
+        response: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], str, str | None, int | None]:
+        """Extracts items, resourceVersion, continue token and remainingItemCount."""
+        metadata = response.get("metadata") or {}
+        return (
+            self._table_items(response)
+            if response.get("kind") == "Table"
+            else response.get("items") or [],
+            metadata.get("resourceVersion", ""),
+            metadata.get("continue") or None,
+            metadata.get("remainingItemCount"),
+        )
+
+    async def list_pages(
+        self, namespace: str, *, consistent: bool = False
+    ) -> AsyncGenerator[ListPage, None]:
+        """
+        Performs a LIST and yields each page as soon as it has been received.
+        Depending on the scope's last known size and the configured freshness it
+        is read from the watch cache, as one consistent read, or paginated with
+        limit/continue. consistent=True rules out the watch cache. Every page
+        carries the resource version of the listing snapshot, so the last one
+        is safe to start a watch from. If the continue token expires (410) the
+        LIST is restarted once from its first page, marked as restarted.
         """
         list_call, list_kwargs = self._get_api_call_info(namespace)
+        expected = self._expected_count(namespace)
+        strategy = choose_list_strategy(
+            expected, self._watch_config, consistent=consistent
+        )
+        list_kwargs.update(list_request_kwargs(strategy, self._watch_config))
+        list_kwargs["_request_timeout"] = list_timeout(
+            strategy, expected, self._watch_config
+        )
+        self._metrics.record_list_strategy(strategy)
+        log.debug(
+            "Listing %s in '%s' with the %s strategy (last count: %s)",
+            self._model_class.plural,
+            namespace,
+            strategy,
+            expected,
+        )
+        loaded = 0
+        # Time spent by consumers between pages is not part of the LIST.
+        list_seconds = 0.0
+        list_bytes = 0
+        can_restart = True
+        restarted = False
+
+        while True:
+            started = time.perf_counter()
+            try:
+                body = await fetch_bytes(list_call, **list_kwargs)
+            except ApiException as e:
+                if e.status == 410 and "_continue" in list_kwargs and can_restart:
+                    # The snapshot behind the continue token was compacted away.
+                    log.warning(
+                        "Continue token for %s in '%s' expired. Restarting the LIST.",
+                        self._model_class.plural,
+                        namespace,
+                    )
+                    del list_kwargs["_continue"]
+                    can_restart = False
+                    restarted = True
+                    loaded = 0
+                    continue
+                log.error(f"Error getting initial list for {namespace}: {e}")
+                raise
+            except ClientConnectorError as e:
+                log.error(f"Error getting initial list for {namespace}: {e}")
+                raise
+            list_seconds += time.perf_counter() - started
+            list_bytes += len(body)
+
+            items, resource_version, continue_token, remaining = (
+                self._get_list_metadata(orjson.loads(body))
+            )
+            resources = self._build_rows(items)
+            loaded += len(resources)
+            if not continue_token:
+                self._metrics.list_seconds.observe(list_seconds)
+                self._metrics.list_bytes.observe(list_bytes)
+            yield ListPage(resources, resource_version, loaded, remaining, restarted)
+            restarted = False
+
+            if not continue_token:
+                return
+            list_kwargs["_continue"] = continue_token
+
+    async def _open_watch_list(
+        self, namespace: str, *, consistent: bool = False
+    ) -> WatchStream | None:
+        """
+        Opens a streaming list (sendInitialEvents) of a namespace scope, or
+        returns None when the API or the server doesn't support one.
+        consistent=True rules out syncing from the watch cache.
+        """
+        if (
+            not self._watch_config.watch_list
+            or self._api_client.watch_list_supported is False
+        ):
+            return None
+        list_call, list_kwargs = self._get_api_call_info(namespace, watch=True)
+        if not accepts_send_initial_events(list_call):
+            return None
+        if (
+            choose_list_strategy(
+                self._expected_count(namespace),
+                self._watch_config,
+                consistent=consistent,
+            )
+            == "cached"
+        ):
+            # Sync from the watch cache rather than a consistent read.
+            list_kwargs["resource_version"] = "0"
+
+        stream = WatchStream(
+            list_call,
+            idle_timeout=self._watch_config.watch_idle_timeout_seconds,
+            send_initial_events=True,
+            resource_version_match="NotOlderThan",
+            allow_watch_bookmarks=True,
+            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            _request_timeout=watch_timeout(self._watch_config),
+            **list_kwargs,
+        )
         try:
-            response = await list_call(**list_kwargs)
-        except (ApiException, ClientConnectorError) as e:
-            log.error(f"Error getting initial list for {namespace}: {e}")
-            raise
+            await stream.connect()
+        except ApiException as e:
+            # Servers without the WatchList feature reject the options as invalid.
+            if e.status not in (400, 422):
+                raise
+            log.info(
+                "API server does not support streaming lists, falling back to LIST: %s",
+                e.reason,
+            )
+            self._api_client.watch_list_supported = False
+            return None
+        self._api_client.watch_list_supported = True
+        return stream
+
+    async def _watch_list_pages(
+        self, stream: WatchStream
+    ) -> AsyncGenerator[ListPage, None]:
+        """
+        Reads the initial events of a streaming list and yields them as pages,
+        whenever list_page_size objects or a batch window's worth have arrived.
+        The last page is yielded on the bookmark that marks the state as synced
+        and carries its resource version.
+        """
+        page_size = self._watch_config.list_page_size
+        window = self._watch_config.batch_window_seconds
+        started = page_started = time.perf_counter()
+        items: list[dict[str, Any]] = []
+        loaded = 0
 
-        # Determine the items list and resource version based on response type
-        if self._model_class.api_info.client_name == "CustomObjectsApi":
-            items_list = response.get("items", [])
-            resource_version = response.get("metadata", {}).get("resourceVersion", "")
+        async for event in stream:
+            if is_initial_events_end(event):
+                break
+            if event["type"] == "BOOKMARK":
+                continue
+            k8s_object = event["object"]
+            if k8s_object.get("kind") == "Table":
+                items.extend(self._table_items(k8s_object))
+            else:
+                items.append(k8s_object)
+
+            now = time.perf_counter()
+            if len(items) >= page_size or now - page_started >= window:
+                resources = self._build_rows(items)
+                items = []
+                page_started = now
+                loaded += len(resources)
+                yield ListPage(resources, stream.resource_version or "", loaded, None)
         else:
-            items_list = response.items
-            resource_version = response.metadata.resource_version
+            raise ApiException(
+                reason="Watch closed before sending all initial events"
+            )
+
+        resources = self._build_rows(items)
+        loaded += len(resources)
+        self._metrics.list_seconds.observe(time.perf_counter() - started)
+        yield ListPage(resources, stream.resource_version or "", loaded, None)
 
-        def resource_generator() -> Generator[UIRow, None, None]:
-            """A generator that yields model instances one by one."""
-            for item in items_list:
-                yield self._model_class(raw=item)
+    def _resolve_item_type(self) -> str | None:
+        if not self._item_type_resolved:
+            list_call, _ = self._get_api_call_info("all")
+            self._item_type = list_item_type(list_call)
+            self._item_type_resolved = True
+        return self._item_type
 
-        return resource_generator(), resource_version
+    def _decode_items(self, items: list[dict[str, Any]]) -> list[Any]:
+        """
+        Turns JSON objects into the `raw` values rows are built from: attribute
+        views in raw decode mode, generated models otherwise. Custom objects
+        without a generated model stay plain dicts, and so do partial metadata
+        objects when generated models are requested, as they would fail the
+        models' required field validation.
+        """
+        item_type = self._resolve_item_type()
+        if item_type is None or not items:
+            return items
+        if self._model_class.metadata_only and not self._watch_config.raw_decode:
+            return items
+        if self._watch_config.raw_decode:
+            model = getattr(client_models, item_type)
+            return [RawObject(item, model) for item in items]
+        models: list[Any] = self._api_client.deserialize(
+            SimpleNamespace(data=orjson.dumps(items)), f"list[{item_type}]"
+        )
+        return models
+
+    def _build_rows(self, items: list[dict[str, Any]]) -> list[UIRow]:
+        started = time.perf_counter()
+        rows = [self._model_class(raw=raw) for raw in self._decode_items(items)]
+        if (raw_storage := self._watch_config.raw_storage) != "object":
+            for row in rows:
+                row.store_raw(raw_storage)
+        self._metrics.decode_seconds.observe(time.perf_counter() - started)
+        return rows
+
+    async def get_initial_list(
+        self, namespace: str, *, consistent: bool = False
+    ) -> tuple[list[UIRow], str]:
+        """
+        Performs a complete (paginated) LIST and returns the resources and the
+        resource_version for a namespace.
+        """
+        resources: list[UIRow] = []
+        resource_version = ""
+        async for page in self.list_pages(namespace, consistent=consistent):
+            if page.restarted:
+                resources = []
+            resources.extend(page.resources)
+            resource_version = page.resource_version
+        return resources, resource_version
 
-    async def create_watch_task(self, namespace: str, resource_version: str) -> None:
-        """Creates a watch task for a specific namespace and resource version."""
+    async def _relist(
+        self, namespace: str
+    ) -> tuple[list[UIRow], str, WatchStream | None]:
+        """
+        Fetches the current state of a scope whose watch expired, as a streaming
+        list when possible. Returns the resources, their resource version and,
+        for a streaming list, the open stream to continue watching on. The state
+        is always read consistently, as the watch cache may be older than the
+        resource version that expired, and reconciling with it would roll the
+        store back.
+        """
+        stream = await self._open_watch_list(namespace, consistent=True)
+        if stream is None:
+            resources, resource_version = await self.get_initial_list(
+                namespace, consistent=True
+            )
+            return resources, resource_version, None
+
+        resources = []
+        try:
+            async for page in self._watch_list_pages(stream):
+                resources.extend(page.resources)
+        except BaseException:
+            await stream.close()
+            raise
+        return resources, stream.resource_version or "", stream
+
+    async def create_watch_task(
+        self,
+        namespace: str,
+        resource_version: str,
+        stream: WatchStream | None = None,
+    ) -> None:
+        """
+        Creates a watch task for a specific namespace and resource version,
+        optionally continuing on an already open stream.
+        """
         if namespace in self._tasks and not self._tasks[namespace].done():
             log.info("Replacing existing watch task for namespace '%s'", namespace)
             self._tasks[namespace].cancel()
@@ -150,69 +980,111 @@ class WatchManager:
             namespace,
             resource_version,
         )
+        self._resource_versions[namespace] = resource_version
         self._tasks[namespace] = asyncio.create_task(
-            self._start_watch(namespace, resource_version)
+            self._start_watch(namespace, resource_version, stream)
         )
 
-    async def _start_watch(self, namespace: str, resource_version: str) -> None:
-        """The core watch loop using the high-level Watch class, with per-event timeout."""
+    async def _wait_backoff(self, backoff: Backoff) -> None:
+        """Sleeps for the next backoff delay, recording it in the metrics."""
+        delay = backoff.next_delay()
+        self._metrics.backoff_seconds += delay
+        await asyncio.sleep(delay)
+
+    async def _start_watch(
+        self,
+        namespace: str,
+        resource_version: str,
+        initial_stream: WatchStream | None = None,
+    ) -> None:
+        """
+        The core watch loop over a raw JSON watch stream, with an idle timeout.
+        Connections and relists go through the app-wide reconnect governor, and
+        failures are retried with jittered exponential backoff.
+        """
         current_rv = resource_version
+        metrics = self._metrics
+        backoff = Backoff(
+            self._watch_config.reconnect_backoff_base_seconds,
+            self._watch_config.reconnect_backoff_max_seconds,
+        )
+        first_connection = True
+        # A stream left open by a streaming list, to be watched on next.
+        next_stream = initial_stream
 
         while True:
+            if not first_connection:
+                metrics.reconnects += 1
+            first_connection = False
+            stream, next_stream = next_stream, None
             try:
-                list_call, list_kwargs = self._get_api_call_info(namespace)
-                list_kwargs["resource_version"] = current_rv
-                list_kwargs["allow_watch_bookmarks"] = True
-                list_kwargs["timeout_seconds"] = 240
+                if stream is None:
+                    list_call, list_kwargs = self._get_api_call_info(
+                        namespace, watch=True
+                    )
+                    list_kwargs["resource_version"] = current_rv
+                    list_kwargs["allow_watch_bookmarks"] = True
+                    list_kwargs["timeout_seconds"] = WATCH_TIMEOUT_SECONDS
+                    list_kwargs["_request_timeout"] = watch_timeout(self._watch_config)
 
-                log.info(
-                    "Starting watch for %s in namespace '%s' from RV: %s",
-                    self._model_class.plural,
-                    namespace,
-                    current_rv,
-                )
+                    log.info(
+                        "Starting watch for %s in namespace '%s' from RV: %s",
+                        self._model_class.plural,
+                        namespace,
+                        current_rv,
+                    )
+
+                    stream = WatchStream(
+                        list_call,
+                        idle_timeout=self._watch_config.watch_idle_timeout_seconds,
+                        **list_kwargs,
+                    )
+                    async with self._governor.slot(self._model_class):
+                        with request_priority(self._request_priority()):
+                            await stream.connect()
+                async with stream:
+                    try:
+                        async for event in stream:
+                            # Only a delivered event proves the watch is healthy again.
+                            if backoff.attempts:
+                                backoff.reset()
 
-                watch_handler = watch.Watch()
-                async with watch_handler.stream(list_call, **list_kwargs) as stream:
-                    while True:
-                        try:
-                            event = await asyncio.wait_for(
-                                stream.__anext__(), timeout=65
-                            )
-                        except asyncio.TimeoutError:
-                            log.warning(
-                                "Watch timed out due to inactivity (possible network loss). Reconnecting..."
-                            )
-                            break  # Exit inner loop to reconnect
-                        except StopAsyncIteration:
-                            log.info("Watch stream closed by API server after timeout_seconds.")
-                            break
-
-                        if watch_handler.resource_version:
-                            current_rv = watch_handler.resource_version
-
-                        event_type = event["type"]
-                        k8s_object = event["object"]
-
-                        if event_type == "BOOKMARK":
-                            log.debug(
-                                "Received BOOKMARK, updating resource_version to %s",
-                                current_rv,
-                            )
-                            continue
-
-                        model_instance = self._model_class(raw=k8s_object)
-                        event_data = {"resource": model_instance}
-
-                        if event_type == "ADDED":
-                            self._signals.resource_added.publish(event_data)
-                        elif event_type == "MODIFIED":
-                            self._signals.resource_modified.publish(event_data)
-                        elif event_type == "DELETED":
-                            self._signals.resource_deleted.publish(event_data)
+                            if stream.resource_version:
+                                current_rv = stream.resource_version
+                                self._resource_versions[namespace] = current_rv
+
+                            event_type = event["type"]
+                            k8s_object = event["object"]
+
+                            if event_type == "BOOKMARK":
+                                metrics.bookmarks += 1
+                                log.debug(
+                                    "Received BOOKMARK, updating resource_version to %s",
+                                    current_rv,
+                                )
+                                continue
+
+                            metrics.record_event(event_type)
+                            if k8s_object.get("kind") == "Table":
+                                items = self._table_items(k8s_object)
+                            else:
+                                items = [k8s_object]
+                            for model_instance in self._build_rows(items):
+                                change = self._apply_to_store(event_type, model_instance)
+                                if change is not None:
+                                    self._queue_event(model_instance, *change)
+                    except WatchIdleTimeout:
+                        metrics.timeouts += 1
+                        log.warning(
+                            "Watch timed out due to inactivity (possible network loss). Reconnecting..."
+                        )
+                    else:
+                        metrics.stream_closes += 1
+                        log.info("Watch stream closed by API server after timeout_seconds.")
 
             except ApiException as e:
                 if e.status == 410:
+                    metrics.relists += 1
                     log.warning(
                         "Watch RV %s for %s in ns '%s' is too old. Re-listing.",
                         current_rv,
@@ -220,31 +1092,54 @@ class WatchManager:
                         namespace,
                     )
                     try:
-                        _items, new_rv = await self.get_initial_list(namespace)
+                        async with self._governor.slot(self._model_class):
+                            with request_priority(self._request_priority()):
+                                _items, new_rv, next_stream = await self._relist(
+                                    namespace
+                                )
                         current_rv = new_rv
+                        self._resource_versions[namespace] = current_rv
+                        self._record_counts(namespace, _items)
+                        self._flush_events()
+                        self._reconcile_scope(namespace, _items)
+                        backoff.reset()
                         log.info(
                             "Re-listed. Restarting watch for %s in ns '%s' from RV: %s",
                             self._model_class.kind,
                             namespace,
                             new_rv,
                         )
-                        self._signals.resource_full_reset.publish(_items)
                         continue
                     except Exception as relist_exc:
+                        metrics.record_error("relist", relist_exc)
                         log.exception(
-                            "Failed to re-list after 410. Retrying in 15s.",
+                            "Failed to re-list after 410. Backing off.",
                             exc_info=relist_exc,
                         )
-                        await asyncio.sleep(15)
+                        await self._wait_backoff(backoff)
                         continue
                 else:
+                    metrics.record_error("api", e)
                     log.exception(
-                        "API error in watch loop for %s, retrying in 15s.",
+                        "API error in watch loop for %s, backing off.",
                         self._model_class.kind,
                         exc_info=e,
                     )
-                    await asyncio.sleep(15)
+                    await self._wait_backoff(backoff)
                     continue
+            except ValueError as decode_exc:
+                # A malformed or truncated event line (orjson.JSONDecodeError is
+                # a ValueError). Like a dropped connection, resume from the last
+                # resource version.
+                metrics.record_error("decode", decode_exc)
+                log.warning(
+                    "Undecodable watch event for %s in ns '%s': %s — reconnecting.",
+                    self._model_class.kind,
+                    namespace,
+                    decode_exc,
+                )
+                await self._wait_backoff(backoff)
+                continue
             except asyncio.CancelledError:
                 # Task was cancelled, exit cleanly
                 log.debug("Watch task for %s in ns '%s' was cancelled", self._model_class.kind, namespace)
@@ -257,12 +1152,32 @@ class WatchManager:
                 socket.gaierror,
                 OSError,
             ) as net_exc:
+                metrics.record_error("network", net_exc)
                 log.warning(
-                    "Client-side network error: %s — reconnecting in 10s.", net_exc
+                    "Client-side network error: %s — backing off before reconnecting.",
+                    net_exc,
                 )
-                await asyncio.sleep(10)
+                await self._wait_backoff(backoff)
                 continue
 
+    def _reconcile_scope(self, namespace: str, resources: list[UIRow]) -> None:
+        """
+        Merges a fresh listing of a namespace scope into the store and publishes
+        synthetic ADDED/MODIFIED/DELETED events for the differences only.
+        """
+        listed_uids = {resource.uid for resource in resources}
+        vanished = [
+            row for row in self._scope_rows(namespace) if row.uid not in listed_uids
+        ]
+
+        for resource in resources:
+            if change := self._apply_to_store("ADDED", resource):
+                self._queue_event(resource, *change)
+        for resource in vanished:
+            if change := self._apply_to_store("DELETED", resource):
+                self._queue_event(resource, *change)
+        self._flush_events()
+
     @property
     def signals(self) -> WatchManagerSignal:
         return self._signals
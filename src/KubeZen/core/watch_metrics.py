@@ -0,0 +1,154 @@
+"""Counters and latency histograms describing one WatchManager's pipeline."""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+import math
+import time
+
+# How many recent observations a histogram keeps for its percentiles.
+HISTOGRAM_WINDOW = 1024
+# The sliding window the event rate is computed over.
+RATE_WINDOW_SECONDS = 10
+
+
+@dataclass
+class Histogram:
+    """
+    Keeps lifetime count, sum and maximum of a series of observations along
+    with the most recent ones, from which percentiles are estimated.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    _recent: deque[float] = field(
+        default_factory=lambda: deque(maxlen=HISTOGRAM_WINDOW),
+        init=False,
+        repr=False,
+    )
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self._recent.append(value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Returns the q-th percentile (0-100) of the recent observations."""
+        recent = sorted(self._recent)
+        if not recent:
+            return 0.0
+        index = min(len(recent) - 1, math.ceil(q / 100 * len(recent)) - 1)
+        return recent[max(index, 0)]
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max,
+        }
+
+
+@dataclass
+class WatchMetrics:
+    """
+    Watch pipeline statistics of one model class. The watch loop records into
+    it on the loop the manager runs on, while the render latency is recorded
+    by the UI; readers should use snapshot().
+    """
+
+    started_at: float = field(default_factory=time.monotonic)
+    # Events received from the API server, by type. Synthetic events from a
+    # relist are not counted.
+    events: dict[str, int] = field(default_factory=dict)
+    bookmarks: int = 0
+    # Watch connections opened after the first one of a namespace scope.
+    reconnects: int = 0
+    # Inactivity timeouts and streams closed by the server.
+    timeouts: int = 0
+    stream_closes: int = 0
+    # Full LISTs after a 410 Gone.
+    relists: int = 0
+    # Failures by kind: "api", "network" and "relist".
+    errors: dict[str, int] = field(default_factory=dict)
+    last_error: str | None = None
+    # Time spent sleeping before reconnecting.
+    backoff_seconds: float = 0.0
+    # MODIFIED events dropped because no displayed column changed.
+    suppressed_events: int = 0
+    # LISTs performed, by strategy: "cached", "consistent" and "paged".
+    list_strategies: dict[str, int] = field(default_factory=dict)
+
+    # Seconds spent turning JSON into rows.
+    decode_seconds: Histogram = field(default_factory=Histogram)
+    # Seconds from an event arriving to its batch being applied to a table.
+    render_latency_seconds: Histogram = field(default_factory=Histogram)
+    # Duration and size of complete (all pages) LISTs.
+    list_seconds: Histogram = field(default_factory=Histogram)
+    list_bytes: Histogram = field(default_factory=Histogram)
+
+    _rate_buckets: deque[list[int]] = field(
+        default_factory=lambda: deque(maxlen=RATE_WINDOW_SECONDS + 1),
+        init=False,
+        repr=False,
+    )
+
+    def record_event(self, event_type: str) -> None:
+        self.events[event_type] = self.events.get(event_type, 0) + 1
+        second = int(time.monotonic())
+        if self._rate_buckets and self._rate_buckets[-1][0] == second:
+            self._rate_buckets[-1][1] += 1
+        else:
+            self._rate_buckets.append([second, 1])
+
+    def record_list_strategy(self, strategy: str) -> None:
+        self.list_strategies[strategy] = self.list_strategies.get(strategy, 0) + 1
+
+    def record_error(self, kind: str, error: BaseException) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    @property
+    def total_events(self) -> int:
+        return sum(self.events.values())
+
+    def events_per_second(self) -> float:
+        """The event rate over the last RATE_WINDOW_SECONDS full seconds."""
+        now = int(time.monotonic())
+        recent = sum(
+            count
+            for second, count in list(self._rate_buckets)
+            if now - RATE_WINDOW_SECONDS <= second < now
+        )
+        return recent / RATE_WINDOW_SECONDS
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns a point-in-time copy as plain data, safe from any thread."""
+        return {
+            "uptime_seconds": time.monotonic() - self.started_at,
+            "events": dict(self.events),
+            "events_per_second": self.events_per_second(),
+            "bookmarks": self.bookmarks,
+            "reconnects": self.reconnects,
+            "timeouts": self.timeouts,
+            "stream_closes": self.stream_closes,
+            "relists": self.relists,
+            "errors": dict(self.errors),
+            "last_error": self.last_error,
+            "backoff_seconds": self.backoff_seconds,
+            "suppressed_events": self.suppressed_events,
+            "list_strategies": dict(self.list_strategies),
+            "decode_seconds": self.decode_seconds.summary(),
+            "render_latency_seconds": self.render_latency_seconds.summary(),
+            "list_seconds": self.list_seconds.summary(),
+            "list_bytes": self.list_bytes.summary(),
+        }
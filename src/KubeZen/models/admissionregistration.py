@@ -12,7 +12,7 @@ from .base import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseAdmissionRegistrationV1Row(UIRow, ABC):
     """Base class for Admission Registration V1 API resources."""
 
@@ -32,7 +32,7 @@ class BaseAdmissionRegistrationV1Row(UIRow, ABC):
             object.__setattr__(self, "webhooks", "0")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MutatingWebhookConfigurationRow(BaseAdmissionRegistrationV1Row):
     """Represents a MutatingWebhookConfiguration for UI display."""
 
@@ -48,7 +48,7 @@ class MutatingWebhookConfigurationRow(BaseAdmissionRegistrationV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidatingWebhookConfigurationRow(BaseAdmissionRegistrationV1Row):
     """Represents a ValidatingWebhookConfiguration for UI display."""
 
@@ -13,7 +13,7 @@ from .base import (
 from kubernetes_asyncio.client import V1Deployment
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseAppsV1Row(UIRow, ABC):
     """Base class for Apps V1 API resources."""
 
@@ -27,7 +27,7 @@ class BaseAppsV1Row(UIRow, ABC):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeploymentRow(BaseAppsV1Row):
     """Represents a Deployment for UI display."""
 
@@ -80,7 +80,7 @@ class DeploymentRow(BaseAppsV1Row):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DaemonSetRow(BaseAppsV1Row):
     """Represents a DaemonSet for UI display."""
 
@@ -117,7 +117,7 @@ class DaemonSetRow(BaseAppsV1Row):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplicaSetRow(BaseAppsV1Row):
     """Represents a ReplicaSet for UI display."""
 
@@ -145,7 +145,7 @@ class ReplicaSetRow(BaseAppsV1Row):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatefulSetRow(BaseAppsV1Row):
     """Represents a StatefulSet for UI display."""
 
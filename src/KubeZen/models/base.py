@@ -3,19 +3,30 @@ from __future__ import annotations
 import logging
 from abc import abstractmethod, ABCMeta, ABC
 from dataclasses import dataclass, field, fields
-from datetime import datetime
-from typing import Any, ClassVar, Optional, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Any, ClassVar, Literal, Optional, Dict, get_args
 from functools import lru_cache
+import inspect
+import re
 
 from jsonpath_ng import JSONPath
 from jsonpath_ng.exceptions import JsonPathParserError
 from jsonpath_ng.ext import parse as jsonpath_parse
 
 import ciso8601
+import orjson
+from rich.text import Text
+
+from .raw import RawObject
 
 
 log = logging.getLogger(__name__)
 
+# An age as the API server prints it in Tables, e.g. 45s, 3m10s, 5h or 2y31d.
+_PRINTED_AGE = re.compile(r"(?:\d+[ydhms])+")
+_PRINTED_AGE_UNIT = re.compile(r"(\d+)([ydhms])")
+_AGE_UNIT_SECONDS = {"y": 365 * 86400, "d": 86400, "h": 3600, "m": 60, "s": 1}
+
 
 @lru_cache(maxsize=256)
 def _get_cached_jsonpath_expression(path: str) -> JSONPath:
@@ -32,6 +43,8 @@ class ModelMeta(ABCMeta):
 
     def __new__(mcs, name, bases, dct) -> ModelMeta:
         cls = super().__new__(mcs, name, bases, dct)
+        if "__slots__" in dct:
+            _rebind_class_cells(cls, dct)
 
         # Do not run checks on abstract base classes.
         # We identify them by checking for the presence of abc.ABC in their bases
@@ -60,6 +73,57 @@ class ModelMeta(ABCMeta):
         return cls
 
 
+def _rebind_class_cells(cls: type, namespace: dict[str, Any]) -> None:
+    """
+    Points zero-argument super() in a class's methods at the class itself.
+    dataclass(slots=True) replaces the class it decorates with a new one, but
+    before Python 3.14 the methods it copies over still refer to the original.
+    """
+    for member in namespace.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        if isinstance(member, property):
+            functions = [member.fget, member.fset, member.fdel]
+        else:
+            functions = [member]
+        for function in functions:
+            # Unwrap decorators such as lru_cache to reach the actual function.
+            function = inspect.unwrap(function) if function is not None else None
+            code = getattr(function, "__code__", None)
+            closure = getattr(function, "__closure__", None)
+            if code is None or closure is None or "__class__" not in code.co_freevars:
+                continue
+            cell = closure[code.co_freevars.index("__class__")]
+            if cell.cell_contents is not cls:
+                cell.cell_contents = cls
+
+
+# How rows keep the object they were built from. "object" keeps it as is,
+# "bytes" keeps it serialized and decodes it on access, and "evict" drops it,
+# to be fetched again when an action needs it.
+RawStorage = Literal["object", "bytes", "evict"]
+RAW_STORAGE_MODES: tuple[RawStorage, ...] = get_args(RawStorage)
+
+
+class RawEvicted(LookupError):
+    """Raised when reading the raw object of a row that doesn't keep one."""
+
+
+class SerializedRaw:
+    """A row's raw object as JSON, decoded again on every access."""
+
+    __slots__ = ("data", "model")
+
+    def __init__(self, data: bytes, model: type | None) -> None:
+        self.data = data
+        # The generated model a RawObject stood in for, or None for a dict.
+        self.model = model
+
+    def load(self) -> Any:
+        item = orjson.loads(self.data)
+        return item if self.model is None else RawObject(item, self.model)
+
+
 @dataclass(frozen=True)
 class Category:
     """A simple dataclass to hold category information."""
@@ -210,11 +274,14 @@ def column_field(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UIRow(ABC, metaclass=ModelMeta):
     """
     The most generic abstract base class for any row that can be displayed in the UI.
     It cannot be instantiated directly.
+
+    Rows are slotted: models declare their dataclass with slots=True and their
+    abstract bases with empty __slots__, so a row holds only its fields.
     """
 
     # --- Subclasses must define API Metadata (Class-level) ---
@@ -226,9 +293,21 @@ class UIRow(ABC, metaclass=ModelMeta):
     category: ClassVar[str]
     index: ClassVar[int]
     omit_name_column: ClassVar[bool] = False
-
-    raw: Any = field(repr=False, compare=False)
+    # Rows that only display metadata are listed and watched as
+    # PartialObjectMetadata, so object bodies are never downloaded.
+    metadata_only: ClassVar[bool] = False
+    # Rows whose columns the API server can compute are listed and watched as
+    # Tables. `raw` is then {"metadata": ..., "cells": {column name: value}}.
+    server_side_columns: ClassVar[bool] = False
+    # Rows of kinds holding credentials are never persisted to disk.
+    sensitive: ClassVar[bool] = False
+
+    # The object the row was built from, in the form store_raw() chose.
+    _raw: Any = field(init=False, repr=False, compare=False)
     uid: str = field(init=False, repr=False, compare=False)
+    resource_version: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
     namespace: str | None = field(default=None, init=False)
     name: str = field(
         init=False,
@@ -248,6 +327,12 @@ class UIRow(ABC, metaclass=ModelMeta):
         """
         super().__init_subclass__(**kwargs)
         if getattr(cls, "namespaced", False):
+            # Classes derived from a processed model, including the copy that
+            # dataclass(slots=True) makes of each model, already have it.
+            inherited = getattr(cls, "__dataclass_fields__", {}).get("namespace")
+            if inherited is not None and "column" in inherited.metadata:
+                return
+
             # Define the field with its metadata.
             namespace_field = field(
                 init=False,
@@ -273,7 +358,7 @@ class UIRow(ABC, metaclass=ModelMeta):
     @abstractmethod
     def __init__(self, raw: Any) -> None:
         """Initialize the row with data from the raw Kubernetes resource."""
-        object.__setattr__(self, "raw", raw)
+        object.__setattr__(self, "_raw", raw)
 
         metadata = raw.get("metadata", {}) if isinstance(raw, dict) else raw.metadata
         object.__setattr__(
@@ -286,6 +371,15 @@ class UIRow(ABC, metaclass=ModelMeta):
             "name",
             metadata.get("name") if isinstance(metadata, dict) else metadata.name,
         )
+        object.__setattr__(
+            self,
+            "resource_version",
+            (
+                metadata.get("resourceVersion")
+                if isinstance(metadata, dict)
+                else getattr(metadata, "resource_version", None)
+            ),
+        )
 
         # Always set the namespace attribute for internal consistency.
         # The column will only be shown for namespaced resources via __init_subclass__.
@@ -296,7 +390,9 @@ class UIRow(ABC, metaclass=ModelMeta):
         )
         object.__setattr__(self, "namespace", namespace)
 
-        # Always set the age attribute. Subclasses can add an 'age' column field if needed.
+        # Subclasses can add an 'age' column field if needed.
+        if "age" not in self.__dataclass_fields__:
+            return
         age = (
             metadata.get("creationTimestamp")
             if isinstance(metadata, dict)
@@ -306,6 +402,39 @@ class UIRow(ABC, metaclass=ModelMeta):
             age = UIRow.to_datetime(age)
         object.__setattr__(self, "age", age)
 
+    @property
+    def raw(self) -> Any:
+        """
+        The Kubernetes object the row was built from. Raises RawEvicted for
+        rows that dropped it; KubernetesClient.read_full_object() fetches it.
+        """
+        raw = self._raw
+        if type(raw) is SerializedRaw:
+            return raw.load()
+        if raw is None:
+            raise RawEvicted(f"{self.kind} {self.name} doesn't keep its object")
+        return raw
+
+    @property
+    def has_raw(self) -> bool:
+        """Whether `raw` can be read without fetching the object again."""
+        return self._raw is not None
+
+    def store_raw(self, storage: RawStorage) -> None:
+        """
+        Switches how the row keeps its raw object, once the row is built.
+        Generated client models can't be serialized cheaply and are kept as is.
+        """
+        raw = self._raw
+        if storage == "evict":
+            raw = None
+        elif storage == "bytes":
+            if isinstance(raw, RawObject):
+                raw = SerializedRaw(orjson.dumps(raw.data), raw.model)
+            elif isinstance(raw, dict):
+                raw = SerializedRaw(orjson.dumps(raw), None)
+        object.__setattr__(self, "_raw", raw)
+
     def _resolve_path(self, obj: Any, path: str) -> Any:
         """
         Resolves a path on an object. Uses a custom resolver for simple dot-notation
@@ -386,6 +515,21 @@ class UIRow(ABC, metaclass=ModelMeta):
         columns = cls.get_columns()
         return [c["key"] for c in columns] if columns else []
 
+    def column_fingerprint(self) -> tuple[Any, ...]:
+        """
+        The displayed column values, in get_column_keys() order, in a form where
+        any visible difference compares unequal. Rich Text equality ignores
+        styles, so Text cells are compared by their plain text and styles.
+        """
+        return tuple(
+            (
+                (value.plain, str(value.style), tuple(value.spans))
+                if isinstance(value, Text)
+                else value
+            )
+            for value in (getattr(self, key, None) for key in self.get_column_keys())
+        )
+
     @classmethod
     @lru_cache(maxsize=32)
     def get_time_tracked_fields(cls) -> dict[Any, str]:
@@ -402,6 +546,21 @@ class UIRow(ABC, metaclass=ModelMeta):
     def to_datetime(timestamp: Any) -> datetime:
         return ciso8601.parse_datetime(timestamp)
 
+    @staticmethod
+    def printed_age_to_datetime(age: Any) -> datetime | None:
+        """
+        Turns an age the API server printed in a Table cell back into an
+        approximate timestamp, so it keeps ticking like other ages. Returns None
+        for cells such as <unknown> or <invalid>.
+        """
+        if not isinstance(age, str) or not _PRINTED_AGE.fullmatch(age):
+            return None
+        seconds = sum(
+            int(amount) * _AGE_UNIT_SECONDS[unit]
+            for amount, unit in _PRINTED_AGE_UNIT.findall(age)
+        )
+        return datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
     @staticmethod
     def format_datetime_string(ts_str: str | None) -> str:
         if not ts_str:
@@ -18,7 +18,7 @@ import logging
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseBatchV1Row(UIRow, ABC):
     """Base class for Batch V1 API resources."""
 
@@ -32,7 +32,7 @@ class BaseBatchV1Row(UIRow, ABC):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRow(BaseBatchV1Row):
     """Represents a Job for UI display."""
 
@@ -68,7 +68,7 @@ class JobRow(BaseBatchV1Row):
         return "Unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CronJobRow(BaseBatchV1Row):
     """Represents a CronJob for UI display."""
 
@@ -19,6 +19,8 @@ from KubeZen.utils import sanitize_timestamp_str
 class BaseCoreV1Row(UIRow, ABC):
     """Base class for Core V1 API resources."""
 
+    __slots__ = ()
+
     api_info: ClassVar[ApiInfo] = core_v1_api
 
     @abstractmethod
@@ -26,7 +28,7 @@ class BaseCoreV1Row(UIRow, ABC):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeRow(BaseCoreV1Row):
     """A simple dataclass to hold resource information."""
 
@@ -111,7 +113,7 @@ class NodeRow(BaseCoreV1Row):
         return ",".join(sorted(list(roles)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NamespaceRow(BaseCoreV1Row):
     """Represents a Namespace for UI display."""
 
@@ -133,7 +135,7 @@ class NamespaceRow(BaseCoreV1Row):
         object.__setattr__(self, "status", self.raw.status.phase)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventRow(BaseCoreV1Row):
     """Represents an Event for UI display."""
 
@@ -178,7 +180,7 @@ class EventRow(BaseCoreV1Row):
         object.__setattr__(self, "last_seen", self.raw.last_timestamp)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigMapRow(BaseCoreV1Row):
     """Represents a ConfigMap for UI display."""
 
@@ -189,6 +191,7 @@ class ConfigMapRow(BaseCoreV1Row):
     display_name: ClassVar[str] = "Config Maps"
     category: ClassVar[str] = CATEGORIES["Config"].name
     index: ClassVar[int] = 0
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -198,7 +201,7 @@ class ConfigMapRow(BaseCoreV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecretRow(BaseCoreV1Row):
     """Represents a Secret for UI display."""
 
@@ -209,6 +212,8 @@ class SecretRow(BaseCoreV1Row):
     display_name: ClassVar[str] = "Secrets"
     category: ClassVar[str] = CATEGORIES["Config"].name
     index: ClassVar[int] = 1
+    metadata_only: ClassVar[bool] = True
+    sensitive: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -218,7 +223,7 @@ class SecretRow(BaseCoreV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceAccountRow(BaseCoreV1Row):
     """Represents a ServiceAccount for UI display."""
 
@@ -229,6 +234,7 @@ class ServiceAccountRow(BaseCoreV1Row):
     display_name: ClassVar[str] = "Service Accounts"
     category: ClassVar[str] = CATEGORIES["Access Control"].name
     index: ClassVar[int] = 0
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -238,7 +244,7 @@ class ServiceAccountRow(BaseCoreV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceRow(BaseCoreV1Row):
     """Represents a Service for UI display."""
 
@@ -278,7 +284,7 @@ class ServiceRow(BaseCoreV1Row):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResourceQuotaRow(BaseCoreV1Row):
     """Represents a ResourceQuota for UI display."""
 
@@ -289,6 +295,7 @@ class ResourceQuotaRow(BaseCoreV1Row):
     display_name: ClassVar[str] = "Resource Quotas"
     category: ClassVar[str] = CATEGORIES["Config"].name
     index: ClassVar[int] = 2
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -298,7 +305,7 @@ class ResourceQuotaRow(BaseCoreV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersistentVolumeRow(BaseCoreV1Row):
     """Represents a PersistentVolume for UI display."""
 
@@ -328,7 +335,7 @@ class PersistentVolumeRow(BaseCoreV1Row):
         object.__setattr__(self, "claim", self.raw.spec.claim_ref.name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersistentVolumeClaim(BaseCoreV1Row):
     """Represents a PersistentVolumeClaim for UI display."""
 
@@ -358,7 +365,7 @@ class PersistentVolumeClaim(BaseCoreV1Row):
         object.__setattr__(self, "storage_class", self.raw.spec.storage_class_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LimitRangeRow(BaseCoreV1Row):
     """Represents a LimitRange for UI display."""
 
@@ -369,6 +376,7 @@ class LimitRangeRow(BaseCoreV1Row):
     display_name: ClassVar[str] = "Limit Ranges"
     category: ClassVar[str] = CATEGORIES["Config"].name
     index: ClassVar[int] = 3
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -378,7 +386,7 @@ class LimitRangeRow(BaseCoreV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Endpoint(BaseCoreV1Row):
     """Represents an Endpoint for UI display."""
 
@@ -424,7 +432,7 @@ class Endpoint(BaseCoreV1Row):
         return ", ".join(formatted_endpoints)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PodRow(BaseCoreV1Row):
     """A data class representing the view model for a Kubernetes Pod."""
 
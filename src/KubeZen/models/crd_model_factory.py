@@ -1,8 +1,10 @@
 from __future__ import annotations
+from abc import ABC
 from datetime import datetime
-from kubernetes_asyncio.client.models import V1CustomResourceDefinition
-from dataclasses import make_dataclass, Field
+from dataclasses import asdict, dataclass, make_dataclass, replace, Field
+from types import CodeType
 from typing import Type, cast, Union, Any
+import threading
 from KubeZen.models.base import (
     UIRow,
     CATEGORIES,
@@ -10,76 +12,194 @@ from KubeZen.models.base import (
     column_field,
     ApiInfo,
 )
+from KubeZen.models.jsonpath_accessor import UnsupportedPath, accessor_source
 
 log = logging.getLogger(__name__)
 
 
-def create_model_from_crd(crd: V1CustomResourceDefinition) -> Type[UIRow]:
-    spec = crd.spec
-    group = spec.group
-    names = spec.names
-    plural = names.plural
-    kind = names.kind
-    scope = spec.scope
-    versions = spec.versions
+@dataclass(frozen=True)
+class CRDInfo:
+    """What a table model needs from a CRD, leaving out its schemas."""
 
-    storage_version = next((v for v in versions if v.storage), versions[0])
-    storage_version_name = storage_version.name
-    printer_cols = getattr(storage_version, "additional_printer_columns", []) or []
+    name: str
+    uid: str
+    resource_version: str
+    group: str
+    kind: str
+    plural: str
+    scope: str
+    # The storage version, which the model reads and watches.
+    version: str
+    # (name, jsonPath) of the storage version's additional printer columns.
+    printer_columns: tuple[tuple[str, str], ...]
 
-    fields: list[tuple[str, Type[Union[str, datetime]], Field]] = [
-        ("age", datetime, column_field(label="Age", is_age=True, index=999))
-    ]
+    @classmethod
+    def from_crd(cls, crd: dict[str, Any]) -> CRDInfo:
+        """Extracts the info from a CRD decoded from JSON."""
+        metadata = crd["metadata"]
+        spec = crd["spec"]
+        versions = spec["versions"]
+        storage_version = next((v for v in versions if v.get("storage")), versions[0])
+        return cls(
+            name=metadata["name"],
+            uid=metadata["uid"],
+            resource_version=metadata["resourceVersion"],
+            group=spec["group"],
+            kind=spec["names"]["kind"],
+            plural=spec["names"]["plural"],
+            scope=spec["scope"],
+            version=storage_version["name"],
+            printer_columns=tuple(
+                (col["name"], col["jsonPath"])
+                for col in storage_version.get("additionalPrinterColumns") or ()
+            ),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CRDInfo:
+        return cls(
+            **{**data, "printer_columns": tuple(map(tuple, data["printer_columns"]))}
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def same_model(self, other: CRDInfo) -> bool:
+        """Whether both result in the same model, e.g. after a status update."""
+        identity: dict[str, Any] = {
+            "uid": other.uid,
+            "resource_version": other.resource_version,
+        }
+        return replace(self, **identity) == other
+
+
+# (field name, label, is_age, index) of one printer column.
+ColumnSpec = tuple[str, str, bool, int]
+
+# Models with the same columns share one dataclass base, so the costly dataclass
+# processing runs once per distinct set of columns rather than once per CRD.
+# Operators' CRDs mostly repeat a handful of column sets.
+_model_bases: dict[tuple[tuple[ColumnSpec, ...], bool], type[UIRow]] = {}
+_model_bases_lock = threading.Lock()
+
+
+def generate_accessors(crd: CRDInfo) -> tuple[tuple[ColumnSpec, ...], CodeType]:
+    """
+    Derives the columns of a CRD's model and compiles the __init__ that fills
+    them, along with an accessor function per column JSONPath. All of it only
+    depends on the CRD, so it can be cached per CRD version.
+    """
+    columns: list[ColumnSpec] = []
+    accessor_sources: list[str] = []
 
-    init_body_lines = ["super(self.__class__, self).__init__(raw)"]
+    init_body_lines = [
+        "super(self.__class__, self).__init__(raw)",
+        # Cells are present when the API server printed the row as a Table.
+        "cells = raw.get('cells') if isinstance(raw, dict) else None",
+    ]
 
-    for i, col in enumerate(printer_cols):
-        if col.name.lower() == "age":
+    for i, (label, json_path) in enumerate(crd.printer_columns):
+        if label.lower() == "age":
             continue
 
-        label = col.name
-        source_path = col.json_path.lstrip(".")
+        source_path = json_path.lstrip(".")
         is_age = "lastTransitionTime" in source_path
         field_name = f"col_{label.lower().replace(' ', '_').replace('-', '_')}"
 
-        fields.append(
-            (field_name, str, column_field(label=label, is_age=is_age, index=2 + i))
-        )
-
-        init_body_lines.append(f"val = self._resolve_path(raw, {repr(source_path)})")
+        columns.append((field_name, label, is_age, 2 + i))
 
+        init_body_lines.append("if cells is not None:")
         if is_age:
-            init_body_lines.append("if isinstance(val, str):")
-            init_body_lines.append("    val = UIRow.to_datetime(val)")
-            init_body_lines.append(f"object.__setattr__(self, '{field_name}', val)")
+            # The API server prints date columns as ages, such as 5d.
+            init_body_lines.append(
+                f"    val = UIRow.printed_age_to_datetime(cells.get({repr(label)}))"
+            )
         else:
-            init_body_lines.append(f"object.__setattr__(self, '{field_name}', val)")
+            init_body_lines.append(f"    val = cells.get({repr(label)})")
+        init_body_lines.append("else:")
+        try:
+            accessor_sources.append(accessor_source(source_path, f"_column{i}"))
+            init_body_lines.append(f"    val = _column{i}(raw)")
+        except UnsupportedPath as e:
+            log.debug("Evaluating column %r of %s with jsonpath-ng: %s", label, crd.name, e)
+            init_body_lines.append(f"    val = self._resolve_path(raw, {repr(source_path)})")
+        if is_age:
+            init_body_lines.append("    if isinstance(val, str):")
+            init_body_lines.append("        val = UIRow.to_datetime(val)")
+
+        init_body_lines.append(f"object.__setattr__(self, '{field_name}', val)")
 
     full_init_src = "def __init__(self, raw):\n" + "\n".join(
         f"    {line}" for line in init_body_lines
     )
-    local_ns: dict[str, Any] = {}
-    exec(full_init_src, globals(), local_ns)
-    custom_init = local_ns["__init__"]
-
-    model_cls = make_dataclass(
-        kind + "Row",
-        fields,
-        bases=(UIRow,),
-        frozen=True,
-        namespace={
+    source = "\n".join([*accessor_sources, full_init_src])
+    return tuple(columns), compile(source, f"<{crd.kind}Row>", "exec")
+
+
+def _model_base(columns: tuple[ColumnSpec, ...], namespaced: bool) -> type[UIRow]:
+    """Returns the dataclass holding a set of columns, creating it on first use."""
+    key = (columns, namespaced)
+    with _model_bases_lock:
+        if (base := _model_bases.get(key)) is None:
+            fields: list[tuple[str, Type[Union[str, datetime]], Field]] = [
+                ("age", datetime, column_field(label="Age", is_age=True, index=999))
+            ]
+            for field_name, label, is_age, index in columns:
+                fields.append(
+                    (field_name, str, column_field(label=label, is_age=is_age, index=index))
+                )
+            base = make_dataclass(
+                "CustomResourceRow",
+                fields,
+                # An abstract base, so the model class checks skip it.
+                bases=(UIRow, ABC),
+                frozen=True,
+                slots=True,
+                # Every model brings its own generated __init__.
+                init=False,
+                namespace={"namespaced": namespaced},
+            )
+            _model_bases[key] = base
+    return base
+
+
+def build_model(
+    crd: CRDInfo, columns: tuple[ColumnSpec, ...], init_code: CodeType
+) -> Type[UIRow]:
+    """Creates a CRD's model from the output of generate_accessors()."""
+    # The accessors and __init__ share one namespace, so __init__ finds them.
+    model_ns: dict[str, Any] = {"UIRow": UIRow}
+    exec(init_code, model_ns)
+    custom_init = model_ns["__init__"]
+
+    namespaced = crd.scope == "Namespaced"
+    base = _model_base(columns, namespaced)
+    # ModelMeta. Calling type(base) directly reads as type[type[UIRow]] to mypy.
+    metaclass: type = type(base)
+    model_cls = metaclass(
+        crd.kind + "Row",
+        (base,),
+        {
+            "__module__": __name__,
+            "__slots__": (),
             "__init__": custom_init,
-            "kind": kind,
-            "plural": plural,
-            "namespaced": scope == "Namespaced",
-            "display_name": kind,
+            "kind": crd.kind,
+            "plural": crd.plural,
+            "namespaced": namespaced,
+            "display_name": crd.kind,
             "category": CATEGORIES["Custom Resources"].name,
             "api_info": ApiInfo(
                 client_name="CustomObjectsApi",
-                group=group,
-                version=storage_version_name,
+                group=crd.group,
+                version=crd.version,
             ),
             "index": 99,
+            "server_side_columns": True,
+            "crd_info": crd,
         },
     )
     return cast(Type[UIRow], model_cls)
+
+
+def create_model_from_crd(crd: CRDInfo) -> Type[UIRow]:
+    return build_model(crd, *generate_accessors(crd))
@@ -10,7 +10,7 @@ from .base import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CustomResourceDefinitionRow(UIRow):
     """Represents a Custom Resource Definition for UI display."""
 
@@ -10,7 +10,7 @@ from .base import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HorizontalPodAutoscalerRow(UIRow):
     """Represents a HorizontalPodAutoscaler for UI display."""
 
@@ -15,6 +15,8 @@ from .base import (
 class BaseNetworkingV1Row(UIRow, ABC):
     """Base class for Networking V1 API resources."""
 
+    __slots__ = ()
+
     api_info: ClassVar[ApiInfo] = networking_v1_api
     category: ClassVar[str] = CATEGORIES["Network"].name
 
@@ -23,7 +25,7 @@ class BaseNetworkingV1Row(UIRow, ABC):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngressRow(BaseNetworkingV1Row):
     """Represents an Ingress for UI display."""
 
@@ -50,7 +52,7 @@ class IngressRow(BaseNetworkingV1Row):
         object.__setattr__(self, "class_name", self.raw.spec.ingress_class_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngressClassRow(BaseNetworkingV1Row):
     """Represents an IngressClass for UI display."""
 
@@ -73,10 +75,10 @@ class IngressClassRow(BaseNetworkingV1Row):
         object.__setattr__(self, "controller", self.raw.spec.controller)
         object.__setattr__(self, "api_group", self.raw.spec.api_group)
         object.__setattr__(self, "scope", self.raw.spec.scope)
-        object.__setattr__(self, "kind", self.raw.spec.kind)
+        object.__setattr__(self, "kind_resource", self.raw.spec.kind)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkPolicyRow(BaseNetworkingV1Row):
     """Represents a NetworkPolicy for UI display."""
 
@@ -10,7 +10,7 @@ from .base import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PodDisruptionBudgetRow(UIRow):
     """Represents a PodDisruptionBudget for UI display."""
 
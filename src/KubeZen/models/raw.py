@@ -0,0 +1,116 @@
+"""Attribute access to raw Kubernetes JSON without building client models."""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, cast
+import re
+
+import ciso8601
+from kubernetes_asyncio.client import models as client_models
+
+_PASSTHROUGH_TYPES = frozenset({"str", "int", "float", "bool", "date", "object"})
+_DICT_TYPE = re.compile(r"dict\(([^,]*), (.*)\)")
+
+
+def _to_datetime(value: Any) -> Any:
+    try:
+        return ciso8601.parse_datetime(value)
+    except (TypeError, ValueError):
+        return value
+
+
+@lru_cache(maxsize=None)
+def _converter(type_name: str) -> Callable[[Any], Any] | None:
+    """
+    Returns a function turning JSON into what the generated client would have
+    produced for an OpenAPI type name, or None if the JSON value is used as is.
+    """
+    if type_name in _PASSTHROUGH_TYPES:
+        return None
+    if type_name == "datetime":
+        return _to_datetime
+
+    if type_name.startswith("list["):
+        item_converter = _converter(type_name[5:-1])
+        if item_converter is None:
+            return None
+        return lambda value: [item_converter(item) for item in value]
+
+    if match := _DICT_TYPE.match(type_name):
+        value_converter = _converter(match.group(2))
+        if value_converter is None:
+            return None
+        return lambda value: {key: value_converter(item) for key, item in value.items()}
+
+    model = getattr(client_models, type_name, None)
+    if model is None:
+        return None
+    return lambda value: RawObject(value, model) if isinstance(value, dict) else value
+
+
+class RawObject:
+    """
+    A read-only view over a JSON object that answers the same snake_case
+    attributes as the generated kubernetes_asyncio model it stands in for.
+    Nested values are converted lazily, on first access, and then cached.
+    """
+
+    __slots__ = ("_data", "_model", "_cache")
+
+    def __init__(self, data: dict[str, Any], model: type) -> None:
+        self._data = data
+        # A generated model class, with its openapi_types and attribute_map.
+        self._model: Any = model
+        self._cache: dict[str, Any] = {}
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The underlying JSON object."""
+        return self._data
+
+    @property
+    def model(self) -> type:
+        """The generated model class this object stands in for."""
+        return cast(type, self._model)
+
+    # Exposed so ApiClient.sanitize_for_serialization can embed these objects
+    # in request bodies exactly like generated models.
+    @property
+    def openapi_types(self) -> dict[str, str]:
+        return cast(dict[str, str], self._model.openapi_types)
+
+    @property
+    def attribute_map(self) -> dict[str, str]:
+        return cast(dict[str, str], self._model.attribute_map)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _SLOTS:
+            # Only reached on a half-built instance (e.g. while copying).
+            raise AttributeError(name)
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+
+        type_name = self._model.openapi_types.get(name)
+        if type_name is None:
+            raise AttributeError(
+                f"'{self._model.__name__}' object has no attribute '{name}'"
+            )
+        value = self._data.get(self._model.attribute_map[name])
+        if value is not None and (converter := _converter(type_name)):
+            value = converter(value)
+        cache[name] = value
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawObject):
+            return NotImplemented
+        return self._model is other._model and self._data == other._data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RawObject({self._model.__name__}, {self._data!r})"
+
+
+_SLOTS = frozenset(RawObject.__slots__)
@@ -15,6 +15,8 @@ from .base import (
 class BaseRbacAuthorizationV1Row(UIRow, ABC):
     """Base class for RBAC Authorization V1 API resources."""
 
+    __slots__ = ()
+
     api_info: ClassVar[ApiInfo] = rbac_authorization_v1_api
     category: ClassVar[str] = CATEGORIES["Access Control"].name
 
@@ -23,7 +25,7 @@ class BaseRbacAuthorizationV1Row(UIRow, ABC):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleRow(BaseRbacAuthorizationV1Row):
     """Represents a Role for UI display."""
 
@@ -34,6 +36,7 @@ class RoleRow(BaseRbacAuthorizationV1Row):
     display_name: ClassVar[str] = "Roles"
     category: ClassVar[str] = CATEGORIES["Access Control"].name
     index: ClassVar[int] = 1
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -43,7 +46,7 @@ class RoleRow(BaseRbacAuthorizationV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterRoleRow(BaseRbacAuthorizationV1Row):
     """Represents a ClusterRole for UI display."""
 
@@ -53,6 +56,7 @@ class ClusterRoleRow(BaseRbacAuthorizationV1Row):
     namespaced: ClassVar[bool] = False
     display_name: ClassVar[str] = "Cluster Roles"
     index: ClassVar[int] = 3
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -62,7 +66,7 @@ class ClusterRoleRow(BaseRbacAuthorizationV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleBindingRow(BaseRbacAuthorizationV1Row):
     """Represents a RoleBinding for UI display."""
 
@@ -72,6 +76,7 @@ class RoleBindingRow(BaseRbacAuthorizationV1Row):
     namespaced: ClassVar[bool] = True
     display_name: ClassVar[str] = "Role Bindings"
     index: ClassVar[int] = 2
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -81,7 +86,7 @@ class RoleBindingRow(BaseRbacAuthorizationV1Row):
         super().__init__(raw=raw)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterRoleBindingRow(BaseRbacAuthorizationV1Row):
     """Represents a ClusterRoleBinding for UI display."""
 
@@ -91,6 +96,7 @@ class ClusterRoleBindingRow(BaseRbacAuthorizationV1Row):
     namespaced: ClassVar[bool] = False
     display_name: ClassVar[str] = "Cluster Role Bindings"
     index: ClassVar[int] = 4
+    metadata_only: ClassVar[bool] = True
 
     # --- Instance Fields ---
     age: str = column_field(label="Age", width=10, is_age=True)
@@ -10,7 +10,7 @@ from .base import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeClassRow(UIRow):
     """Represents a RuntimeClass for UI display."""
 
@@ -11,7 +11,7 @@ from kubernetes_asyncio.client import V1StorageClass
 from typing import cast
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageClassRow(UIRow):
     """Represents a StorageClass for UI display."""
 
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Static
+
+if TYPE_CHECKING:
+    from ..app import KubeZen
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _size(num_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f}{unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}GiB"
+
+
+class WatchMetricsScreen(ModalScreen[None]):
+    """A debug screen showing live watch pipeline metrics for every kind."""
+
+    app: "KubeZen"  # type: ignore[assignment]
+
+    BINDINGS = [
+        ("escape", "dismiss", "Close"),
+    ]
+
+    DEFAULT_CSS = """
+    WatchMetricsScreen {
+        align: center middle;
+    }
+
+    #watch_metrics_dialog {
+        width: 95%;
+        height: 80%;
+        padding: 1;
+        border: thick $primary;
+        background: $boost;
+    }
+
+    #watch_metrics_dialog DataTable {
+        height: 1fr;
+    }
+
+    #watch_metrics_dialog #pool_metrics, #watch_metrics_dialog #rate_limit_metrics {
+        height: auto;
+        max-height: 8;
+    }
+    """
+
+    COLUMNS = (
+        "Kind",
+        "Added",
+        "Modified",
+        "Deleted",
+        "Events/s",
+        "Suppressed",
+        "Bookmarks",
+        "Reconnects",
+        "Timeouts",
+        "Relists",
+        "Errors",
+        "Decode p50/p95",
+        "Render p50/p95",
+        "LIST p95",
+        "LIST size",
+        "Last error",
+    )
+
+    POOL_COLUMNS = (
+        "Pool",
+        "In use",
+        "Limit",
+        "Waiting",
+        "Requests",
+        "Created",
+        "Reused",
+        "Wait p50/p95",
+        "Wait max",
+    )
+
+    RATE_LIMIT_COLUMNS = (
+        "Priority",
+        "Requests",
+        "Throttled",
+        "Waiting",
+        "Delay p50/p95",
+        "Delay max",
+    )
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="watch_metrics_dialog"):
+            yield Static("Watch Metrics (refreshed every second, Esc to close)")
+            yield DataTable(id="kind_metrics", cursor_type="row", zebra_stripes=True)
+            yield DataTable(id="pool_metrics", cursor_type="row", zebra_stripes=True)
+            yield DataTable(
+                id="rate_limit_metrics", cursor_type="row", zebra_stripes=True
+            )
+
+    def on_mount(self) -> None:
+        self.query_one("#kind_metrics", DataTable).add_columns(*self.COLUMNS)
+        self.query_one("#pool_metrics", DataTable).add_columns(*self.POOL_COLUMNS)
+        self.query_one("#rate_limit_metrics", DataTable).add_columns(
+            *self.RATE_LIMIT_COLUMNS
+        )
+        self._refresh_metrics()
+        self.set_interval(1, self._refresh_metrics, name="Watch Metrics")
+
+    def _row(self, plural: str, metrics: dict[str, Any]) -> tuple[str, ...]:
+        events = metrics["events"]
+        decode = metrics["decode_seconds"]
+        render = metrics["render_latency_seconds"]
+        return (
+            plural,
+            str(events.get("ADDED", 0)),
+            str(events.get("MODIFIED", 0)),
+            str(events.get("DELETED", 0)),
+            f"{metrics['events_per_second']:.1f}",
+            str(metrics["suppressed_events"]),
+            str(metrics["bookmarks"]),
+            str(metrics["reconnects"]),
+            str(metrics["timeouts"]),
+            str(metrics["relists"]),
+            str(sum(metrics["errors"].values())),
+            f"{_ms(decode['p50'])}/{_ms(decode['p95'])}",
+            f"{_ms(render['p50'])}/{_ms(render['p95'])}",
+            _ms(metrics["list_seconds"]["p95"]),
+            _size(metrics["list_bytes"]["max"]),
+            metrics["last_error"] or "",
+        )
+
+    def _pool_row(self, pool: str, metrics: dict[str, Any]) -> tuple[str, ...]:
+        wait = metrics["wait_seconds"]
+        return (
+            pool,
+            str(metrics["in_use"]),
+            str(metrics["limit"]),
+            str(metrics["waiting"]),
+            str(metrics["requests"]),
+            str(metrics["created"]),
+            str(metrics["reused"]),
+            f"{_ms(wait['p50'])}/{_ms(wait['p95'])}",
+            _ms(wait["max"]),
+        )
+
+    def _rate_limit_row(
+        self, priority: str, metrics: dict[str, Any]
+    ) -> tuple[str, ...]:
+        delay = metrics["delay_seconds"]
+        return (
+            priority,
+            str(metrics["requests"]),
+            str(metrics["throttled"]),
+            str(metrics["waiting"]),
+            f"{_ms(delay['p50'])}/{_ms(delay['p95'])}",
+            _ms(delay["max"]),
+        )
+
+    def _update_table(self, table: DataTable, rows: dict[str, tuple[str, ...]]) -> None:
+        for key, row in sorted(rows.items()):
+            if key in table.rows:
+                for column_key, value in zip(table.columns, row):
+                    table.update_cell(key, column_key, value)
+            else:
+                table.add_row(*row, key=key)
+
+    def _refresh_metrics(self) -> None:
+        registry = self.app.informer_registry
+        self._update_table(
+            self.query_one("#kind_metrics", DataTable),
+            {
+                plural: self._row(plural, metrics)
+                for plural, metrics in registry.metrics().items()
+            },
+        )
+        self._update_table(
+            self.query_one("#pool_metrics", DataTable),
+            {
+                pool: self._pool_row(pool, metrics)
+                for pool, metrics in registry.transport_metrics().items()
+            },
+        )
+        self._update_table(
+            self.query_one("#rate_limit_metrics", DataTable),
+            {
+                priority: self._rate_limit_row(priority, metrics)
+                for priority, metrics in registry.rate_limit_metrics().items()
+            },
+        )
@@ -0,0 +1,178 @@
+"""
+An in-process stand-in for the Kubernetes API server, so the watch pipeline
+can be exercised through the real generated client and connection pools.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
+
+import orjson
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kubernetes_asyncio.client import Configuration
+
+from KubeZen.config import TransportConfig, WatchConfig
+from KubeZen.core.kubernetes_client import KubernetesClient
+from KubeZen.core.watch_manager import WatchManager
+from KubeZen.models.base import UIRow
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def metadata(
+    name: str, namespace: str | None = None, rv: str = "1"
+) -> dict[str, Any]:
+    meta: dict[str, Any] = {
+        "name": name,
+        "uid": f"uid-{namespace}-{name}",
+        "resourceVersion": rv,
+        "creationTimestamp": "2024-05-01T10:00:00Z",
+    }
+    if namespace is not None:
+        meta["namespace"] = namespace
+    return meta
+
+
+def pod(name: str, namespace: str = "default", rv: str = "1") -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": metadata(name, namespace, rv),
+        "spec": {
+            "nodeName": "node-1",
+            "containers": [{"name": "app", "image": "app:1"}],
+        },
+        "status": {
+            "phase": "Running",
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "ready": True,
+                    "restartCount": 2,
+                    "image": "app:1",
+                    "imageID": "",
+                    "state": {"running": {"startedAt": "2024-05-01T10:00:04Z"}},
+                }
+            ],
+        },
+    }
+
+
+def namespace(name: str, rv: str = "1") -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Namespace",
+        "metadata": metadata(name, rv=rv),
+        "status": {"phase": "Active"},
+    }
+
+
+def object_list(
+    kind: str, items: list[dict[str, Any]], rv: str = "10", **meta: Any
+) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": f"{kind}List",
+        "metadata": {"resourceVersion": rv, **meta},
+        "items": items,
+    }
+
+
+def status(code: int, reason: str, message: str = "") -> web.Response:
+    """An error response shaped like the API server's metav1.Status."""
+    return web.json_response(
+        {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "status": "Failure",
+            "reason": reason,
+            "message": message,
+            "code": code,
+        },
+        status=code,
+    )
+
+
+async def watch_events(
+    request: web.Request, events: list[dict[str, Any]]
+) -> web.StreamResponse:
+    """Streams watch events, one JSON document per line, then ends the watch."""
+    response = web.StreamResponse(headers={"Content-Type": "application/json"})
+    await response.prepare(request)
+    for event in events:
+        await response.write(orjson.dumps(event) + b"\n")
+    await response.write_eof()
+    return response
+
+
+def is_watch(request: web.Request) -> bool:
+    return request.query.get("watch", "").lower() == "true"
+
+
+@dataclass
+class FakeApp:
+    """The parts of the app a WatchManager uses. Signals aren't delivered."""
+
+    kubernetes_client: KubernetesClient
+    cache_dir: Path
+    watch: WatchConfig = field(
+        default_factory=lambda: WatchConfig(snapshot_cache=False)
+    )
+
+    is_attached = False
+    _pruning = False
+
+    @property
+    def config(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            watch=self.watch, paths=SimpleNamespace(cache_dir=self.cache_dir)
+        )
+
+
+class FakeAPIServer:
+    """
+    Serves handlers registered per path and records the query and Accept
+    header of every request.
+    """
+
+    def __init__(self) -> None:
+        self._app = web.Application()
+        self._server: TestServer | None = None
+        self.requests: list[dict[str, str]] = []
+        self.accepts: list[str] = []
+        self.client: KubernetesClient | None = None
+        self._apps: list[FakeApp] = []
+
+    def route(self, path: str, handler: Handler) -> None:
+        async def recording(request: web.Request) -> web.StreamResponse:
+            self.requests.append(dict(request.query))
+            self.accepts.append(request.headers.get("Accept", ""))
+            return await handler(request)
+
+        self._app.router.add_get(path, recording)
+
+    async def __aenter__(self) -> FakeAPIServer:
+        self._server = TestServer(self._app)
+        await self._server.start_server()
+        configuration = Configuration(host=str(self._server.make_url("")).rstrip("/"))
+        self.client = KubernetesClient(configuration, TransportConfig())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        assert self._server is not None and self.client is not None
+        await self.client.close()
+        await self._server.close()
+
+    def watch_manager(
+        self, model_class: type[UIRow], cache_dir: Path, **watch: Any
+    ) -> WatchManager:
+        """A WatchManager using this server, with snapshots off unless asked for."""
+        assert self.client is not None
+        watch.setdefault("snapshot_cache", False)
+        app = FakeApp(self.client, cache_dir, WatchConfig(**watch))
+        # Signals only hold a weak reference to their owner.
+        self._apps.append(app)
+        return WatchManager(app, model_class)  # type: ignore[arg-type]
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from KubeZen.models.crd_model_factory import CRDInfo, create_model_from_crd
+
+from .fake_apiserver import metadata
+
+WIDGET = CRDInfo(
+    name="widgets.example.com",
+    uid="crd-uid",
+    resource_version="1",
+    group="example.com",
+    kind="Widget",
+    plural="widgets",
+    scope="Namespaced",
+    version="v1",
+    printer_columns=(
+        ("Ready", '.status.conditions[?(@.type=="Ready")].status'),
+        ("Since", ".status.conditions[0].lastTransitionTime"),
+        ("Age", ".metadata.creationTimestamp"),
+    ),
+)
+
+
+def table_row(**cells: str) -> dict:
+    """An item as WatchManager builds it from a server-printed Table row."""
+    return {"metadata": metadata("w", "default"), "cells": cells}
+
+
+@pytest.mark.parametrize(
+    "printed, age",
+    [
+        ("45s", timedelta(seconds=45)),
+        ("3m10s", timedelta(minutes=3, seconds=10)),
+        ("5h", timedelta(hours=5)),
+        ("5d", timedelta(days=5)),
+        ("2y31d", timedelta(days=2 * 365 + 31)),
+    ],
+)
+def test_table_age_cells_become_timestamps(printed, age):
+    model = create_model_from_crd(WIDGET)
+    row = model(raw=table_row(Ready="True", Since=printed))
+    assert row.col_ready == "True"
+    expected = datetime.now(timezone.utc) - age
+    assert abs(row.col_since - expected) < timedelta(seconds=5)
+
+
+@pytest.mark.parametrize("printed", ["<unknown>", "<invalid>", "", None])
+def test_unprintable_table_age_cells_are_empty(printed):
+    model = create_model_from_crd(WIDGET)
+    row = model(raw=table_row(Ready="False", Since=printed))
+    assert row.col_since is None
+
+
+def test_object_age_columns_parse_timestamps():
+    model = create_model_from_crd(WIDGET)
+    row = model(
+        raw={
+            "metadata": metadata("w", "default"),
+            "status": {
+                "conditions": [
+                    {
+                        "type": "Ready",
+                        "status": "True",
+                        "lastTransitionTime": "2024-05-01T10:00:05Z",
+                    }
+                ]
+            },
+        }
+    )
+    assert row.col_ready == "True"
+    assert row.col_since == datetime(2024, 5, 1, 10, 0, 5, tzinfo=timezone.utc)
@@ -0,0 +1,89 @@
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+
+import KubeZen.core.crd_watcher as crd_watcher
+from KubeZen.config import DiscoveryConfig, WatchConfig
+from KubeZen.core.crd_watcher import CRDModelChanges, CRDWatcher
+
+from .test_crd_model_factory import WIDGET
+
+
+class WatcherApp:
+    """The parts of the app a CRDWatcher uses. Signals aren't delivered."""
+
+    is_attached = False
+    _pruning = False
+    kubernetes_client = SimpleNamespace(ApiextensionsV1Api=None)
+    config = SimpleNamespace(discovery=DiscoveryConfig(), watch=WatchConfig())
+
+
+def test_crds_whose_model_failed_to_build_are_retried(monkeypatch):
+    create_model = crd_watcher.create_model_from_crd
+    failing = True
+
+    def flaky_create_model(crd):
+        if failing:
+            raise ValueError("unsupported schema")
+        return create_model(crd)
+
+    monkeypatch.setattr(crd_watcher, "create_model_from_crd", flaky_create_model)
+
+    async def main() -> None:
+        nonlocal failing
+        app = WatcherApp()
+        watcher = CRDWatcher(app, [])  # type: ignore[arg-type]
+        published: list[CRDModelChanges] = []
+        monkeypatch.setattr(watcher.models_changed, "publish", published.append)
+
+        await watcher._apply({WIDGET.name: WIDGET})
+        assert published == []
+
+        # A status update of the same CRD version must still build the model.
+        failing = False
+        await watcher._apply({WIDGET.name: replace(WIDGET, resource_version="2")})
+        [changes] = published
+        assert [model.kind for model in changes.added.values()] == ["Widget"]
+
+    asyncio.run(main())
+
+
+def test_unexpected_errors_back_off_instead_of_ending_the_watch(monkeypatch):
+    attempts = 0
+    watching = asyncio.Event()
+
+    async def fetch_crds(crd_client, known, config):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise KeyError("metadata")
+        return {}, "7"
+
+    async def get_current_context():
+        return "test"
+
+    monkeypatch.setattr(crd_watcher, "fetch_crds", fetch_crds)
+
+    async def main() -> None:
+        app = WatcherApp()
+        app.kubernetes_client = SimpleNamespace(  # type: ignore[misc]
+            ApiextensionsV1Api=None, get_current_context=get_current_context
+        )
+        app.config = SimpleNamespace(  # type: ignore[misc]
+            discovery=DiscoveryConfig(),
+            watch=WatchConfig(reconnect_backoff_base_seconds=0.01),
+        )
+        watcher = CRDWatcher(app, [])  # type: ignore[arg-type]
+
+        async def watch(resource_version, backoff):
+            assert resource_version == "7"
+            watching.set()
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(watcher, "_watch", watch)
+        watcher.start()
+        await asyncio.wait_for(watching.wait(), 5)
+        assert attempts == 2
+        await watcher.stop()
+
+    asyncio.run(main())
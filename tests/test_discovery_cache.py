@@ -0,0 +1,47 @@
+import os
+import stat
+
+import pytest
+
+from KubeZen.core.discovery_cache import DiscoveryCache
+from KubeZen.models.crd_model_factory import generate_accessors
+
+from .test_crd_model_factory import WIDGET
+
+
+def generated_models() -> dict:
+    return {WIDGET.uid: (WIDGET.resource_version, *generate_accessors(WIDGET))}
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_caches_are_private_to_the_user(tmp_path):
+    (tmp_path / "discovery").mkdir(mode=0o755)
+    cache = DiscoveryCache(tmp_path)
+    cache.save("ctx", {WIDGET.name: WIDGET})
+    cache.save_models("ctx", generated_models())
+
+    assert mode(tmp_path / "discovery") == 0o700
+    files = list((tmp_path / "discovery").iterdir())
+    assert len(files) == 2
+    assert all(mode(file) == 0o600 for file in files)
+    assert cache.load("ctx").crds == {WIDGET.name: WIDGET}
+    assert cache.load_models("ctx").keys() == {WIDGET.uid}
+
+
+def test_model_caches_others_can_write_are_ignored(tmp_path):
+    cache = DiscoveryCache(tmp_path)
+    cache.save_models("ctx", generated_models())
+    [path] = (tmp_path / "discovery").iterdir()
+    path.chmod(0o666)
+    assert cache.load_models("ctx") == {}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX ownership")
+def test_model_caches_of_other_users_are_ignored(tmp_path, monkeypatch):
+    cache = DiscoveryCache(tmp_path)
+    cache.save_models("ctx", generated_models())
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(tmp_path).st_uid + 1)
+    assert cache.load_models("ctx") == {}
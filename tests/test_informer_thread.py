@@ -0,0 +1,20 @@
+import threading
+
+import pytest
+from kubernetes_asyncio.client import Configuration
+
+import KubeZen.core.informer_thread as informer_thread
+from KubeZen.config import TransportConfig
+from KubeZen.core.informer_thread import InformerThread
+
+
+def test_start_raises_what_building_the_client_failed_with(monkeypatch):
+    def failing_client(*args):
+        raise FileNotFoundError("ca.crt")
+
+    monkeypatch.setattr(informer_thread, "KubernetesClient", failing_client)
+    thread = InformerThread(Configuration(), TransportConfig())
+
+    with pytest.raises(FileNotFoundError):
+        thread.start()
+    assert "kubezen-informers" not in {t.name for t in threading.enumerate()}
@@ -0,0 +1,158 @@
+import asyncio
+
+import orjson
+import pytest
+from aiohttp import web
+from kubernetes_asyncio.client import CoreV1Api, CustomObjectsApi, EventsV1Api
+
+from KubeZen.core.json_api import WatchIdleTimeout, WatchStream, list_item_type
+from KubeZen.models.base import RawEvicted
+from KubeZen.models.core import NamespaceRow, PodRow
+
+from .fake_apiserver import FakeAPIServer, namespace, object_list, pod
+
+
+def test_list_item_type_of_generated_list_methods():
+    assert list_item_type(CoreV1Api.list_namespaced_pod) == "V1Pod"
+    assert list_item_type(CoreV1Api.list_namespaced_event) == "CoreV1Event"
+    assert list_item_type(EventsV1Api.list_event_for_all_namespaces) == "EventsV1Event"
+    assert list_item_type(CustomObjectsApi.list_namespaced_custom_object) is None
+
+
+def test_list_decodes_typed_rows(tmp_path):
+    async def pods(request: web.Request) -> web.Response:
+        return web.json_response(object_list("Pod", [pod("web-1"), pod("web-2")]))
+
+    async def namespaces(request: web.Request) -> web.Response:
+        return web.json_response(object_list("Namespace", [namespace("default")]))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route("/api/v1/namespaces/default/pods", pods)
+        server.route("/api/v1/namespaces", namespaces)
+        async with server:
+            for raw_decode in (True, False):
+                pod_rows, resource_version = await server.watch_manager(
+                    PodRow, tmp_path, raw_decode=raw_decode, watch_list=False
+                ).get_initial_list("default")
+                assert resource_version == "10"
+                assert [row.name for row in pod_rows] == ["web-1", "web-2"]
+                assert pod_rows[0].status == "Running"
+                assert pod_rows[0].restarts == 2
+                assert pod_rows[0].node == "node-1"
+
+                namespace_rows, _ = await server.watch_manager(
+                    NamespaceRow, tmp_path, raw_decode=raw_decode, watch_list=False
+                ).get_initial_list("all")
+                assert [row.status for row in namespace_rows] == ["Active"]
+
+    asyncio.run(main())
+
+
+def stalling_watch(events: int, interval: float, stalled: asyncio.Event):
+    """A watch handler sending events at an interval, then going silent."""
+
+    async def pods(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        for i in range(events):
+            event = {"type": "ADDED", "object": pod(f"web-{i}", rv=str(i + 1))}
+            await response.write(orjson.dumps(event) + b"\n")
+            await asyncio.sleep(interval)
+        await stalled.wait()
+        return response
+
+    return pods
+
+
+def test_silent_watch_fails_with_an_idle_timeout(tmp_path):
+    async def main() -> None:
+        stalled = asyncio.Event()
+        server = FakeAPIServer()
+        server.route("/api/v1/namespaces/default/pods", stalling_watch(1, 0, stalled))
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path)
+            list_call, list_kwargs = manager._get_api_call_info("default", watch=True)
+            received = []
+            stream = WatchStream(list_call, idle_timeout=0.2, **list_kwargs)
+
+            async def read() -> None:
+                async with stream:
+                    async for event in stream:
+                        received.append(event["object"]["metadata"]["name"])
+
+            try:
+                with pytest.raises(WatchIdleTimeout):
+                    # Bounded, so a broken watchdog fails instead of hanging.
+                    await asyncio.wait_for(read(), 5)
+            finally:
+                stalled.set()
+            assert received == ["web-0"]
+            assert stream.resource_version == "1"
+
+    asyncio.run(main())
+
+
+def test_watch_receiving_data_is_not_idle(tmp_path):
+    async def main() -> None:
+        stalled = asyncio.Event()
+        server = FakeAPIServer()
+        # Each event comes well within the idle timeout, all of them past it.
+        server.route(
+            "/api/v1/namespaces/default/pods", stalling_watch(6, 0.05, stalled)
+        )
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path)
+            list_call, list_kwargs = manager._get_api_call_info("default", watch=True)
+            received = 0
+            try:
+                async with WatchStream(
+                    list_call, idle_timeout=0.15, **list_kwargs
+                ) as stream:
+                    async for _ in stream:
+                        received += 1
+                        if received == 6:
+                            break
+            finally:
+                stalled.set()
+            assert received == 6
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("raw_decode", [True, False])
+def test_rows_keep_their_raw_object_as_raw_storage_asks(tmp_path, raw_decode):
+    async def pods(request: web.Request) -> web.Response:
+        return web.json_response(object_list("Pod", [pod("web-1")]))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route("/api/v1/namespaces/default/pods", pods)
+        async with server:
+            for raw_storage in ("object", "bytes"):
+                rows, _ = await server.watch_manager(
+                    PodRow,
+                    tmp_path,
+                    raw_decode=raw_decode,
+                    raw_storage=raw_storage,
+                    watch_list=False,
+                ).get_initial_list("default")
+                assert rows[0].has_raw
+                assert rows[0].raw.metadata.name == "web-1"
+                assert rows[0].status == "Running"
+
+            rows, _ = await server.watch_manager(
+                PodRow,
+                tmp_path,
+                raw_decode=raw_decode,
+                raw_storage="evict",
+                watch_list=False,
+            ).get_initial_list("default")
+            assert not rows[0].has_raw
+            # The columns were read before the object was dropped.
+            assert rows[0].name == "web-1"
+            assert rows[0].status == "Running"
+            with pytest.raises(RawEvicted):
+                rows[0].raw
+
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+import pytest
+
+from KubeZen.models.base import UIRow
+from KubeZen.models.jsonpath_accessor import (
+    UnsupportedPath,
+    accessor_source,
+    compile_jsonpath,
+)
+
+# Printer column paths as CRDs declare them, minus the leading dot.
+PATHS = [
+    "spec.replicas",
+    "spec.secretName",
+    "spec.issuerRef.name",
+    "metadata.labels.app",
+    "status.conditions[0].type",
+    "status.conditions[-1].status",
+    "status.conditions[*].type",
+    'status.conditions[?(@.type=="Ready")].status',
+    "status.conditions[?(@.type=='Ready')].message",
+    'status.conditions[?(@.type!="Ready")].type',
+    'status.conditions[?(@.type=="Ready")].reason',
+    "status.conditions[?(@.reason)].type",
+    "status.conditions[?(@.detail.code)].type",
+    'status.conditions[?(@.detail.code=="E1")].type',
+    "spec.list[*].n",
+    "spec.list[*].n.m",
+    "spec.list[0].n",
+    "spec.list[*]",
+    "spec.list[*][0]",
+    "spec.map.*",
+    "spec.map.*.n",
+    "spec.name[0]",
+    "spec.name[*]",
+    "spec.ports[*].port",
+    'metadata.annotations["example.com/owner"]',
+]
+
+OBJECTS = [
+    {},
+    {"spec": None, "status": None},
+    {"spec": {"list": None, "map": None, "name": None}},
+    {
+        "metadata": {
+            "labels": {"app": "web"},
+            "annotations": {"example.com/owner": "team-a"},
+        },
+        "spec": {
+            "replicas": 3,
+            "secretName": "web-tls",
+            "issuerRef": {"name": "letsencrypt"},
+            "list": [{"n": None}, {"n": 3}, {"m": 1}],
+            "map": {"a": {"n": 1}, "b": None},
+            "name": "web",
+            "ports": [{"port": 80}, {"name": "no-port"}, {"port": 443}],
+        },
+        "status": {
+            "conditions": [
+                {"type": "Issuing", "status": "False", "reason": None},
+                {"type": "Ready", "status": "True", "message": "Up to date"},
+                {"status": "Unknown", "reason": "NoType", "detail": {"code": None}},
+                {"type": None, "reason": "", "detail": {"code": "E1"}},
+            ]
+        },
+    },
+    {
+        "spec": {
+            "list": [None, {"n": {"m": None}}, {"n": {"m": 2}}],
+            "map": {"a": None, "b": {"n": None}},
+            "name": "",
+            "ports": [],
+        },
+        "status": {
+            "conditions": [
+                {"type": "Ready", "reason": "Done"},
+                {"type": "Ready", "status": "False"},
+            ]
+        },
+    },
+    {
+        "spec": {"list": {"n": "not a list"}, "map": ["not", "a", "map"], "name": 5},
+        "status": {"conditions": {"type": "Ready", "status": "True"}},
+    },
+    {"spec": {"list": [[None, 1], [2]], "map": {}, "name": "x"}},
+    {"spec": {"list": "text"}, "status": {"conditions": [None, "Ready", 7]}},
+    {"spec": {"list": 0, "map": {"a": 0}, "name": True}},
+]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_compiled_accessors_match_jsonpath_ng(path):
+    accessor = compile_jsonpath(path)
+    for obj in OBJECTS:
+        # _resolve_path doesn't use the row, so it can be called unbound.
+        expected = UIRow._resolve_path(None, obj, path)  # type: ignore[arg-type]
+        assert accessor(obj) == expected, (obj, accessor_source(path, "accessor"))
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "status..type",
+        "status.conditions[?(@.count==3)].type",
+        "status.conditions[?(@.ready==true)].type",
+        "status.conditions[?(@.type==null)].status",
+        "status.conditions[0:2].type",
+    ],
+)
+def test_unsupported_paths_are_left_to_jsonpath_ng(path):
+    with pytest.raises(UnsupportedPath):
+        compile_jsonpath(path)
+
+
+def test_a_null_first_match_is_the_result():
+    accessor = compile_jsonpath("spec.list[*].n")
+    assert accessor({"spec": {"list": [{"n": None}, {"n": 3}]}}) is None
+    assert accessor({"spec": {"list": [{}, {"n": 3}]}}) == 3
+
+
+def test_inequality_filters_skip_items_without_the_field():
+    accessor = compile_jsonpath('status.conditions[?(@.type!="Ready")].status')
+    conditions = [{"status": "Unknown"}, {"type": "Issuing", "status": "False"}]
+    assert accessor({"status": {"conditions": conditions}}) == "False"
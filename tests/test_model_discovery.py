@@ -0,0 +1,123 @@
+import asyncio
+
+from aiohttp import web
+
+from KubeZen.config import DiscoveryConfig
+from KubeZen.core.model_discovery import fetch_crds
+
+from .fake_apiserver import FakeAPIServer, metadata, object_list, status
+from .test_crd_model_factory import WIDGET
+
+CRDS_PATH = "/apis/apiextensions.k8s.io/v1/customresourcedefinitions"
+
+
+def crd(kind: str) -> dict:
+    plural = f"{kind.lower()}s"
+    return {
+        "apiVersion": "apiextensions.k8s.io/v1",
+        "kind": "CustomResourceDefinition",
+        "metadata": metadata(f"{plural}.example.com", rv="5"),
+        "spec": {
+            "group": "example.com",
+            "names": {"kind": kind, "plural": plural},
+            "scope": "Namespaced",
+            "versions": [{"name": "v1", "storage": True}],
+        },
+    }
+
+
+CRDS = {item["metadata"]["name"]: item for item in map(crd, ["Widget", "Gadget"])}
+
+
+def test_cold_start_lists_full_crds_in_pages():
+    async def crds(request: web.Request) -> web.StreamResponse:
+        assert "PartialObjectMetadata" not in request.headers["Accept"]
+        assert request.query["limit"] == "1"
+        widget, gadget = CRDS.values()
+        if "continue" not in request.query:
+            return web.json_response(
+                object_list(
+                    "CustomResourceDefinition", [widget], **{"continue": "p2"}
+                )
+            )
+        assert request.query["continue"] == "p2"
+        return web.json_response(object_list("CustomResourceDefinition", [gadget]))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(CRDS_PATH, crds)
+        async with server:
+            assert server.client is not None
+            found, resource_version = await fetch_crds(
+                server.client.ApiextensionsV1Api, {}, DiscoveryConfig(page_size=1)
+            )
+            assert len(server.requests) == 2
+
+        assert resource_version == "10"
+        assert sorted(found) == sorted(CRDS)
+
+    asyncio.run(main())
+
+
+def changed_crds_server(reads: list[str]) -> FakeAPIServer:
+    """Serves the CRDs, with their metadata changed since WIDGET was cached."""
+
+    async def crds(request: web.Request) -> web.StreamResponse:
+        if "limit" in request.query:
+            return web.json_response(
+                object_list("CustomResourceDefinition", list(CRDS.values()))
+            )
+        assert "as=PartialObjectMetadataList;" in request.headers["Accept"]
+        items = [{"metadata": item["metadata"]} for item in CRDS.values()]
+        # A CRD deleted between the LIST and its read is skipped.
+        items.append({"metadata": metadata("gone.example.com", rv="6")})
+        return web.json_response(object_list("PartialObjectMetadata", items))
+
+    async def read_crd(request: web.Request) -> web.StreamResponse:
+        name = request.match_info["name"]
+        reads.append(name)
+        if name not in CRDS:
+            return status(404, "NotFound")
+        return web.json_response(CRDS[name])
+
+    server = FakeAPIServer()
+    server.route(CRDS_PATH, crds)
+    server.route(CRDS_PATH + "/{name}", read_crd)
+    return server
+
+
+def test_few_changed_crds_are_read_one_by_one():
+    reads: list[str] = []
+
+    async def main() -> None:
+        async with changed_crds_server(reads) as server:
+            assert server.client is not None
+            found, resource_version = await fetch_crds(
+                server.client.ApiextensionsV1Api,
+                {WIDGET.name: WIDGET},
+                DiscoveryConfig(),
+            )
+
+        assert resource_version == "10"
+        assert sorted(found) == sorted(CRDS)
+        assert sorted(reads) == sorted([*CRDS, "gone.example.com"])
+
+    asyncio.run(main())
+
+
+def test_many_changed_crds_are_listed_instead():
+    reads: list[str] = []
+
+    async def main() -> None:
+        async with changed_crds_server(reads) as server:
+            assert server.client is not None
+            found, _ = await fetch_crds(
+                server.client.ApiextensionsV1Api,
+                {WIDGET.name: WIDGET},
+                DiscoveryConfig(max_individual_reads=2),
+            )
+
+        assert sorted(found) == sorted(CRDS)
+        assert reads == []
+
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from typing import Any, Coroutine
+
+from KubeZen.core.rate_limiter import RateLimiter, RequestPriority
+
+
+class OtherLoop:
+    """An event loop on its own thread, standing in for the informer thread."""
+
+    def __enter__(self) -> "OtherLoop":
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> asyncio.Future:
+        return asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        )
+
+
+async def wait_for_waiters(
+    limiter: RateLimiter, priority: RequestPriority, count: int
+) -> None:
+    while limiter.metrics[priority].waiting != count:
+        await asyncio.sleep(0.001)
+
+
+def test_requests_of_two_loops_share_the_budget_and_priority_order():
+    async def main() -> None:
+        limiter = RateLimiter(qps=20, burst=2)
+        order = []
+
+        async def informer_request() -> None:
+            await limiter.acquire("background")
+            order.append("informers")
+
+        with OtherLoop() as other:
+            # The other loop's requests use up the burst of the shared bucket.
+            await other.run(limiter.acquire("background"))
+            await other.run(limiter.acquire("background"))
+            waiting = other.run(informer_request())
+            await wait_for_waiters(limiter, "background", 1)
+            await limiter.acquire("interactive")
+            order.append("ui")
+            await waiting
+
+        assert order == ["ui", "informers"]
+        assert limiter.metrics["background"].requests == 3
+        assert limiter.metrics["background"].throttled == 1
+        assert limiter.metrics["interactive"].throttled == 1
+
+    asyncio.run(main())
+
+
+def test_cancelling_a_request_of_another_loop_leaves_the_queue():
+    async def main() -> None:
+        limiter = RateLimiter(qps=1, burst=1)
+        with OtherLoop() as other:
+            await other.run(limiter.acquire("visible"))
+            waiting = other.run(limiter.acquire("visible"))
+            await wait_for_waiters(limiter, "visible", 1)
+            waiting.cancel()
+            await wait_for_waiters(limiter, "visible", 0)
+
+        assert not any(limiter._waiters.values())
+
+    asyncio.run(main())
+
+
+def test_another_loop_is_let_through_while_this_one_is_busy():
+    async def main() -> None:
+        limiter = RateLimiter(qps=50, burst=1)
+        with OtherLoop() as other:
+            await other.run(limiter.acquire("background"))
+            waiting = asyncio.run_coroutine_threadsafe(
+                limiter.acquire("background"), other.loop
+            )
+            # Block this loop: the other loop's own timer must grant the token.
+            waiting.result(timeout=5)
+
+        assert limiter.metrics["background"].throttled == 1
+
+    asyncio.run(main())
+
+
+def test_disabled_limiter_lets_every_request_through():
+    async def main() -> None:
+        limiter = RateLimiter(qps=0, burst=1)
+        for _ in range(10):
+            await limiter.acquire("visible")
+        assert limiter.metrics["visible"].requests == 10
+        assert limiter.metrics["visible"].throttled == 0
+
+    asyncio.run(main())
+
+
+def test_waiting_requests_are_let_through_by_priority():
+    async def main() -> None:
+        limiter = RateLimiter(qps=50, burst=1)
+        order: list[RequestPriority] = []
+
+        async def request(priority: RequestPriority) -> None:
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        await limiter.acquire("interactive")
+        waiting = []
+        for priority in ("background", "visible", "interactive"):
+            waiting.append(asyncio.create_task(request(priority)))
+            await wait_for_waiters(limiter, priority, 1)
+        await asyncio.gather(*waiting)
+
+        assert order == ["interactive", "visible", "background"]
+
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+import asyncio
+
+from KubeZen.core.reconnect_governor import Backoff, ReconnectGovernor
+from KubeZen.models.core import ConfigMapRow, PodRow
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_reconnects_beyond_the_limit_wait_for_a_slot():
+    async def main() -> None:
+        governor = ReconnectGovernor(max_concurrent=2)
+        release = asyncio.Event()
+        active = 0
+        most_active = 0
+
+        async def reconnect() -> None:
+            nonlocal active, most_active
+            async with governor.slot(PodRow):
+                active += 1
+                most_active = max(most_active, active)
+                await release.wait()
+                active -= 1
+
+        tasks = [asyncio.create_task(reconnect()) for _ in range(5)]
+        await settle()
+        assert active == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert most_active == 2
+
+    asyncio.run(main())
+
+
+def test_visible_kinds_reconnect_first():
+    async def main() -> None:
+        governor = ReconnectGovernor(max_concurrent=1)
+        governor.set_visible([PodRow])
+        order: list[str] = []
+
+        async def reconnect(model_class: type) -> None:
+            async with governor.slot(model_class):
+                order.append(model_class.plural)
+
+        async with governor.slot(ConfigMapRow):
+            tasks = [
+                asyncio.create_task(reconnect(ConfigMapRow)),
+                asyncio.create_task(reconnect(PodRow)),
+            ]
+            await settle()
+        await asyncio.gather(*tasks)
+
+        assert order == [PodRow.plural, ConfigMapRow.plural]
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def main() -> None:
+        governor = ReconnectGovernor(max_concurrent=1)
+        entered: list[str] = []
+
+        async def reconnect(name: str) -> None:
+            async with governor.slot(PodRow):
+                entered.append(name)
+
+        async with governor.slot(PodRow):
+            cancelled = asyncio.create_task(reconnect("cancelled"))
+            waiting = asyncio.create_task(reconnect("waiting"))
+            await settle()
+            cancelled.cancel()
+            await settle()
+        await waiting
+
+        assert entered == ["waiting"]
+        assert cancelled.cancelled()
+        assert governor._active == 0
+        assert governor._waiters == []
+
+    asyncio.run(main())
+
+
+def test_backoff_delays_grow_up_to_the_cap():
+    backoff = Backoff(base=1.0, cap=4.0)
+    for ceiling in (1.0, 2.0, 4.0, 4.0):
+        assert 0 <= backoff.next_delay() <= ceiling
+    backoff.reset()
+    assert backoff.attempts == 0
@@ -0,0 +1,91 @@
+import asyncio
+
+from aiohttp import web
+from kubernetes_asyncio.client import V1Pod
+
+from KubeZen.core.snapshot_cache import SnapshotCache
+from KubeZen.models.raw import RawObject
+from KubeZen.models.core import PodRow, SecretRow
+
+from .fake_apiserver import FakeAPIServer, metadata, object_list, pod, status
+
+PODS_PATH = "/api/v1/namespaces/default/pods"
+
+
+def snapshot_cache(tmp_path) -> SnapshotCache:
+    # Only generated models need the API client to be serialized.
+    return SnapshotCache(tmp_path, None)  # type: ignore[arg-type]
+
+
+def test_warm_start_paints_the_snapshot_without_listing(tmp_path):
+    listed = 0
+
+    async def pods(request: web.Request) -> web.Response:
+        nonlocal listed
+        listed += 1
+        if listed > 1:
+            return status(500, "InternalError", "the snapshot should be used")
+        return web.json_response(
+            object_list("Pod", [pod("web-1"), pod("web-2")], rv="42")
+        )
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            cold = server.watch_manager(
+                PodRow, tmp_path, snapshot_cache=True, watch_list=False
+            )
+            resource_version, _ = await cold._load_scope("default")
+            cold._resource_versions["default"] = resource_version
+            await cold._save_snapshot("default")
+
+            warm = server.watch_manager(
+                PodRow, tmp_path, snapshot_cache=True, watch_list=False
+            )
+            assert await warm._load_scope("default") == ("42", None)
+            assert sorted(row.name for row in warm.store.values()) == [
+                "web-1",
+                "web-2",
+            ]
+            assert listed == 1
+
+    asyncio.run(main())
+
+
+def test_snapshots_drop_metadata_that_can_hold_secrets(tmp_path):
+    item = pod("web-1")
+    item["metadata"]["managedFields"] = [{"manager": "kubectl"}]
+    item["metadata"]["annotations"] = {
+        "kubectl.kubernetes.io/last-applied-configuration": "{...}",
+        "team": "web",
+    }
+    cache = snapshot_cache(tmp_path)
+    cache.save("ctx", PodRow, "default", "7", [RawObject(item, V1Pod)])
+
+    snapshot = cache.load("ctx", PodRow, "default")
+    assert snapshot is not None
+    assert snapshot.resource_version == "7"
+    (saved,) = snapshot.items
+    assert "managedFields" not in saved["metadata"]
+    assert saved["metadata"]["annotations"] == {"team": "web"}
+    assert saved["spec"] == item["spec"]
+
+
+def test_sensitive_kinds_are_never_written(tmp_path):
+    secret = {"metadata": metadata("token", "default"), "data": {"key": "c2VjcmV0"}}
+    cache = snapshot_cache(tmp_path)
+    cache.save("ctx", SecretRow, "default", "7", [secret])
+
+    assert cache.load("ctx", SecretRow, "default") is None
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+def test_unreadable_snapshot_is_discarded(tmp_path):
+    cache = snapshot_cache(tmp_path)
+    cache.save("ctx", PodRow, "default", "7", [RawObject(pod("web-1"), V1Pod)])
+    (path,) = (tmp_path / "snapshots").rglob("*.snap")
+    path.write_bytes(b"KZS1 not zlib")
+
+    assert cache.load("ctx", PodRow, "default") is None
+    assert not path.exists()
@@ -0,0 +1,37 @@
+import asyncio
+
+from aiohttp import web
+
+from KubeZen.core.json_api import WatchStream
+from KubeZen.models.core import PodRow
+
+from .fake_apiserver import FakeAPIServer, is_watch, object_list, pod, watch_events
+
+
+def test_watches_and_requests_use_separate_instrumented_pools(tmp_path):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        if is_watch(request):
+            return await watch_events(request, [{"type": "ADDED", "object": pod("a")}])
+        return web.json_response(object_list("Pod", [pod("web-1")]))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route("/api/v1/namespaces/default/pods", pods)
+        async with server:
+            assert server.client is not None
+            manager = server.watch_manager(PodRow, tmp_path, watch_list=False)
+            await manager.get_initial_list("default")
+            await manager.get_initial_list("default")
+            list_call, list_kwargs = manager._get_api_call_info("default", watch=True)
+            async with WatchStream(list_call, **list_kwargs) as stream:
+                assert [event["type"] async for event in stream] == ["ADDED"]
+
+            metrics = server.client.transport_metrics()
+            assert metrics["requests"]["requests"] == 2
+            # The second LIST reused the kept-alive connection.
+            assert metrics["requests"]["created"] == 1
+            assert metrics["requests"]["reused"] == 1
+            assert metrics["streams"]["requests"] == 1
+            assert metrics["streams"]["created"] == 1
+
+    asyncio.run(main())
@@ -0,0 +1,355 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from kubernetes_asyncio.client.exceptions import ApiException
+
+from KubeZen.core.json_api import INITIAL_EVENTS_END_ANNOTATION
+from KubeZen.core.watch_manager import ListProgress, WatchEventBatch
+from KubeZen.models.core import ConfigMapRow, PodRow
+
+from .fake_apiserver import (
+    FakeAPIServer,
+    is_watch,
+    metadata,
+    object_list,
+    pod,
+    status,
+    watch_events,
+)
+
+PODS_PATH = "/api/v1/namespaces/default/pods"
+CONFIGMAPS_PATH = "/api/v1/namespaces/default/configmaps"
+PODS = [pod("web-1", rv="11"), pod("web-2", rv="12"), pod("web-3", rv="13")]
+
+
+def bookmark(resource_version: str, *, initial_events_end: bool) -> dict:
+    annotations = {INITIAL_EVENTS_END_ANNOTATION: "true"} if initial_events_end else {}
+    return {
+        "type": "BOOKMARK",
+        "object": {
+            "kind": "Pod",
+            "apiVersion": "v1",
+            "metadata": {
+                "resourceVersion": resource_version,
+                "annotations": annotations,
+            },
+        },
+    }
+
+
+def test_streaming_list_loads_until_the_initial_events_end(tmp_path):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        assert is_watch(request)
+        return await watch_events(
+            request,
+            [
+                {"type": "ADDED", "object": PODS[0]},
+                {"type": "ADDED", "object": PODS[1]},
+                # Progress bookmarks don't end the initial events.
+                bookmark("12", initial_events_end=False),
+                {"type": "ADDED", "object": PODS[2]},
+                bookmark("20", initial_events_end=True),
+            ],
+        )
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path, list_page_size=2)
+            resource_version, stream = await manager._load_scope("default")
+            assert stream is not None
+            await stream.close()
+
+            assert resource_version == "20"
+            assert sorted(row.name for row in manager.store.values()) == [
+                "web-1",
+                "web-2",
+                "web-3",
+            ]
+            assert server.client.watch_list_supported is True
+            [query] = server.requests
+            assert query["sendInitialEvents"].lower() == "true"
+            assert query["resourceVersionMatch"] == "NotOlderThan"
+            assert query["allowWatchBookmarks"].lower() == "true"
+
+    asyncio.run(main())
+
+
+def test_streaming_list_closed_before_the_initial_events_end_fails(tmp_path):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        return await watch_events(request, [{"type": "ADDED", "object": PODS[0]}])
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path)
+            with pytest.raises(ApiException):
+                await manager._load_scope("default")
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("code", [400, 422])
+def test_rejected_streaming_list_falls_back_to_paged_list(tmp_path, code):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        if is_watch(request):
+            return status(code, "Invalid", "sendInitialEvents is forbidden")
+        if "limit" not in request.query:
+            return web.json_response(object_list("Pod", PODS))
+        if "continue" not in request.query:
+            return web.json_response(
+                object_list(
+                    "Pod", PODS[:2], **{"continue": "page-2", "remainingItemCount": 1}
+                )
+            )
+        assert request.query["continue"] == "page-2"
+        return web.json_response(object_list("Pod", PODS[2:]))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path, list_page_size=2)
+            resource_version, stream = await manager._load_scope("default")
+
+            assert stream is None
+            assert resource_version == "10"
+            assert len(manager.store) == 3
+            assert server.client.watch_list_supported is False
+            watch, first_page, second_page = server.requests
+            assert first_page["limit"] == second_page["limit"] == "2"
+            assert second_page["continue"] == "page-2"
+
+            # Later scopes go straight to LIST.
+            await manager._load_scope("default")
+            assert [query.get("watch") for query in server.requests[3:]] == [None]
+
+    asyncio.run(main())
+
+
+def configmap(name: str, rv: str) -> dict:
+    return {
+        "apiVersion": "meta.k8s.io/v1",
+        "kind": "PartialObjectMetadata",
+        "metadata": metadata(name, "default", rv),
+    }
+
+
+def test_metadata_only_watches_ask_for_single_partial_objects(tmp_path):
+    watched = asyncio.Event()
+
+    async def configmaps(request: web.Request) -> web.StreamResponse:
+        if not is_watch(request):
+            return web.json_response(
+                object_list("PartialObjectMetadata", [configmap("settings", "11")])
+            )
+        if request.query.get("sendInitialEvents"):
+            return status(422, "Invalid", "sendInitialEvents is forbidden")
+        watched.set()
+        return await watch_events(
+            request, [{"type": "ADDED", "object": configmap("extra", "12")}]
+        )
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(CONFIGMAPS_PATH, configmaps)
+        async with server:
+            manager = server.watch_manager(ConfigMapRow, tmp_path)
+            resource_version, stream = await manager._load_scope("default")
+            assert stream is None
+            await manager.create_watch_task("default", resource_version)
+            await asyncio.wait_for(watched.wait(), 5)
+            await manager.stop_namespace_watch("default")
+
+            watch_list, list_, watch = server.accepts[:3]
+            # The API server transforms each watch event's object on its own,
+            # which can't be turned into a list.
+            assert "as=PartialObjectMetadata;" in watch_list
+            assert "as=PartialObjectMetadataList;" in list_
+            assert "as=PartialObjectMetadata;" in watch
+
+    asyncio.run(main())
+
+
+def test_rows_of_a_list_failing_partway_are_deleted(tmp_path):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        if "continue" not in request.query:
+            return web.json_response(
+                object_list("Pod", PODS[:2], **{"continue": "page-2"})
+            )
+        return status(500, "InternalError", "etcd is unavailable")
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(
+                PodRow, tmp_path, watch_list=False, list_page_size=2
+            )
+            batches: list = []
+
+            def record(signal, payload) -> None:
+                batches.append(payload)
+
+            manager._publish = record  # type: ignore[method-assign]
+            with pytest.raises(ApiException):
+                await manager.set_scopes({"default"})
+
+            assert manager.store == {}
+            deleted = [
+                row.name
+                for batch in batches
+                if isinstance(batch, WatchEventBatch)
+                for event_type, row in batch
+                if event_type == "DELETED"
+            ]
+            assert sorted(deleted) == ["web-1", "web-2"]
+
+    asyncio.run(main())
+
+
+def test_list_restarts_once_when_its_continue_token_expires(tmp_path):
+    lists: list[str | None] = []
+
+    async def pods(request: web.Request) -> web.StreamResponse:
+        lists.append(request.query.get("continue"))
+        if len(lists) == 1:
+            return web.json_response(
+                object_list("Pod", PODS[:2], **{"continue": "page-2"})
+            )
+        if len(lists) == 2:
+            return status(410, "Expired", "The provided continue parameter is too old")
+        # web-1 was deleted while the first listing was paused.
+        return web.json_response(object_list("Pod", PODS[1:], rv="20"))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(
+                PodRow, tmp_path, watch_list=False, list_page_size=2
+            )
+            resource_version, _ = await manager._load_scope("default")
+
+            assert lists == [None, "page-2", None]
+            assert resource_version == "20"
+            assert sorted(row.name for row in manager.store.values()) == [
+                "web-2",
+                "web-3",
+            ]
+
+    asyncio.run(main())
+
+
+def test_list_fails_when_its_restarted_continue_token_expires(tmp_path):
+    async def pods(request: web.Request) -> web.StreamResponse:
+        if "continue" not in request.query:
+            return web.json_response(
+                object_list("Pod", PODS[:2], **{"continue": "page-2"})
+            )
+        return status(410, "Expired", "The provided continue parameter is too old")
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(
+                PodRow, tmp_path, watch_list=False, list_page_size=2
+            )
+            with pytest.raises(ApiException) as raised:
+                await manager.get_initial_list("default")
+            assert raised.value.status == 410
+
+    asyncio.run(main())
+
+
+def test_pages_are_published_as_they_arrive(tmp_path):
+    painted: list[list[str]] = []
+
+    async def pods(request: web.Request) -> web.StreamResponse:
+        assert request.query["limit"] == "1"
+        token = request.query.get("continue")
+        index = int(token) if token else 0
+        # Every earlier page was in the store before this one was asked for.
+        assert [name for names in painted for name in names] == [
+            item["metadata"]["name"] for item in PODS[:index]
+        ]
+        remaining = len(PODS) - index - 1
+        meta = (
+            {"continue": str(index + 1), "remainingItemCount": remaining}
+            if remaining
+            else {}
+        )
+        return web.json_response(object_list("Pod", [PODS[index]], **meta))
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        server.route(PODS_PATH, pods)
+        async with server:
+            manager = server.watch_manager(
+                PodRow, tmp_path, watch_list=False, list_page_size=1
+            )
+            progress: list[ListProgress] = []
+
+            def record(signal, payload) -> None:
+                if isinstance(payload, WatchEventBatch):
+                    painted.append([row.name for _, row in payload])
+                else:
+                    progress.append(payload)
+
+            manager._publish = record  # type: ignore[method-assign]
+            await manager._load_scope("default")
+
+            assert painted == [["web-1"], ["web-2"], ["web-3"]]
+            assert [(p.loaded, p.expected, p.done) for p in progress] == [
+                (1, 3, False),
+                (2, 3, False),
+                (3, None, False),
+                (3, 3, True),
+            ]
+
+    asyncio.run(main())
+
+
+def test_newly_selected_namespaces_are_listed_concurrently(tmp_path):
+    listing: set[str] = set()
+    both_listing = asyncio.Event()
+    stopped = asyncio.Event()
+
+    def pods_in(namespace: str):
+        async def pods(request: web.Request) -> web.StreamResponse:
+            if is_watch(request):
+                response = web.StreamResponse()
+                await response.prepare(request)
+                await stopped.wait()
+                return response
+            listing.add(namespace)
+            if len(listing) == 2:
+                both_listing.set()
+            # Neither LIST completes until the other one was sent.
+            await asyncio.wait_for(both_listing.wait(), 5)
+            return web.json_response(object_list("Pod", [pod("web", namespace)]))
+
+        return pods
+
+    async def main() -> None:
+        server = FakeAPIServer()
+        for namespace in ("team-a", "team-b"):
+            server.route(f"/api/v1/namespaces/{namespace}/pods", pods_in(namespace))
+        async with server:
+            manager = server.watch_manager(PodRow, tmp_path, watch_list=False)
+            try:
+                await manager.set_scopes({"team-a", "team-b"})
+                assert manager.watching == {"team-a", "team-b"}
+                assert sorted(row.namespace for row in manager.store.values()) == [
+                    "team-a",
+                    "team-b",
+                ]
+            finally:
+                stopped.set()
+                await manager.stop()
+
+    asyncio.run(main())
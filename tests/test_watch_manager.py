@@ -0,0 +1,190 @@
+import asyncio
+
+from KubeZen.core.watch_manager import WatchEventBatch
+from KubeZen.models.core import ConfigMapRow, PodRow
+
+from .fake_apiserver import FakeAPIServer, metadata, pod
+
+
+def config_map(rv: str, name: str = "settings") -> ConfigMapRow:
+    return ConfigMapRow(raw={"metadata": metadata(name, "default", rv)})
+
+
+def merged(*events: tuple[str, ConfigMapRow]) -> WatchEventBatch:
+    batch = WatchEventBatch()
+    for event_type, row in events:
+        batch.add(event_type, row)
+    return batch
+
+
+def test_added_then_modified_stays_added():
+    latest = config_map("2")
+    batch = merged(("ADDED", config_map("1")), ("MODIFIED", latest))
+    assert list(batch) == [("ADDED", latest)]
+
+
+def test_added_then_deleted_drops_the_row():
+    batch = merged(("ADDED", config_map("1")), ("DELETED", config_map("2")))
+    assert list(batch) == []
+    assert len(batch) == 0
+
+
+def test_deleted_then_added_becomes_modified():
+    recreated = config_map("2")
+    batch = WatchEventBatch()
+    batch.add("DELETED", config_map("1"), frozenset({"age"}))
+    batch.add("ADDED", recreated)
+    assert list(batch) == [("MODIFIED", recreated)]
+    # The recreated object may differ in any column.
+    assert batch.columns_changed(recreated.uid) is None
+
+
+def test_modified_events_merge_their_changed_columns():
+    latest = config_map("3")
+    batch = WatchEventBatch()
+    batch.add("MODIFIED", config_map("2"), frozenset({"age"}))
+    batch.add("MODIFIED", latest, frozenset({"name"}))
+    assert list(batch) == [("MODIFIED", latest)]
+    assert batch.columns_changed(latest.uid) == {"age", "name"}
+
+
+def test_modified_with_unknown_columns_redraws_every_column():
+    batch = WatchEventBatch()
+    batch.add("MODIFIED", config_map("2"), frozenset({"age"}))
+    batch.add("MODIFIED", config_map("3"))
+    assert batch.columns_changed(config_map("3").uid) is None
+
+
+def test_modified_then_deleted_is_deleted():
+    gone = config_map("3")
+    batch = merged(("MODIFIED", config_map("2")), ("DELETED", gone))
+    assert list(batch) == [("DELETED", gone)]
+
+
+def test_events_of_different_rows_are_kept_apart():
+    first, second = config_map("1", "a"), config_map("1", "b")
+    batch = merged(("ADDED", first), ("DELETED", second))
+    assert list(batch) == [("ADDED", first), ("DELETED", second)]
+
+
+def recreated_config_map(uid: str, rv: str, name: str = "preview") -> ConfigMapRow:
+    return ConfigMapRow(raw={"metadata": {**metadata(name, "default", rv), "uid": uid}})
+
+
+def test_deleted_then_recreated_name_is_added():
+    batch = merged(
+        ("DELETED", recreated_config_map("old", "1")),
+        ("ADDED", recreated_config_map("new", "2")),
+    )
+    assert batch.names_changed() == ({"preview"}, set())
+
+
+def test_recreated_then_deleted_name_is_deleted():
+    batch = merged(
+        ("DELETED", recreated_config_map("old", "1")),
+        ("ADDED", recreated_config_map("new", "2")),
+        ("MODIFIED", recreated_config_map("new", "3")),
+        ("DELETED", recreated_config_map("new", "4")),
+    )
+    assert batch.names_changed() == (set(), {"preview"})
+
+
+def test_cluster_wide_watch_is_chosen_when_it_costs_less(tmp_path):
+    async def main() -> None:
+        async with FakeAPIServer() as server:
+            manager = server.watch_manager(
+                PodRow,
+                tmp_path,
+                cluster_wide_namespace_threshold=10,
+                watch_connection_cost=200,
+            )
+            manager._held_namespaces = {"a", "b"}
+            # 5 objects cluster-wide, all in "a": "b" is empty, not unknown.
+            manager._record_counts(
+                "all", manager._build_rows([pod(f"p{i}", "a") for i in range(5)])
+            )
+            assert manager._effective_scopes({"a", "b"}) == {"all"}
+
+            # Many objects elsewhere make the cluster-wide watch the costly one.
+            manager._record_counts(
+                "all", manager._build_rows([pod(f"p{i}", "c") for i in range(500)])
+            )
+            assert manager._effective_scopes({"a", "b"}) == {"a", "b"}
+
+            # Never-listed namespaces can't be estimated.
+            assert manager._effective_scopes({"a", "d"}) == {"a", "d"}
+
+    asyncio.run(main())
+
+
+def test_cluster_wide_watch_is_chosen_above_the_namespace_threshold(tmp_path):
+    async def main() -> None:
+        async with FakeAPIServer() as server:
+            manager = server.watch_manager(
+                PodRow, tmp_path, cluster_wide_namespace_threshold=3
+            )
+            assert manager._effective_scopes({"a", "b"}) == {"a", "b"}
+            assert manager._effective_scopes({"a", "b", "c"}) == {"all"}
+
+    asyncio.run(main())
+
+
+def test_events_changing_no_displayed_column_are_suppressed(tmp_path):
+    async def main() -> None:
+        async with FakeAPIServer() as server:
+            manager = server.watch_manager(PodRow, tmp_path)
+            (row,) = manager._build_rows([pod("web", rv="1")])
+            assert manager._apply_to_store("ADDED", row) == ("ADDED", None)
+
+            (resynced,) = manager._build_rows([pod("web", rv="2")])
+            assert manager._apply_to_store("MODIFIED", resynced) is None
+            assert manager.suppressed_events == 1
+
+            restarted = pod("web", rv="3")
+            restarted["status"]["containerStatuses"][0]["restartCount"] = 3
+            (restarted_row,) = manager._build_rows([restarted])
+            assert manager._apply_to_store("MODIFIED", restarted_row) == (
+                "MODIFIED",
+                frozenset({"restarts"}),
+            )
+            assert manager.store[row.uid].restarts == 3
+
+    asyncio.run(main())
+
+
+def test_relist_publishes_only_the_differences(tmp_path):
+    async def main() -> None:
+        async with FakeAPIServer() as server:
+            manager = server.watch_manager(PodRow, tmp_path)
+            manager._reconcile_scope(
+                "default",
+                manager._build_rows(
+                    [pod("kept", rv="1"), pod("changed", rv="1"), pod("gone", rv="1")]
+                ),
+            )
+            batches: list[WatchEventBatch] = []
+
+            def record(signal, payload) -> None:
+                batches.append(payload)
+
+            manager._publish = record  # type: ignore[method-assign]
+            changed = pod("changed", rv="5")
+            changed["spec"]["nodeName"] = "node-2"
+            manager._reconcile_scope(
+                "default",
+                manager._build_rows([pod("kept", rv="1"), changed, pod("new", rv="6")]),
+            )
+
+            (batch,) = batches
+            assert sorted((event, row.name) for event, row in batch) == [
+                ("ADDED", "new"),
+                ("DELETED", "gone"),
+                ("MODIFIED", "changed"),
+            ]
+            assert sorted(row.name for row in manager.store.values()) == [
+                "changed",
+                "kept",
+                "new",
+            ]
+
+    asyncio.run(main())